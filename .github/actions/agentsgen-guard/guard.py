@@ -4,14 +4,19 @@ import json
 import os
 import re
 import shlex
-import subprocess
 import sys
 from pathlib import Path
 from typing import Any
 from urllib.error import HTTPError, URLError
 from urllib.request import Request, urlopen
 
-from agentsgen.actions import check_repo
+from agentsgen.actions import check_repo, pack_check_config, run_pack_check
+from agentsgen.pack_scope import (
+    ChangedPath,
+    affected_pack_outputs,
+    git_changed_paths,
+    parse_changed_paths,
+)
 
 
 COMMENT_MARKER = "<!-- agentsgen-guard -->"
@@ -48,11 +53,7 @@ def _split_files(raw: str) -> list[str]:
     return out
 
 
-def _pack_drift_info_from_json(output: str, limit: int = 5) -> tuple[int, list[str]]:
-    try:
-        payload = json.loads(output)
-    except Exception:
-        return 0, []
+def _pack_drift_info(payload: object, limit: int = 5) -> tuple[int, list[str]]:
     if not isinstance(payload, dict):
         return 0, []
     rows = payload.get("results", [])
@@ -185,46 +186,71 @@ def _build_fix_lines(
     return lines
 
 
+def _changed_paths(target: Path, event: dict[str, Any]) -> list[ChangedPath] | None:
+    """Files the PR changes, or None when unknown (then everything is checked)."""
+    explicit = os.getenv("INPUT_CHANGED_FILES", "")
+    if explicit.strip():
+        return parse_changed_paths(re.split(r"[\n,]+", explicit))
+    pr = event.get("pull_request")
+    if not isinstance(pr, dict):
+        return None
+    base = (pr.get("base") or {}).get("sha")
+    head = (pr.get("head") or {}).get("sha")
+    if not (isinstance(base, str) and base and isinstance(head, str) and head):
+        return None
+    return git_changed_paths(target, base, head)
+
+
 def _run_pack_check(
-    path: str,
+    target: Path,
     pack_format: str,
     *,
     pack_autodetect: bool,
     pack_llms_format: str,
     pack_output_dir: str,
     pack_files: list[str],
-) -> tuple[int, str, list[str], int]:
+    changed: list[ChangedPath] | None,
+    pack_inputs: list[str],
+) -> tuple[int, str, list[str], int, str]:
+    """Run the pack check in-process, limited to outputs the PR can affect.
+
+    Returns exit code, printable output, top drifted paths, drift count and a
+    short description of the scope that was checked.
+    """
     fmt = (pack_format or "json").strip().lower()
     if fmt not in {"json", "text"}:
         fmt = "json"
-    cmd = ["agentsgen", "pack", path, "--check", "--format", fmt]
-    if pack_autodetect:
-        cmd.append("--autodetect")
-    else:
-        cmd.append("--no-autodetect")
-    llms_fmt = (pack_llms_format or "").strip()
-    if llms_fmt:
-        cmd.extend(["--llms-format", llms_fmt])
-    out_dir = (pack_output_dir or "").strip()
-    if out_dir:
-        cmd.extend(["--output-dir", out_dir])
-    if pack_files:
-        cmd.extend(["--files", ",".join(pack_files)])
     try:
-        p = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
+        cfg = pack_check_config(
+            target,
+            autodetect=pack_autodetect,
+            llms_format=pack_llms_format,
+            output_dir=pack_output_dir,
+            files=pack_files or None,
         )
-    except FileNotFoundError:
-        return 2, "agentsgen command not found while running pack check", [], 0
-    out = (p.stdout or "") + (("\n" + p.stderr) if p.stderr else "")
-    drift_count, top_paths = (
-        _pack_drift_info_from_json(p.stdout or "", limit=5)
-        if fmt == "json"
-        else (0, [])
-    )
-    return p.returncode, out.strip(), top_paths, drift_count
+    except Exception as exc:
+        return 2, f"pack:error ({exc})", [], 0, "error"
+    only: list[str] | None = None
+    scope = "all files"
+    if changed is not None:
+        only = affected_pack_outputs(cfg, changed, extra_inputs=pack_inputs)
+        if not only:
+            return 0, "", [], 0, "skipped (no pack inputs changed)"
+        scope = f"{len(only)} file(s) affected by changes"
+    report = run_pack_check(target, cfg=cfg, autodetect=pack_autodetect, only=only)
+    raw = report.get("raw", {})
+    drift_count, top_paths = _pack_drift_info(raw, limit=5)
+    if fmt == "json":
+        out = json.dumps(raw, indent=2)
+    else:
+        lines = [
+            f"{row['action']}: {row['path']} - {row['message']}"
+            for row in raw.get("results", [])
+            if isinstance(row, dict)
+        ]
+        out = "\n".join([*lines, str(raw.get("summary", ""))])
+    code = 0 if report.get("status") == "ok" else 1
+    return code, out.strip(), top_paths, drift_count, scope
 
 
 def main() -> int:
@@ -243,6 +269,14 @@ def main() -> int:
     pack_llms_format = os.getenv("INPUT_PACK_LLMS_FORMAT", "")
     pack_output_dir = os.getenv("INPUT_PACK_OUTPUT_DIR", "")
     pack_files = _split_files(os.getenv("INPUT_PACK_FILES", ""))
+    pack_inputs = _split_files(os.getenv("INPUT_PACK_INPUTS", ""))
+    scope_changed = (os.getenv("INPUT_SCOPE", "changed") or "changed").strip().lower()
+
+    event_name = os.getenv("GITHUB_EVENT_NAME", "")
+    event_path = os.getenv("GITHUB_EVENT_PATH", "")
+    repo = os.getenv("GITHUB_REPOSITORY", "")
+    event = _load_event(event_path)
+    is_pr = event_name == "pull_request" and isinstance(event.get("pull_request"), dict)
 
     target = Path(path)
     code, problems, warnings = check_repo(target)
@@ -251,15 +285,21 @@ def main() -> int:
     pack_output = ""
     pack_top_paths: list[str] = []
     pack_drift_count = 0
+    pack_scope = ""
 
     if pack_enabled:
-        pack_code, pack_output, pack_top_paths, pack_drift_count = _run_pack_check(
-            path,
-            pack_format,
-            pack_autodetect=pack_autodetect,
-            pack_llms_format=pack_llms_format,
-            pack_output_dir=pack_output_dir,
-            pack_files=pack_files,
+        changed = _changed_paths(target, event) if scope_changed != "full" else None
+        pack_code, pack_output, pack_top_paths, pack_drift_count, pack_scope = (
+            _run_pack_check(
+                target,
+                pack_format,
+                pack_autodetect=pack_autodetect,
+                pack_llms_format=pack_llms_format,
+                pack_output_dir=pack_output_dir,
+                pack_files=pack_files,
+                changed=changed,
+                pack_inputs=pack_inputs,
+            )
         )
         if pack_code != 0:
             pack_failed = True
@@ -274,6 +314,7 @@ def main() -> int:
             f"[agentsgen-guard] pack_check={pack_status} drift_count={pack_drift_count}",
             file=sys.stderr,
         )
+        print(f"[agentsgen-guard] pack scope: {pack_scope}", file=sys.stderr)
         if pack_top_paths:
             print(
                 f"[agentsgen-guard] pack top files: {', '.join(pack_top_paths)}",
@@ -313,12 +354,6 @@ def main() -> int:
     for ln in fix_lines:
         print(ln, file=sys.stderr)
 
-    event_name = os.getenv("GITHUB_EVENT_NAME", "")
-    event_path = os.getenv("GITHUB_EVENT_PATH", "")
-    repo = os.getenv("GITHUB_REPOSITORY", "")
-    event = _load_event(event_path)
-    is_pr = event_name == "pull_request" and isinstance(event.get("pull_request"), dict)
-
     if comment and is_pr and token and repo:
         try:
             pr = event["pull_request"]
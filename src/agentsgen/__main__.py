@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from .cli import main
+from .launcher import main
 
 
 if __name__ == "__main__":
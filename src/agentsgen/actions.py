@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from collections.abc import Collection
 from pathlib import Path
 
 from .config import ToolConfig
@@ -15,6 +16,8 @@ generate_readme_snippets = _pack_engine.generate_readme_snippets
 check_repo = _pack_engine.check_repo
 run_core_check = _pack_engine.run_core_check
 run_pack_check = _pack_engine.run_pack_check
+pack_check_config = _pack_engine.pack_check_config
+pack_output_paths = _pack_engine.pack_output_paths
 run_snippets_check = _pack_engine.run_snippets_check
 aggregate_check = _pack_engine.aggregate_check
 status_repo = _pack_engine.status_repo
@@ -49,6 +52,7 @@ def apply_pack(
     site_url: str | None = None,
     dry_run: bool,
     print_diff: bool,
+    only: Collection[str] | None = None,
 ):
     return _pack_engine.apply_pack(
         target,
@@ -58,4 +62,5 @@ def apply_pack(
         site_manifest_builder=build_site_llms_manifest,
         dry_run=dry_run,
         print_diff=print_diff,
+        only=only,
     )
@@ -3,6 +3,9 @@ from __future__ import annotations
 import json
 import os
 import re
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -11,29 +14,13 @@ from urllib.parse import urljoin, urlparse
 from urllib.request import Request, urlopen
 
 from .generated_artifacts import handle_generated_json_artifact
+from .html_evidence import HtmlEvidence, extract_html_evidence
+from .http_fetch import default_fetcher
+from .llm_cache import cache_key, default_llm_cache, llm_cache_enabled
 from .result_types import FileResult
 from .validators import validate_analysis_payload
 
 
-_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
-_META_DESCRIPTION_RE = re.compile(
-    r'<meta[^>]+name=["\']description["\'][^>]+content=["\'](.*?)["\']',
-    re.IGNORECASE | re.DOTALL,
-)
-_SCRIPT_STYLE_RE = re.compile(
-    r"<(?:script|style)[^>]*>[\s\S]*?</(?:script|style)>",
-    re.IGNORECASE,
-)
-_TAG_RE = re.compile(r"<[^>]+>")
-_WHITESPACE_RE = re.compile(r"\s+")
-_HEADING_RE = re.compile(r"<h([1-6])[^>]*>", re.IGNORECASE)
-_SEMANTIC_TAGS = ("main", "article", "section", "nav", "header", "footer")
-_JSON_LD_RE = re.compile(
-    r'<script[^>]+type=["\']application/ld\+json["\'][^>]*>',
-    re.IGNORECASE,
-)
-
-
 @dataclass(frozen=True)
 class UrlFetch:
     url: str
@@ -64,78 +51,33 @@ def _normalize_url(url: str) -> str:
     return raw
 
 
-def _fetch_url(url: str, *, timeout: float = 10.0) -> UrlFetch:
-    request = Request(
-        url,
-        headers={
-            "User-Agent": "agentsgen/0.1 (+https://github.com/markoblogo/AGENTS.md_generator)"
-        },
+def _fetch_url(url: str) -> UrlFetch:
+    response = default_fetcher().fetch(url)
+    return UrlFetch(
+        url=response.url,
+        status=response.status,
+        text=response.text(),
+        headers=response.headers,
     )
-    with urlopen(request, timeout=timeout) as response:
-        body = response.read()
-        charset = response.headers.get_content_charset() or "utf-8"
-        text = body.decode(charset, errors="replace")
-        headers = {str(k).lower(): str(v) for k, v in response.headers.items()}
-        return UrlFetch(
-            url=response.geturl(),
-            status=getattr(response, "status", 200) or 200,
-            text=text,
-            headers=headers,
-        )
 
 
-def _probe_url(url: str, *, timeout: float = 10.0) -> bool:
+def _probe_url(url: str) -> bool:
     try:
-        _fetch_url(url, timeout=timeout)
+        _fetch_url(url)
         return True
     except Exception:
         return False
 
 
-def _extract_title(html: str) -> str:
-    match = _TITLE_RE.search(html)
-    if not match:
-        return ""
-    return _WHITESPACE_RE.sub(" ", match.group(1)).strip()
-
-
-def _extract_meta_description(html: str) -> str:
-    match = _META_DESCRIPTION_RE.search(html)
-    if not match:
-        return ""
-    return _WHITESPACE_RE.sub(" ", match.group(1)).strip()
-
-
-def _extract_text_content(html: str) -> str:
-    text = _SCRIPT_STYLE_RE.sub(" ", html)
-    text = _TAG_RE.sub(" ", text)
-    return _WHITESPACE_RE.sub(" ", text).strip()
-
-
-def _semantic_tag_count(html: str) -> int:
-    count = 0
-    for tag in _SEMANTIC_TAGS:
-        count += len(re.findall(rf"<{tag}\b", html, flags=re.IGNORECASE))
-    return count
-
-
-def _heading_count(html: str) -> int:
-    return len(_HEADING_RE.findall(html))
-
-
-def _has_json_ld(html: str) -> bool:
-    return bool(_JSON_LD_RE.search(html))
-
-
 def _heuristic_factors(
-    html: str, text_content: str, *, has_llms_txt: bool, has_sitemap: bool
+    page: HtmlEvidence, *, has_llms_txt: bool, has_sitemap: bool
 ) -> tuple[dict[str, int], dict[str, Any]]:
-    title = _extract_title(html)
-    description = _extract_meta_description(html)
-    headings = _heading_count(html)
-    semantic_tags = _semantic_tag_count(html)
-    json_ld = _has_json_ld(html)
-    word_count = len([part for part in text_content.split(" ") if part])
+    title = page.title
+    description = page.meta_description
+    headings = page.headings_count
+    semantic_tags = page.semantic_tags_count
+    json_ld = page.json_ld_present
+    word_count = page.word_count
 
     factors: dict[str, int] = {}
     evidence: dict[str, Any] = {
@@ -264,6 +206,17 @@ def _openai_chat_json(
         ],
         "temperature": temperature,
     }
+    # The full request body is the cache input, so prompt edits miss naturally.
+    cache = default_llm_cache() if llm_cache_enabled() else None
+    key = cache_key(
+        provider="openai",
+        model=str(payload["model"]),
+        template_version=1,
+        context=payload,
+    )
+    cached = cache.get(key) if cache is not None else None
+    if cached is not None and isinstance(cached.get("content"), str):
+        return _parse_json_object(cached["content"])
     request = Request(
         "https://api.openai.com/v1/chat/completions",
         data=json.dumps(payload).encode("utf-8"),
@@ -276,7 +229,10 @@ def _openai_chat_json(
     with urlopen(request, timeout=30) as response:
         raw = json.loads(response.read().decode("utf-8"))
     content = raw["choices"][0]["message"]["content"]
-    return _parse_json_object(content)
+    parsed = _parse_json_object(content)
+    if cache is not None:
+        cache.put(key, {"content": content})
+    return parsed
 
 
 def _openai_review(url: str, html: str, text_content: str) -> dict[str, Any]:
@@ -305,11 +261,20 @@ def build_analysis_payload(url: str, *, use_ai: bool = False) -> dict[str, Any]:
     normalized_url = _normalize_url(url)
     fetch = _fetch_url(normalized_url)
     html = fetch.text
-    text_content = _extract_text_content(html)
-    has_llms_txt = _probe_url(urljoin(fetch.url.rstrip("/") + "/", "llms.txt"))
-    has_sitemap = _probe_url(urljoin(fetch.url.rstrip("/") + "/", "sitemap.xml"))
+    page = extract_html_evidence(html)
+    has_llms_txt, has_sitemap = (
+        default_fetcher()
+        .executor()
+        .map(
+            _probe_url,
+            [
+                urljoin(fetch.url.rstrip("/") + "/", "llms.txt"),
+                urljoin(fetch.url.rstrip("/") + "/", "sitemap.xml"),
+            ],
+        )
+    )
     factors, evidence = _heuristic_factors(
-        html, text_content, has_llms_txt=has_llms_txt, has_sitemap=has_sitemap
+        page, has_llms_txt=has_llms_txt, has_sitemap=has_sitemap
     )
     score = sum(factors.values())
     visibility = _visibility(score)
@@ -328,12 +293,53 @@ def build_analysis_payload(url: str, *, use_ai: bool = False) -> dict[str, Any]:
         "recommendations": _recommendations(factors, evidence),
     }
     if use_ai:
-        payload["ai_review"] = _openai_review(fetch.url, html, text_content)
+        payload["ai_review"] = _openai_review(fetch.url, html, page.text_sample)
     payload["generated_at"] = _utc_now_iso()
     validate_analysis_payload(payload)
     return payload
 
 
+def iter_batch_urls(lines: Iterable[str]) -> Iterator[str]:
+    """URLs from a batch file: one per line, blanks and ``#`` comments skipped."""
+    for line in lines:
+        value = line.strip()
+        if value and not value.startswith("#"):
+            yield value
+
+
+def iter_url_batch(
+    urls: Iterable[str],
+    build: Callable[[str], dict[str, Any]],
+    *,
+    jobs: int = 8,
+) -> Iterator[tuple[str, dict[str, Any] | None, str]]:
+    """Run ``build`` over many URLs concurrently, yielding in input order.
+
+    Yields ``(url, payload, "")`` on success and ``(url, None, error)`` when a
+    URL fails. At most ``jobs`` URLs are in flight, so ``urls`` may be a lazy
+    stream. Workers get their own pool: ``build`` itself fans out on the
+    shared fetcher's executor, and waiting on that from inside it could
+    starve it.
+    """
+    pending: deque[tuple[str, Future[dict[str, Any]]]] = deque()
+    source = iter(urls)
+    with ThreadPoolExecutor(
+        max_workers=max(1, jobs), thread_name_prefix="agentsgen-batch"
+    ) as pool:
+        while True:
+            for url in source:
+                pending.append((url, pool.submit(build, url)))
+                if len(pending) >= max(1, jobs):
+                    break
+            if not pending:
+                return
+            url, future = pending.popleft()
+            try:
+                yield url, future.result(), ""
+            except Exception as exc:
+                yield url, None, str(exc) or type(exc).__name__
+
+
 def apply_analysis(
     root: Path,
     *,
@@ -0,0 +1,122 @@
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+
+from .daemon import FORWARDED_COMMANDS, run_cli_captured
+from .render_memo import render_memo
+from .repo_cache import RepoCache, repo_cache_scope
+from .validators import validate_cli_batch_response_payload
+
+# The same non-interactive commands the daemon accepts; `batch` itself and
+# prompting or networked commands are refused.
+BATCH_COMMANDS = FORWARDED_COMMANDS
+
+
+@dataclass(frozen=True)
+class BatchRequest:
+    id: str | None
+    command: str
+    args: list[str]
+
+    @property
+    def argv(self) -> list[str]:
+        return [*self.command.split(), *self.args]
+
+
+def parse_batch_line(line: str) -> BatchRequest:
+    """Parse ``{"command": "check", "args": [".", "--all"], "id": "..."}``.
+
+    ``command`` may name a subcommand (``"task list"``); ``args`` and ``id``
+    are optional. Raises ``ValueError`` for malformed or refused requests.
+    """
+    payload = json.loads(line)
+    if not isinstance(payload, dict):
+        raise ValueError("each batch line must be a JSON object")
+    command = payload.get("command")
+    if not isinstance(command, str) or not command.split():
+        raise ValueError("command must be a non-empty string")
+    args = payload.get("args", [])
+    if not isinstance(args, list) or not all(
+        isinstance(item, (str, int, float)) for item in args
+    ):
+        raise ValueError("args must be a list of strings")
+    tokens = command.split()
+    if tokens[0] not in BATCH_COMMANDS:
+        raise ValueError(f"command is not allowed in a batch: {tokens[0]}")
+    request_id = payload.get("id")
+    return BatchRequest(
+        id=None if request_id is None else str(request_id),
+        command=" ".join(tokens),
+        args=[str(item) for item in args],
+    )
+
+
+def _json_object(text: str) -> dict[str, object] | None:
+    if not text.lstrip().startswith("{"):
+        return None
+    try:
+        payload = json.loads(text)
+    except ValueError:
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def run_batch(
+    lines: Iterable[str], *, cache: RepoCache | None = None
+) -> Iterator[dict[str, object]]:
+    """Run JSONL command requests in this process, one response per request.
+
+    Requests share one ``RepoCache`` (a fresh one unless ``cache`` is given)
+    and template memo, so a repo is detected and scanned once and reused by
+    later commands until its files change. Captured output is rendered for
+    a non-terminal, so it never carries colour codes. Lines are read
+    lazily, so responses stream as each command finishes. Blank lines are
+    skipped; a malformed line yields an error response with exit code 2 and
+    the batch carries on.
+    """
+    cache = cache if cache is not None else RepoCache()
+    index = 0
+    with render_memo():
+        for line in lines:
+            if not line.strip():
+                continue
+            started = time.monotonic()
+            response: dict[str, object] = {
+                "version": 1,
+                "index": index,
+                "id": None,
+                "command": "",
+                "args": [],
+                "exit_code": 0,
+                "duration_ms": 0,
+                "output": None,
+                "stdout": "",
+                "stderr": "",
+                "error": None,
+            }
+            try:
+                request = parse_batch_line(line)
+            except ValueError as exc:
+                response.update(exit_code=2, error=str(exc))
+            else:
+                # One scope per command: files written by earlier commands
+                # are noticed when the next one fingerprints the repo.
+                with repo_cache_scope(cache):
+                    exit_code, stdout, stderr = run_cli_captured(request.argv)
+                output = _json_object(stdout)
+                response.update(
+                    id=request.id,
+                    command=request.command,
+                    args=request.args,
+                    exit_code=exit_code,
+                    output=output,
+                    stdout="" if output is not None else stdout,
+                    stderr=stderr,
+                )
+            response["duration_ms"] = int((time.monotonic() - started) * 1000)
+            validate_cli_batch_response_payload(response)
+            index += 1
+            yield response
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import threading
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+
+class OperationCancelled(Exception):
+    """Raised inside long scans once their caller has gone away."""
+
+
+_CURRENT: ContextVar[threading.Event | None] = ContextVar(
+    "agentsgen_cancel_event", default=None
+)
+
+
+@contextmanager
+def cancel_scope(event: threading.Event) -> Iterator[threading.Event]:
+    token = _CURRENT.set(event)
+    try:
+        yield event
+    finally:
+        _CURRENT.reset(token)
+
+
+def check_cancelled() -> None:
+    """Cooperative cancellation point for per-file loops; no-op outside a scope."""
+    event = _CURRENT.get()
+    if event is not None and event.is_set():
+        raise OperationCancelled("operation cancelled")
@@ -180,7 +180,7 @@ def register_core_commands(app: typer.Typer) -> None:
         llm_provider: str = typer.Option(
             "",
             "--llm-provider",
-            help="LLM provider for --llm-enhance (openai|anthropic)",
+            help="LLM provider for --llm-enhance (openai|anthropic|stub)",
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
         print_diff: bool = typer.Option(
@@ -279,7 +279,7 @@ def register_core_commands(app: typer.Typer) -> None:
         llm_provider: str = typer.Option(
             "",
             "--llm-provider",
-            help="LLM provider for --llm-enhance (openai|anthropic)",
+            help="LLM provider for --llm-enhance (openai|anthropic|stub)",
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
         print_diff: bool = typer.Option(
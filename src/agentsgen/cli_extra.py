@@ -1,10 +1,20 @@
 from __future__ import annotations
 
+import json
+import sys
+from collections.abc import Callable, Iterable
 from pathlib import Path
+from typing import Any
 
 import typer
 
-from .analyze import apply_analysis
+from .analyze import (
+    apply_analysis,
+    build_analysis_payload,
+    iter_batch_urls,
+    iter_url_batch,
+)
+from .batch import run_batch
 from .cli_support import (
     console,
     err_console,
@@ -13,9 +23,15 @@ from .cli_support import (
     resolve_repo_file,
     results_payload,
 )
+from .daemon import (
+    DEFAULT_IDLE_TIMEOUT_SECONDS,
+    AgentsgenDaemon,
+    daemon_request,
+    default_socket_path,
+)
 from .detect import detect_repo
 from .mcp_server import serve_stdio
-from .meta import apply_metadata
+from .meta import apply_metadata, build_metadata_payload
 from .rabbithole_seed import write_rabbithole_seed
 from .understand_context import apply_understanding
 from .validators import (
@@ -26,6 +42,41 @@ from .validators import (
 )
 
 
+def _run_url_batch(
+    batch: Path, build: Callable[[str], dict[str, Any]], *, jobs: int
+) -> None:
+    """Stream one payload per input URL to stdout as NDJSON.
+
+    Failures go to stderr and make the command exit 1 after the batch ends.
+    """
+    if str(batch) != "-" and not batch.is_file():
+        err_console.print(f"ERROR: Batch file not found: {batch}")
+        raise typer.Exit(code=1)
+    failed = 0
+    handle = sys.stdin if str(batch) == "-" else batch.open(encoding="utf-8")
+    try:
+        for url, payload, error in iter_url_batch(
+            iter_batch_urls(handle), build, jobs=jobs
+        ):
+            if payload is None:
+                failed += 1
+                err_console.print(f"ERROR: {url}: {error}")
+                continue
+            sys.stdout.write(json.dumps(payload, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+    finally:
+        if handle is not sys.stdin:
+            handle.close()
+    if failed:
+        raise typer.Exit(code=1)
+
+
+def _require_url_or_batch(url: str | None, batch: Path | None) -> None:
+    if (url is None) == (batch is None):
+        err_console.print("ERROR: Provide exactly one of URL or --batch.")
+        raise typer.Exit(code=2)
+
+
 def register_extra_commands(app: typer.Typer) -> None:
     @app.command()
     def rabbithole_seed(
@@ -140,7 +191,7 @@ def register_extra_commands(app: typer.Typer) -> None:
 
     @app.command()
     def analyze(
-        url: str = typer.Argument(..., help="Website URL to analyze"),
+        url: str | None = typer.Argument(None, help="Website URL to analyze"),
         target: Path = typer.Argument(
             Path("."), exists=True, file_okay=False, dir_okay=True
         ),
@@ -154,11 +205,29 @@ def register_extra_commands(app: typer.Typer) -> None:
             help="Add an advisory OpenAI review (requires OPENAI_API_KEY)",
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
+        batch: Path | None = typer.Option(
+            None,
+            "--batch",
+            help="Read URLs from a file ('-' for stdin) and stream NDJSON payloads",
+        ),
+        jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Concurrent URLs"),
     ):
+        _require_url_or_batch(url, batch)
+        if batch is not None:
+            _run_url_batch(
+                batch,
+                lambda item: build_analysis_payload(item, use_ai=use_ai),
+                jobs=jobs,
+            )
+            return
         output_path = resolve_repo_file(target, output, "docs/ai/llmo-score.json")
         try:
             results, payload = apply_analysis(
-                target, url=url, output_path=output_path, use_ai=use_ai, dry_run=dry_run
+                target,
+                url=url or "",
+                output_path=output_path,
+                use_ai=use_ai,
+                dry_run=dry_run,
             )
         except ValueError as exc:
             err_console.print(f"ERROR: {exc}")
@@ -191,7 +260,9 @@ def register_extra_commands(app: typer.Typer) -> None:
 
     @app.command()
     def meta(
-        url: str = typer.Argument(..., help="Website URL to generate metadata for"),
+        url: str | None = typer.Argument(
+            None, help="Website URL to generate metadata for"
+        ),
         target: Path = typer.Argument(
             Path("."), exists=True, file_okay=False, dir_okay=True
         ),
@@ -200,11 +271,21 @@ def register_extra_commands(app: typer.Typer) -> None:
             None, "--output", help="Output JSON file (default docs/ai/llmo-meta.json)"
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
+        batch: Path | None = typer.Option(
+            None,
+            "--batch",
+            help="Read URLs from a file ('-' for stdin) and stream NDJSON payloads",
+        ),
+        jobs: int = typer.Option(8, "--jobs", "-j", min=1, help="Concurrent URLs"),
     ):
+        _require_url_or_batch(url, batch)
+        if batch is not None:
+            _run_url_batch(batch, build_metadata_payload, jobs=jobs)
+            return
         output_path = resolve_repo_file(target, output, "docs/ai/llmo-meta.json")
         try:
             results, payload = apply_metadata(
-                target, url=url, output_path=output_path, dry_run=dry_run
+                target, url=url or "", output_path=output_path, dry_run=dry_run
             )
         except ValueError as exc:
             err_console.print(f"ERROR: {exc}")
@@ -265,9 +346,82 @@ def register_extra_commands(app: typer.Typer) -> None:
                 console.print(f"- {key}: {', '.join(value)}")
 
     @app.command()
-    def mcp() -> None:
+    def mcp(
+        workers: int = typer.Option(
+            4,
+            "--workers",
+            min=1,
+            help="Worker threads for concurrent tool calls",
+        ),
+    ) -> None:
         try:
-            serve_stdio()
+            serve_stdio(max_workers=workers)
         except RuntimeError as exc:
             err_console.print(f"ERROR: {exc}")
             raise typer.Exit(code=1)
+
+    @app.command()
+    def serve(
+        socket_path: Path | None = typer.Option(
+            None,
+            "--socket",
+            help="Unix socket path (default: $AGENTSGEN_SOCKET or the user runtime dir)",
+        ),
+        idle_timeout: float = typer.Option(
+            DEFAULT_IDLE_TIMEOUT_SECONDS,
+            "--idle-timeout",
+            min=1,
+            help="Exit after this many seconds without a request",
+        ),
+        stop: bool = typer.Option(
+            False, "--stop", help="Stop the daemon listening on the socket"
+        ),
+    ) -> None:
+        """Keep repo state warm in a local daemon that CLI runs delegate to."""
+        path = socket_path or default_socket_path()
+        if stop:
+            if daemon_request({"op": "shutdown"}, socket_path=path) is None:
+                err_console.print(f"No agentsgen daemon is listening on {path}.")
+                raise typer.Exit(code=1)
+            console.print(f"stopped daemon on {path}")
+            return
+        daemon = AgentsgenDaemon(path, idle_timeout_seconds=idle_timeout)
+        err_console.print(
+            f"agentsgen daemon listening on {path} (idle timeout {idle_timeout:g}s)"
+        )
+        try:
+            daemon.serve_forever()
+        except (OSError, RuntimeError) as exc:
+            err_console.print(f"ERROR: {exc}")
+            raise typer.Exit(code=1)
+        except KeyboardInterrupt:
+            pass
+        err_console.print(f"daemon stopped after {daemon.requests} request(s)")
+
+    @app.command()
+    def batch(
+        source: Path | None = typer.Argument(
+            None, help="JSONL file of commands (default or '-': stdin)"
+        ),
+        fail_fast: bool = typer.Option(
+            False, "--fail-fast", help="Stop after the first failing command"
+        ),
+    ) -> None:
+        """Run many commands in one process, one JSON response line each."""
+        if source is None or str(source) == "-":
+            lines: Iterable[str] = sys.stdin
+        else:
+            if not source.is_file():
+                err_console.print(f"ERROR: Batch file not found: {source}")
+                raise typer.Exit(code=1)
+            lines = source.read_text(encoding="utf-8").splitlines()
+        failed = False
+        for response in run_batch(lines):
+            sys.stdout.write(json.dumps(response, ensure_ascii=False) + "\n")
+            sys.stdout.flush()
+            if response["exit_code"] != 0:
+                failed = True
+                if fail_fast:
+                    break
+        if failed:
+            raise typer.Exit(code=1)
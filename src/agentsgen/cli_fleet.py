@@ -9,8 +9,11 @@ import typer
 from .cli_support import console
 from .fleet import (
     build_fleet_scan_report,
+    build_fleet_understand_report,
     render_fleet_scan_markdown,
+    render_fleet_understand_markdown,
     write_fleet_scan_outputs,
+    write_fleet_understand_outputs,
 )
 
 
@@ -51,3 +54,77 @@ def register_fleet_commands(app: typer.Typer) -> None:
                 sys.stdout.write(f"markdown: {out}\n")
             if json_out is not None:
                 sys.stdout.write(f"json: {json_out}\n")
+
+    @app.command()
+    def understand(
+        root: list[Path] = typer.Argument(
+            ..., exists=True, file_okay=False, dir_okay=True
+        ),
+        max_depth: int = typer.Option(
+            2,
+            "--max-depth",
+            min=0,
+            help="Max directory depth below each root",
+        ),
+        jobs: int = typer.Option(
+            0,
+            "--jobs",
+            "-j",
+            min=0,
+            help="Worker processes (0 = one per CPU, 1 = in-process)",
+        ),
+        output_dir: str = typer.Option(
+            "docs/ai",
+            "--output-dir",
+            help="Per-repo directory for repomap.md and graph.mmd",
+        ),
+        compact_budget: int = typer.Option(
+            4000,
+            "--compact-budget",
+            min=256,
+            help="Approximate token budget for each repomap.compact.md",
+        ),
+        top_modules: int = typer.Option(
+            5,
+            "--top-modules",
+            min=0,
+            help="Top-ranked modules listed per repo in the summary",
+        ),
+        dry_run: bool = typer.Option(
+            False, "--dry-run", help="Do not write per-repo artifacts"
+        ),
+        format: str = typer.Option("text", "--format", help="Output format: text|json"),
+        out: Path | None = typer.Option(
+            None, "--out", help="Write markdown report to this path"
+        ),
+        json_out: Path | None = typer.Option(
+            None, "--json-out", help="Write JSON report to this path"
+        ),
+    ) -> None:
+        """Build understand artifacts for many git repos in a worker pool."""
+        report = build_fleet_understand_report(
+            root,
+            max_depth=max_depth,
+            jobs=jobs,
+            output_dir=output_dir,
+            compact_budget_tokens=compact_budget,
+            top_modules=top_modules,
+            dry_run=dry_run,
+        )
+        write_fleet_understand_outputs(
+            report,
+            markdown_path=out,
+            json_path=json_out,
+        )
+
+        if format == "json":
+            sys.stdout.write(json.dumps(report, indent=2) + "\n")
+        else:
+            if out is None:
+                console.print(render_fleet_understand_markdown(report))
+            else:
+                sys.stdout.write(f"markdown: {out}\n")
+            if json_out is not None:
+                sys.stdout.write(f"json: {json_out}\n")
+        if report["summary"]["failed_count"]:
+            raise typer.Exit(code=1)
@@ -6,7 +6,7 @@ from pathlib import Path
 import typer
 
 from .cli_support import console, err_console
-from .okf_export import export_okf_bundle, okf_results_payload
+from .okf_export import export_okf_archive, export_okf_bundle, okf_results_payload
 
 
 def register_okf_commands(app: typer.Typer) -> None:
@@ -21,6 +21,16 @@ def register_okf_commands(app: typer.Typer) -> None:
         output_dir: str = typer.Option(
             "docs/ai/okf", "--output-dir", help="Output OKF bundle directory"
         ),
+        archive: str | None = typer.Option(
+            None,
+            "--archive",
+            help="Write the bundle as one deterministic .tar.gz/.tgz/.zip instead of a directory",
+        ),
+        incremental: bool = typer.Option(
+            False,
+            "--incremental",
+            help="Only re-render concepts whose source digest changed since the last incremental export",
+        ),
         check: bool = typer.Option(
             False,
             "--check",
@@ -36,13 +46,29 @@ def register_okf_commands(app: typer.Typer) -> None:
         source_path = target / source_dir
         output_path = target / output_dir
         dry_run_effective = dry_run or check
-        results = export_okf_bundle(
-            target,
-            source_dir=source_path,
-            output_dir=output_path,
-            dry_run=dry_run_effective,
-            print_diff=print_diff,
-        )
+        if archive:
+            try:
+                results = [
+                    export_okf_archive(
+                        target,
+                        source_dir=source_path,
+                        archive_path=target / archive,
+                        dry_run=dry_run_effective,
+                        incremental=incremental,
+                    )
+                ]
+            except ValueError as exc:
+                err_console.print(f"ERROR: {exc}")
+                raise typer.Exit(code=1)
+        else:
+            results = export_okf_bundle(
+                target,
+                source_dir=source_path,
+                output_dir=output_path,
+                dry_run=dry_run_effective,
+                print_diff=print_diff,
+                incremental=incremental,
+            )
         errors = [row for row in results if row.action == "error"]
         drift = any(
             row.action in ("created", "updated") and row.changed for row in results
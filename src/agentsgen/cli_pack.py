@@ -6,11 +6,10 @@ from pathlib import Path
 
 import typer
 
-from .actions import apply_pack, load_tool_config
+from .actions import apply_pack, pack_check_config
 from .cli_support import (
     console,
     err_console,
-    interactive_init as _interactive_init,
     pack_plan_payload as _pack_plan_payload,
     parse_csv as _parse_csv,
     print_pack_plan as _print_pack_plan,
@@ -19,9 +18,7 @@ from .cli_support import (
     resolve_repo_file as _resolve_repo_file,
     results_payload as _results_payload,
 )
-from .config import ToolConfig, merge_detect_hints
 from .constants import CONFIG_FILENAME
-from .detect import detect_repo
 from .validators import (
     validate_cli_pack_plan_response_payload,
     validate_cli_pack_response_payload,
@@ -82,33 +79,21 @@ def register_pack_commands(app: typer.Typer) -> None:
         """Generate/update LLMO pack files with marker-safe updates."""
         cfg_path = target / ".agentsgen.json"
         try:
-            cfg = load_tool_config(target) if cfg_path.exists() else ToolConfig()
+            cfg = pack_check_config(
+                target,
+                autodetect=autodetect,
+                stack=stack or "",
+                llms_format=llms_format or "",
+                output_dir=output_dir or "",
+                files=_parse_csv(files) if files is not None else None,
+            )
         except Exception as exc:
-            err_console.print(f"ERROR: Invalid {CONFIG_FILENAME}: {exc}")
+            if not cfg_path.exists():
+                err_console.print(f"ERROR: {exc}")
+            else:
+                err_console.print(f"ERROR: Invalid {CONFIG_FILENAME}: {exc}")
             raise typer.Exit(code=1)
 
-        if autodetect:
-            det_cfg = ToolConfig.from_detect(detect_repo(target))
-            existing_pack = cfg.pack
-            cfg = merge_detect_hints(cfg, det_cfg)
-            cfg.pack = existing_pack
-        elif not cfg_path.exists():
-            info = _interactive_init(
-                target, defaults=True, stack_opt=stack, name_opt=None
-            )
-            cfg = ToolConfig.from_project_info(info)
-
-        if stack:
-            cfg.project["primary_stack"] = stack.strip().lower()
-            cfg = ToolConfig.from_json(cfg.to_json())
-
-        if llms_format:
-            cfg.pack.llms_format = llms_format.strip().lower()
-        if output_dir:
-            cfg.pack.output_dir = output_dir.strip()
-        if files is not None:
-            cfg.pack.files = _parse_csv(files)
-
         dry_run_effective = dry_run or check or print_plan
         results = apply_pack(
             target,
@@ -1,19 +1,74 @@
 from __future__ import annotations
 
+from datetime import date
 from pathlib import Path
 from typing import cast
 
 import typer
 
-from .cli_support import print_json, print_results, results_payload
-from .reflect_sessions import apply_reflect_sessions
+from .cli_support import err_console, print_json, print_results, results_payload
+from .reflect_all import apply_reflect_all
+from .reflect_index import ReflectIndex, default_index_path
+from .reflect_mentions import load_skill_vocabulary
+from .reflect_sessions import (
+    SessionSource,
+    apply_reflect_sessions,
+    parse_day_bound,
+)
 from .reflect_skills import apply_reflect_skills
 from .validators import (
+    validate_cli_reflect_all_response_payload,
     validate_cli_reflect_sessions_response_payload,
     validate_cli_reflect_skills_response_payload,
 )
 
 
+def _open_index(
+    target: Path, source: SessionSource, *, use_index: bool, index_path: Path | None
+) -> ReflectIndex | None:
+    if not use_index:
+        return None
+    return ReflectIndex.load(
+        index_path or default_index_path(target), matcher=source.matcher.fingerprint
+    )
+
+
+def _save_index(index: ReflectIndex | None) -> None:
+    # The index only speeds up the next run; failing to write it must not
+    # fail a run whose outputs are already written.
+    if index is None:
+        return
+    try:
+        index.save()
+    except OSError as exc:
+        err_console.print(f"WARNING: could not save reflect index: {exc}")
+
+
+def _session_source(
+    codex_roots: list[Path],
+    *,
+    jobs: int,
+    since: str | None,
+    until: str | None,
+    skills_dirs: list[Path] | None = None,
+) -> SessionSource:
+    bounds: dict[str, date] = {}
+    for option, raw in (("--since", since), ("--until", until)):
+        if raw is None:
+            continue
+        try:
+            bounds[option] = parse_day_bound(raw)
+        except ValueError as exc:
+            raise typer.BadParameter(str(exc), param_hint=option) from exc
+    return SessionSource(
+        roots=tuple(codex_roots),
+        jobs=jobs,
+        since=bounds.get("--since"),
+        until=bounds.get("--until"),
+        skill_vocabulary=load_skill_vocabulary(skills_dirs or []),
+    )
+
+
 def register_reflect_commands(app: typer.Typer) -> None:
     @app.command("sessions")
     def sessions(
@@ -24,10 +79,33 @@ def register_reflect_commands(app: typer.Typer) -> None:
         output_dir: str = typer.Option(
             "docs/ai", "--output-dir", help="Where to write reflect artifacts"
         ),
-        codex_root: Path = typer.Option(
-            Path.home() / ".codex" / "sessions",
+        codex_roots: list[Path] = typer.Option(
+            [Path.home() / ".codex" / "sessions"],
             "--codex-root",
-            help="Codex session root to scan",
+            help="Codex session root to scan (repeat for several archives)",
+        ),
+        jobs: int = typer.Option(
+            1,
+            "--jobs",
+            "-j",
+            min=0,
+            help="Parse worker processes (0 = one per CPU, 1 = in-process)",
+        ),
+        since: str | None = typer.Option(
+            None, "--since", help="Only sessions on/after YYYY-MM-DD or <N>d ago"
+        ),
+        until: str | None = typer.Option(
+            None, "--until", help="Only sessions on/before YYYY-MM-DD or <N>d ago"
+        ),
+        use_index: bool = typer.Option(
+            True,
+            "--index/--no-index",
+            help="Resume from the incremental session index instead of reparsing",
+        ),
+        index_path: Path | None = typer.Option(
+            None,
+            "--index-path",
+            help="Index file (default: per-repo file under the user cache dir)",
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
         print_diff: bool = typer.Option(
@@ -37,21 +115,27 @@ def register_reflect_commands(app: typer.Typer) -> None:
         out_dir = Path(output_dir)
         if not out_dir.is_absolute():
             out_dir = target / out_dir
+        source = _session_source(codex_roots, jobs=jobs, since=since, until=until)
+        index = _open_index(target, source, use_index=use_index, index_path=index_path)
         results, sessions_payload, signals_payload = apply_reflect_sessions(
             target,
-            codex_root=codex_root,
+            source=source,
             output_dir=out_dir,
             dry_run=dry_run,
             print_diff=print_diff,
+            index=index,
         )
+        if not dry_run:
+            _save_index(index)
         summary = cast(dict[str, object], signals_payload["summary"])
         response = {
             "version": 1,
             "command": "reflect sessions",
             "path": str(target),
             "output_dir": str(out_dir),
-            "source": {"tool": "codex", "root": str(codex_root)},
+            "source": source.payload(),
             "summary": summary,
+            "index": index.stats() if index is not None else None,
             "outputs": {
                 "sessions_json": str(out_dir / "agent-sessions.json"),
                 "signals_json": str(out_dir / "agent-signals.json"),
@@ -81,10 +165,39 @@ def register_reflect_commands(app: typer.Typer) -> None:
         output_dir: str = typer.Option(
             "docs/ai", "--output-dir", help="Where to write reflect artifacts"
         ),
-        codex_root: Path = typer.Option(
-            Path.home() / ".codex" / "sessions",
+        codex_roots: list[Path] = typer.Option(
+            [Path.home() / ".codex" / "sessions"],
             "--codex-root",
-            help="Codex session root to scan",
+            help="Codex session root to scan (repeat for several archives)",
+        ),
+        jobs: int = typer.Option(
+            1,
+            "--jobs",
+            "-j",
+            min=0,
+            help="Parse worker processes (0 = one per CPU, 1 = in-process)",
+        ),
+        since: str | None = typer.Option(
+            None, "--since", help="Only sessions on/after YYYY-MM-DD or <N>d ago"
+        ),
+        until: str | None = typer.Option(
+            None, "--until", help="Only sessions on/before YYYY-MM-DD or <N>d ago"
+        ),
+        skills_dirs: list[Path] = typer.Option(
+            [],
+            "--skills-dir",
+            help="Installed skills dir (<dir>/<skill>/SKILL.md) used as the "
+            "known-skill vocabulary (repeatable)",
+        ),
+        use_index: bool = typer.Option(
+            True,
+            "--index/--no-index",
+            help="Resume from the incremental session index instead of reparsing",
+        ),
+        index_path: Path | None = typer.Option(
+            None,
+            "--index-path",
+            help="Index file (default: per-repo file under the user cache dir)",
         ),
         dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
         print_diff: bool = typer.Option(
@@ -94,21 +207,33 @@ def register_reflect_commands(app: typer.Typer) -> None:
         out_dir = Path(output_dir)
         if not out_dir.is_absolute():
             out_dir = target / out_dir
+        source = _session_source(
+            codex_roots,
+            jobs=jobs,
+            since=since,
+            until=until,
+            skills_dirs=skills_dirs,
+        )
+        index = _open_index(target, source, use_index=use_index, index_path=index_path)
         results, usage_payload = apply_reflect_skills(
             target,
-            codex_root=codex_root,
+            source=source,
             output_dir=out_dir,
             dry_run=dry_run,
             print_diff=print_diff,
+            index=index,
         )
+        if not dry_run:
+            _save_index(index)
         summary = cast(dict[str, object], usage_payload["summary"])
         response = {
             "version": 1,
             "command": "reflect skills",
             "path": str(target),
             "output_dir": str(out_dir),
-            "source": {"tool": "codex", "root": str(codex_root)},
+            "source": source.payload(),
             "summary": summary,
+            "index": index.stats() if index is not None else None,
             "outputs": {
                 "skill_usage_json": str(out_dir / "skill-usage.json"),
                 "skill_effectiveness_md": str(out_dir / "skill-effectiveness.md"),
@@ -127,3 +252,105 @@ def register_reflect_commands(app: typer.Typer) -> None:
             f"activations={cast(int, summary['skill_activation_count'])} "
             f"unique_skills={cast(int, summary['unique_skills'])}"
         )
+
+    @app.command("all")
+    def all_(
+        target: Path = typer.Argument(
+            Path("."), exists=True, file_okay=False, dir_okay=True
+        ),
+        format: str = typer.Option("text", "--format", help="Output format: text|json"),
+        output_dir: str = typer.Option(
+            "docs/ai", "--output-dir", help="Where to write reflect artifacts"
+        ),
+        codex_roots: list[Path] = typer.Option(
+            [Path.home() / ".codex" / "sessions"],
+            "--codex-root",
+            help="Codex session root to scan (repeat for several archives)",
+        ),
+        jobs: int = typer.Option(
+            1,
+            "--jobs",
+            "-j",
+            min=0,
+            help="Parse worker processes (0 = one per CPU, 1 = in-process)",
+        ),
+        since: str | None = typer.Option(
+            None, "--since", help="Only sessions on/after YYYY-MM-DD or <N>d ago"
+        ),
+        until: str | None = typer.Option(
+            None, "--until", help="Only sessions on/before YYYY-MM-DD or <N>d ago"
+        ),
+        skills_dirs: list[Path] = typer.Option(
+            [],
+            "--skills-dir",
+            help="Installed skills dir (<dir>/<skill>/SKILL.md) used as the "
+            "known-skill vocabulary (repeatable)",
+        ),
+        use_index: bool = typer.Option(
+            True,
+            "--index/--no-index",
+            help="Resume from the incremental session index instead of reparsing",
+        ),
+        index_path: Path | None = typer.Option(
+            None,
+            "--index-path",
+            help="Index file (default: per-repo file under the user cache dir)",
+        ),
+        dry_run: bool = typer.Option(False, "--dry-run", help="Do not write files"),
+        print_diff: bool = typer.Option(
+            False, "--print-diff", help="Print unified diff"
+        ),
+    ) -> None:
+        """Write session, signal and skill artifacts from one transcript pass."""
+        out_dir = Path(output_dir)
+        if not out_dir.is_absolute():
+            out_dir = target / out_dir
+        source = _session_source(
+            codex_roots,
+            jobs=jobs,
+            since=since,
+            until=until,
+            skills_dirs=skills_dirs,
+        )
+        index = _open_index(target, source, use_index=use_index, index_path=index_path)
+        results, payloads = apply_reflect_all(
+            target,
+            source=source,
+            output_dir=out_dir,
+            dry_run=dry_run,
+            print_diff=print_diff,
+            index=index,
+        )
+        if not dry_run:
+            _save_index(index)
+        sessions_summary = cast(dict[str, object], payloads["signals"]["summary"])
+        skills_summary = cast(dict[str, object], payloads["skill_usage"]["summary"])
+        response = {
+            "version": 1,
+            "command": "reflect all",
+            "path": str(target),
+            "output_dir": str(out_dir),
+            "source": source.payload(),
+            "summary": {"sessions": sessions_summary, "skills": skills_summary},
+            "index": index.stats() if index is not None else None,
+            "outputs": {
+                "sessions_json": str(out_dir / "agent-sessions.json"),
+                "signals_json": str(out_dir / "agent-signals.json"),
+                "patterns_md": str(out_dir / "agent-patterns.md"),
+                "skill_usage_json": str(out_dir / "skill-usage.json"),
+                "skill_effectiveness_md": str(out_dir / "skill-effectiveness.md"),
+            },
+            "results": results_payload(results),
+        }
+        validate_cli_reflect_all_response_payload(response)
+        if format == "json":
+            print_json(response)
+            return
+        print_results(results, print_diff=print_diff)
+        typer.echo(
+            "reflect: "
+            f"sessions={cast(int, sessions_summary['session_count'])} "
+            f"prompts={cast(int, sessions_summary['prompt_count'])} "
+            f"redirects={cast(int, sessions_summary['redirect_count'])} "
+            f"unique_skills={cast(int, skills_summary['unique_skills'])}"
+        )
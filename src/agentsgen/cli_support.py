@@ -1,7 +1,11 @@
 from __future__ import annotations
 
 import json
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
 from pathlib import Path
+from typing import Any
 
 import typer
 from rich.console import Console
@@ -10,11 +14,57 @@ from rich.table import Table
 from .config import ToolConfig
 from .detect import detect_repo
 from .pack_engine import pack_plan_specs
-from .stacks import adapter_for
+from .stacks import adapter_for, default_project_info, suggested_stack
 from .stacks.base import project_name_from_dir
 
-console = Console(stderr=False)
-err_console = Console(stderr=True)
+_client_consoles: ContextVar[tuple[Console, Console] | None] = ContextVar(
+    "agentsgen_client_consoles", default=None
+)
+
+
+class _SharedConsole:
+    """The console commands print through.
+
+    Normally a console for this process's terminal; inside
+    ``client_consoles`` it forwards to consoles built for the client a
+    daemon or batch run is serving instead.
+    """
+
+    def __init__(self, stderr: bool):
+        self._stderr = stderr
+        self._default = Console(stderr=stderr)
+
+    def __getattr__(self, name: str) -> Any:
+        override = _client_consoles.get()
+        if override is None:
+            return getattr(self._default, name)
+        return getattr(override[1 if self._stderr else 0], name)
+
+
+console = _SharedConsole(stderr=False)
+err_console = _SharedConsole(stderr=True)
+
+
+@contextmanager
+def client_consoles(
+    *, stdout_tty: bool = False, stderr_tty: bool = False, width: int | None = None
+) -> Iterator[None]:
+    """Print through consoles built for a client's terminal, not this one's.
+
+    Colour and width follow the client: whether its streams are terminals,
+    plus ``NO_COLOR``, ``COLUMNS`` and friends from the current environment.
+    Output still goes to whatever ``sys.stdout``/``sys.stderr`` are.
+    """
+    token = _client_consoles.set(
+        (
+            Console(force_terminal=stdout_tty, width=width),
+            Console(stderr=True, force_terminal=stderr_tty, width=width),
+        )
+    )
+    try:
+        yield
+    finally:
+        _client_consoles.reset(token)
 
 
 def parse_csv(s: str) -> list[str]:
@@ -124,35 +174,29 @@ def interactive_init(
     stack_opt: str | None,
     name_opt: str | None,
 ):
+    if defaults:
+        return default_project_info(target, stack_opt, name_opt)
     det = detect_repo(target)
-    suggested = str(det.project.get("primary_stack", "static"))
+    suggested = suggested_stack(det)
     confidence = (
         "high"
         if (det.evidence.python or det.evidence.node or det.evidence.make)
         else "low"
     )
-    if suggested == "mixed":
-        suggested = "static"
-    if defaults:
-        stack = (stack_opt or suggested).strip().lower()
-        project_name = (name_opt or project_name_from_dir(target)).strip()
-    else:
-        stack = (
-            typer.prompt(
-                f"Stack (node|python|static) [detected: {suggested}, {confidence}]",
-                default=(stack_opt or suggested),
-            )
-            .strip()
-            .lower()
+    stack = (
+        typer.prompt(
+            f"Stack (node|python|static) [detected: {suggested}, {confidence}]",
+            default=(stack_opt or suggested),
         )
-        project_name = typer.prompt(
-            "Project name",
-            default=(name_opt or project_name_from_dir(target)),
-        ).strip()
+        .strip()
+        .lower()
+    )
+    project_name = typer.prompt(
+        "Project name",
+        default=(name_opt or project_name_from_dir(target)),
+    ).strip()
     adapter = adapter_for(stack)
     info = adapter.default_info(target, project_name)
-    if defaults:
-        return info
 
     def req(label: str, key: str, default: str) -> str:
         val = typer.prompt(label, default=default).strip()
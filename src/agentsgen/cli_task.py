@@ -11,6 +11,8 @@ from .cli_support import (
     print_json,
     results_payload,
 )
+from .task_checks import DEFAULT_CHECK_TIMEOUT_SECONDS, apply_task_run_checks
+from .task_index import list_tasks, task_index_path
 from .task_loop import (
     apply_task_evidence,
     apply_task_init,
@@ -207,3 +209,125 @@ def register_task_commands(task_app: typer.Typer) -> None:
                 console.print(f"blocking_items: {len(payload['blocking_items'])}")
         if errors:
             raise typer.Exit(code=1)
+
+    @task_app.command("run-checks")
+    def task_run_checks(
+        task_id: str = typer.Argument(..., help="Stable task id"),
+        target: Path = typer.Argument(
+            Path("."), exists=True, file_okay=False, dir_okay=True
+        ),
+        check: list[str] = typer.Option(
+            None,
+            "--check",
+            help="Entrypoint id to run (default: test, lint, typecheck, build)",
+        ),
+        jobs: int = typer.Option(4, "--jobs", "-j", min=1, help="Checks run at once"),
+        timeout: float = typer.Option(
+            DEFAULT_CHECK_TIMEOUT_SECONDS,
+            "--timeout",
+            min=1,
+            help="Per-check timeout in seconds",
+        ),
+        output: Path | None = typer.Option(
+            None,
+            "--output",
+            help="Evidence JSON path (default docs/ai/tasks/<task-id>/evidence.json)",
+        ),
+        format: str = typer.Option("text", "--format", help="Output format: text|json"),
+        dry_run: bool = typer.Option(
+            False, "--dry-run", help="List the checks without running or writing"
+        ),
+    ):
+        output_path = output or (task_dir(target, task_id) / "evidence.json")
+        try:
+            results, payload, runs = apply_task_run_checks(
+                target,
+                task_id=task_id,
+                check_ids=list(check or []),
+                output_path=output_path,
+                jobs=jobs,
+                timeout_seconds=timeout,
+                dry_run=dry_run,
+            )
+        except ValueError as exc:
+            err_console.print(f"ERROR: {exc}")
+            raise typer.Exit(code=1)
+        response = {
+            "version": 1,
+            "command": "task run-checks",
+            "path": str(target),
+            "output": str(output_path),
+            "result": payload,
+            "results": results_payload(results),
+        }
+        validate_cli_task_response_payload(response)
+        errors = [row for row in results if row.action == "error"]
+        if format == "json":
+            print_json(response)
+        else:
+            print_results(results, print_diff=False)
+            console.print(f"task_id: {payload['task_id']}")
+            for run in runs:
+                suffix = " (timed out)" if run.timed_out else ""
+                console.print(
+                    f"- {run.check.id}: {run.status} "
+                    f"in {run.duration_ms / 1000:.1f}s{suffix}"
+                )
+            console.print(
+                f"evidence_status: {payload.get('evidence_status', 'unknown')}"
+            )
+        if errors or any(run.status != "passed" for run in runs):
+            raise typer.Exit(code=1)
+
+    @task_app.command("list")
+    def task_list(
+        target: Path = typer.Argument(
+            Path("."), exists=True, file_okay=False, dir_okay=True
+        ),
+        status: list[str] = typer.Option(
+            None,
+            "--status",
+            help="Only tasks with this status (open|pass|fail|needs-review); repeatable",
+        ),
+        rebuild: bool = typer.Option(
+            False,
+            "--rebuild",
+            help="Rebuild docs/ai/tasks/index.json from the task directories first",
+        ),
+        format: str = typer.Option("text", "--format", help="Output format: text|json"),
+    ):
+        try:
+            payload = list_tasks(target, statuses=list(status or []), rebuild=rebuild)
+        except ValueError as exc:
+            err_console.print(f"ERROR: {exc}")
+            raise typer.Exit(code=1)
+        response = {
+            "version": 1,
+            "command": "task list",
+            "path": str(target),
+            "output": str(task_index_path(target)),
+            "result": payload,
+            "results": [],
+        }
+        validate_cli_task_response_payload(response)
+        if format == "json":
+            print_json(response)
+            return
+        for row in payload["tasks"]:
+            checks = row.get("check_summary") or {}
+            line = (
+                f"- {row['task_id']}: {row['status']} "
+                f"(evidence: {row['evidence_status']}, "
+                f"checks: {checks.get('passed', 0)}/{checks.get('total', 0)} passed)"
+            )
+            if row.get("title"):
+                line += f" {row['title']}"
+            console.print(line, markup=False)
+        summary = payload["summary"]
+        console.print(
+            "tasks: "
+            + ", ".join(
+                f"{key}={value}" for key, value in summary.items() if key != "total"
+            )
+            + f" (total {summary['total']})"
+        )
@@ -367,6 +367,11 @@ TASK_EVIDENCE_SCHEMA = _named(
                         "status": _string(),
                         "required": _boolean(),
                         "kind": _string(),
+                        "command": _string(),
+                        "exit_code": _integer(nullable=True),
+                        "duration_ms": _integer(),
+                        "timed_out": _boolean(),
+                        "log": _string(),
                     },
                     required=["name", "status", "required", "kind"],
                 )
@@ -491,6 +496,49 @@ TASK_VERDICT_SCHEMA = _named(
 )
 
 
+TASK_INDEX_SCHEMA = _named(
+    "task.index",
+    1,
+    _object(
+        properties={
+            "version": _integer(),
+            "generated_by": _string(),
+            "tasks": _array(
+                _object(
+                    properties={
+                        "task_id": _string(),
+                        "title": _string(),
+                        "status": _string(
+                            enum=["open", "pass", "fail", "needs-review"]
+                        ),
+                        "decision": _string(),
+                        "evidence_status": _string(),
+                        "check_summary": _object(properties={}, required=[]),
+                        "contract_at": _string(),
+                        "evidence_at": _string(),
+                        "verdict_at": _string(),
+                        "updated_at": _string(),
+                    },
+                    required=[
+                        "task_id",
+                        "title",
+                        "status",
+                        "decision",
+                        "evidence_status",
+                        "check_summary",
+                        "contract_at",
+                        "evidence_at",
+                        "verdict_at",
+                        "updated_at",
+                    ],
+                )
+            ),
+        },
+        required=["version", "generated_by", "tasks"],
+    ),
+)
+
+
 AGGREGATED_CHECK_SCHEMA = _named(
     "aggregated-check-report",
     1,
@@ -766,6 +814,91 @@ FLEET_SCAN_REPORT_SCHEMA = _named(
 )
 
 
+FLEET_UNDERSTAND_REPORT_SCHEMA = _named(
+    "fleet-understand-report",
+    1,
+    _object(
+        properties={
+            "version": _integer(),
+            "command": _string(),
+            "meta": _object(
+                properties={
+                    "timestamp": _string(),
+                    "roots": _array(_string()),
+                    "max_depth": _integer(),
+                    "jobs": _integer(),
+                    "output_dir": _string(),
+                    "compact_budget_tokens": _integer(),
+                    "dry_run": _boolean(),
+                },
+                required=[
+                    "timestamp",
+                    "roots",
+                    "max_depth",
+                    "jobs",
+                    "output_dir",
+                    "compact_budget_tokens",
+                    "dry_run",
+                ],
+            ),
+            "summary": _object(
+                properties={
+                    "repos_count": _integer(),
+                    "failed_count": _integer(),
+                    "files_count": _integer(),
+                    "edges_count": _integer(),
+                    "changed_count": _integer(),
+                },
+                required=[
+                    "repos_count",
+                    "failed_count",
+                    "files_count",
+                    "edges_count",
+                    "changed_count",
+                ],
+            ),
+            "repos": _array(
+                _object(
+                    properties={
+                        "repo": _string(),
+                        "stack": _string(),
+                        "files_count": _integer(),
+                        "edges_count": _integer(),
+                        "entrypoints_count": _integer(),
+                        "top_modules": _array(_string()),
+                        "results": _array(
+                            _object(
+                                properties={
+                                    "path": _string(),
+                                    "action": _string(),
+                                    "message": _string(),
+                                    "changed": _boolean(),
+                                },
+                                required=["path", "action", "message", "changed"],
+                            )
+                        ),
+                        "changed_count": _integer(),
+                        "errors": _array(_string()),
+                    },
+                    required=[
+                        "repo",
+                        "stack",
+                        "files_count",
+                        "edges_count",
+                        "entrypoints_count",
+                        "top_modules",
+                        "results",
+                        "changed_count",
+                        "errors",
+                    ],
+                )
+            ),
+        },
+        required=["version", "command", "meta", "summary", "repos"],
+    ),
+)
+
+
 UNDERSTAND_PAYLOAD_SCHEMA = _named(
     "understand-payload",
     1,
@@ -882,6 +1015,18 @@ METADATA_PAYLOAD_SCHEMA = _named(
 )
 
 
+REFLECT_SOURCE_SCHEMA = _object(
+    properties={
+        "tool": _string(),
+        "root": _string(),
+        "roots": _array(_string()),
+        "since": _string(nullable=True),
+        "until": _string(nullable=True),
+    },
+    required=["tool", "root"],
+)
+
+
 REFLECT_SESSION_PAYLOAD_SCHEMA = _named(
     "reflect-sessions-payload",
     1,
@@ -891,10 +1036,7 @@ REFLECT_SESSION_PAYLOAD_SCHEMA = _named(
             "generated_by": _string(),
             "generated_at": _string(),
             "repo": _object(properties={"path": _string()}, required=["path"]),
-            "source": _object(
-                properties={"tool": _string(), "root": _string()},
-                required=["tool", "root"],
-            ),
+            "source": REFLECT_SOURCE_SCHEMA,
             "sessions": _array(
                 _object(
                     properties={
@@ -976,10 +1118,7 @@ REFLECT_SIGNALS_PAYLOAD_SCHEMA = _named(
             "generated_by": _string(),
             "generated_at": _string(),
             "repo": _object(properties={"path": _string()}, required=["path"]),
-            "source": _object(
-                properties={"tool": _string(), "root": _string()},
-                required=["tool", "root"],
-            ),
+            "source": REFLECT_SOURCE_SCHEMA,
             "summary": _object(
                 properties={
                     "session_count": _integer(),
@@ -1034,10 +1173,7 @@ REFLECT_SKILL_USAGE_PAYLOAD_SCHEMA = _named(
             "generated_by": _string(),
             "generated_at": _string(),
             "repo": _object(properties={"path": _string()}, required=["path"]),
-            "source": _object(
-                properties={"tool": _string(), "root": _string()},
-                required=["tool", "root"],
-            ),
+            "source": REFLECT_SOURCE_SCHEMA,
             "summary": _object(
                 properties={
                     "session_count": _integer(),
@@ -1177,6 +1313,40 @@ CLI_TASK_RESPONSE_SCHEMA = _named(
 )
 
 
+CLI_BATCH_RESPONSE_SCHEMA = _named(
+    "cli-batch-response",
+    1,
+    _object(
+        properties={
+            "version": _integer(),
+            "index": _integer(),
+            "id": _string(nullable=True),
+            "command": _string(),
+            "args": _array(_string()),
+            "exit_code": _integer(),
+            "duration_ms": _integer(),
+            "output": _object(properties={}, required=[], nullable=True),
+            "stdout": _string(),
+            "stderr": _string(),
+            "error": _string(nullable=True),
+        },
+        required=[
+            "version",
+            "index",
+            "id",
+            "command",
+            "args",
+            "exit_code",
+            "duration_ms",
+            "output",
+            "stdout",
+            "stderr",
+            "error",
+        ],
+    ),
+)
+
+
 CLI_PACK_RESPONSE_SCHEMA = _named(
     "cli-pack-response",
     1,
@@ -1229,6 +1399,18 @@ CLI_PACK_PLAN_RESPONSE_SCHEMA = _named(
 )
 
 
+REFLECT_INDEX_STATS_SCHEMA = _object(
+    properties={
+        "path": _string(),
+        "files_parsed": _integer(),
+        "files_resumed": _integer(),
+        "files_skipped": _integer(),
+    },
+    required=["path", "files_parsed", "files_resumed", "files_skipped"],
+    nullable=True,
+)
+
+
 CLI_REFLECT_SESSIONS_RESPONSE_SCHEMA = _named(
     "cli-reflect-sessions-response",
     1,
@@ -1238,13 +1420,11 @@ CLI_REFLECT_SESSIONS_RESPONSE_SCHEMA = _named(
             "command": _string(),
             "path": _string(),
             "output_dir": _string(),
-            "source": _object(
-                properties={"tool": _string(), "root": _string()},
-                required=["tool", "root"],
-            ),
+            "source": REFLECT_SOURCE_SCHEMA,
             "summary": REFLECT_SIGNALS_PAYLOAD_SCHEMA["schema"]["properties"][
                 "summary"
             ],
+            "index": REFLECT_INDEX_STATS_SCHEMA,
             "outputs": _object(
                 properties={
                     "sessions_json": _string(),
@@ -1278,13 +1458,11 @@ CLI_REFLECT_SKILLS_RESPONSE_SCHEMA = _named(
             "command": _string(),
             "path": _string(),
             "output_dir": _string(),
-            "source": _object(
-                properties={"tool": _string(), "root": _string()},
-                required=["tool", "root"],
-            ),
+            "source": REFLECT_SOURCE_SCHEMA,
             "summary": REFLECT_SKILL_USAGE_PAYLOAD_SCHEMA["schema"]["properties"][
                 "summary"
             ],
+            "index": REFLECT_INDEX_STATS_SCHEMA,
             "outputs": _object(
                 properties={
                     "skill_usage_json": _string(),
@@ -1308,6 +1486,59 @@ CLI_REFLECT_SKILLS_RESPONSE_SCHEMA = _named(
 )
 
 
+CLI_REFLECT_ALL_RESPONSE_SCHEMA = _named(
+    "cli-reflect-all-response",
+    1,
+    _object(
+        properties={
+            "version": _integer(),
+            "command": _string(),
+            "path": _string(),
+            "output_dir": _string(),
+            "source": REFLECT_SOURCE_SCHEMA,
+            "summary": _object(
+                properties={
+                    "sessions": REFLECT_SIGNALS_PAYLOAD_SCHEMA["schema"]["properties"][
+                        "summary"
+                    ],
+                    "skills": REFLECT_SKILL_USAGE_PAYLOAD_SCHEMA["schema"][
+                        "properties"
+                    ]["summary"],
+                },
+                required=["sessions", "skills"],
+            ),
+            "index": REFLECT_INDEX_STATS_SCHEMA,
+            "outputs": _object(
+                properties={
+                    "sessions_json": _string(),
+                    "signals_json": _string(),
+                    "patterns_md": _string(),
+                    "skill_usage_json": _string(),
+                    "skill_effectiveness_md": _string(),
+                },
+                required=[
+                    "sessions_json",
+                    "signals_json",
+                    "patterns_md",
+                    "skill_usage_json",
+                    "skill_effectiveness_md",
+                ],
+            ),
+            "results": _array(FILE_RESULT_SCHEMA["schema"]),
+        },
+        required=[
+            "version",
+            "command",
+            "path",
+            "output_dir",
+            "source",
+            "summary",
+            "outputs",
+            "results",
+        ],
+    ),
+)
+
 LLM_OPTIONS_SCHEMA = _named(
     "llm-options",
     1,
@@ -1339,6 +1570,7 @@ LLM_ENHANCEMENT_RESULT_SCHEMA = _named(
             "applied": _boolean(),
             "sections": _object(properties={}, required=[]),
             "message": _string(),
+            "section_latency_ms": _object(properties={}, required=[]),
         },
         required=["provider", "applied", "sections", "message"],
     ),
@@ -1404,9 +1636,48 @@ MCP_DETECT_RESPONSE_SCHEMA = _named(
 )
 
 
+MCP_CACHE_STATS_RESPONSE_SCHEMA = _named(
+    "mcp-cache-stats-response",
+    1,
+    _object(
+        properties={
+            "version": _integer(),
+            "tool": _string(),
+            "result": _object(
+                properties={
+                    "repos_count": _integer(),
+                    "max_repos": _integer(),
+                    "hits": _integer(),
+                    "misses": _integer(),
+                    "invalidations": _integer(),
+                    "repos": _array(
+                        _object(
+                            properties={
+                                "path": _string(),
+                                "keys": _array(_string()),
+                            },
+                            required=["path", "keys"],
+                        )
+                    ),
+                },
+                required=[
+                    "repos_count",
+                    "max_repos",
+                    "hits",
+                    "misses",
+                    "invalidations",
+                    "repos",
+                ],
+            ),
+        },
+        required=["version", "tool", "result"],
+    ),
+)
+
+
 MCP_UNDERSTAND_RESPONSE_SCHEMA = _named(
     "mcp-understand-response",
-    1,
+    2,
     _object(
         properties={
             "version": _integer(),
@@ -1414,7 +1685,28 @@ MCP_UNDERSTAND_RESPONSE_SCHEMA = _named(
             "path": _string(),
             "output_dir": _string(),
             "compact_budget_tokens": _integer(),
-            "result": UNDERSTAND_PAYLOAD_SCHEMA["schema"],
+            "page": _object(
+                properties={
+                    "fields": _array(_string()),
+                    "cursor": _string(nullable=True),
+                    "next_cursor": _string(nullable=True),
+                    "page_size": _integer(),
+                    "files_total": _integer(),
+                    "edges_total": _integer(),
+                },
+                required=[
+                    "fields",
+                    "cursor",
+                    "next_cursor",
+                    "page_size",
+                    "files_total",
+                    "edges_total",
+                ],
+            ),
+            "result": _object(
+                properties=dict(UNDERSTAND_PAYLOAD_SCHEMA["schema"]["properties"]),
+                required=["stack", "knowledge", "summary"],
+            ),
         },
         required=[
             "version",
@@ -1541,9 +1833,11 @@ MCP_PACK_RESPONSE_SCHEMA = _named(
 SCHEMAS: dict[str, Schema] = {
     "analysis_payload": ANALYSIS_PAYLOAD_SCHEMA,
     "cli_analyze_response": CLI_ANALYZE_RESPONSE_SCHEMA,
+    "cli_batch_response": CLI_BATCH_RESPONSE_SCHEMA,
     "cli_meta_response": CLI_META_RESPONSE_SCHEMA,
     "cli_pack_plan_response": CLI_PACK_PLAN_RESPONSE_SCHEMA,
     "cli_pack_response": CLI_PACK_RESPONSE_SCHEMA,
+    "cli_reflect_all_response": CLI_REFLECT_ALL_RESPONSE_SCHEMA,
     "cli_reflect_sessions_response": CLI_REFLECT_SESSIONS_RESPONSE_SCHEMA,
     "cli_reflect_skills_response": CLI_REFLECT_SKILLS_RESPONSE_SCHEMA,
     "cli_task_response": CLI_TASK_RESPONSE_SCHEMA,
@@ -1552,6 +1846,7 @@ SCHEMAS: dict[str, Schema] = {
     "entrypoints": ENTRYPOINTS_SCHEMA,
     "file_result": FILE_RESULT_SCHEMA,
     "fleet_scan_report": FLEET_SCAN_REPORT_SCHEMA,
+    "fleet_understand_report": FLEET_UNDERSTAND_REPORT_SCHEMA,
     "knowledge": KNOWLEDGE_SCHEMA,
     "reflect_skill_usage_payload": REFLECT_SKILL_USAGE_PAYLOAD_SCHEMA,
     "reflect_sessions_payload": REFLECT_SESSION_PAYLOAD_SCHEMA,
@@ -1561,6 +1856,7 @@ SCHEMAS: dict[str, Schema] = {
     "write_policy": WRITE_POLICY_SCHEMA,
     "id_context": ID_CONTEXT_SCHEMA,
     "metadata_payload": METADATA_PAYLOAD_SCHEMA,
+    "mcp_cache_stats_response": MCP_CACHE_STATS_RESPONSE_SCHEMA,
     "mcp_check_response": MCP_CHECK_RESPONSE_SCHEMA,
     "mcp_detect_response": MCP_DETECT_RESPONSE_SCHEMA,
     "mcp_init_response": MCP_INIT_RESPONSE_SCHEMA,
@@ -1570,6 +1866,7 @@ SCHEMAS: dict[str, Schema] = {
     "mcp_update_response": MCP_UPDATE_RESPONSE_SCHEMA,
     "task_contract": TASK_CONTRACT_SCHEMA,
     "task_evidence": TASK_EVIDENCE_SCHEMA,
+    "task_index": TASK_INDEX_SCHEMA,
     "task_verdict": TASK_VERDICT_SCHEMA,
     "aggregated_check": AGGREGATED_CHECK_SCHEMA,
     "repo_status": REPO_STATUS_SCHEMA,
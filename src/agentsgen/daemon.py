@@ -0,0 +1,426 @@
+from __future__ import annotations
+
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+import time
+import traceback
+from collections.abc import Callable
+from contextlib import redirect_stderr, redirect_stdout
+from pathlib import Path
+from typing import IO, Any, BinaryIO
+
+from . import __version__
+
+# Kept free of typer/rich imports: the launcher imports this module on every
+# CLI run before deciding whether to load the full CLI at all.
+
+DAEMON_PROTOCOL_VERSION = 2
+DEFAULT_IDLE_TIMEOUT_SECONDS = 900
+# Commands that never prompt or read stdin, so they can run inside the daemon.
+FORWARDED_COMMANDS = frozenset(
+    {
+        "check",
+        "detect",
+        "doctor",
+        "okf",
+        "pack",
+        "snippets",
+        "status",
+        "task",
+        "understand",
+        "update",
+    }
+)
+# Subcommands that can run for minutes; forwarding them would hold the
+# single-threaded daemon and stall every other client behind them.
+LONG_RUNNING_COMMANDS = frozenset({("task", "run-checks")})
+_CONNECT_TIMEOUT_SECONDS = 0.5
+# How long a client waits for a busy daemon before running in-process.
+_READY_TIMEOUT_SECONDS = 1.0
+# How long the daemon waits for a connected client to send its request.
+_REQUEST_TIMEOUT_SECONDS = 5.0
+_MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+
+def default_socket_path() -> Path:
+    override = os.environ.get("AGENTSGEN_SOCKET")
+    if override:
+        return Path(override)
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "agentsgen" / "daemon.sock"
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "agentsgen" / "daemon.sock"
+
+
+def is_forwarded(argv: list[str]) -> bool:
+    """Whether the daemon runs this invocation (and not the client itself)."""
+    if not argv or argv[0] not in FORWARDED_COMMANDS:
+        return False
+    subcommand = next((arg for arg in argv[1:] if not arg.startswith("-")), "")
+    return (argv[0], subcommand) not in LONG_RUNNING_COMMANDS
+
+
+def _send(sock: socket.socket, payload: dict[str, Any]) -> None:
+    sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+
+
+def _receive(stream: BinaryIO) -> dict[str, Any] | None:
+    line = stream.readline(_MAX_MESSAGE_BYTES + 1)
+    if not line.endswith(b"\n"):
+        return None
+    try:
+        payload = json.loads(line.decode("utf-8"))
+    except (UnicodeDecodeError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _listening(path: Path) -> bool:
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(path))
+    except OSError:
+        return False
+    return True
+
+
+def daemon_request(
+    payload: dict[str, Any],
+    *,
+    socket_path: Path | None = None,
+    on_output: Callable[[str, str], None] | None = None,
+) -> dict[str, Any] | None:
+    """Send one request to a running daemon and return its final reply.
+
+    Output frames streamed before the reply go to ``on_output(stream,
+    text)`` as they arrive. ``None`` when no daemon answers, or when the
+    daemon is still busy with another client after ``_READY_TIMEOUT_SECONDS``.
+    """
+    path = socket_path or default_socket_path()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    message = {
+        "protocol": DAEMON_PROTOCOL_VERSION,
+        "agentsgen_version": __version__,
+        **payload,
+    }
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(_CONNECT_TIMEOUT_SECONDS)
+            sock.connect(str(path))
+            stream = sock.makefile("rb")
+            # The daemon greets each connection when it picks it up; a
+            # client that gives up first never sends its request, so the
+            # daemon never runs it.
+            sock.settimeout(_READY_TIMEOUT_SECONDS)
+            greeting = _receive(stream)
+            if greeting is None or greeting.get("status") != "ready":
+                return None
+            sock.settimeout(None)
+            _send(sock, message)
+            while True:
+                reply = _receive(stream)
+                if reply is None or reply.get("status") != "output":
+                    return reply
+                if on_output is not None:
+                    on_output(str(reply.get("stream")), str(reply.get("data", "")))
+    except OSError:
+        return None
+
+
+def forward_command(argv: list[str], *, socket_path: Path | None = None) -> int | None:
+    """Run a CLI invocation in the daemon, streaming its output here.
+
+    Returns the exit code, or ``None`` when the command should run
+    in-process instead: no daemon, a busy daemon, a daemon from another
+    version, a command that is not forwarded, or ``AGENTSGEN_NO_DAEMON`` set.
+    """
+    if os.environ.get("AGENTSGEN_NO_DAEMON") or not is_forwarded(argv):
+        return None
+    streams = {"stdout": sys.stdout, "stderr": sys.stderr}
+    written = False
+
+    def write(name: str, text: str) -> None:
+        nonlocal written
+        written = True
+        stream = streams.get(name, sys.stderr)
+        stream.write(text)
+        stream.flush()
+
+    response = daemon_request(
+        {
+            "op": "run",
+            "argv": list(argv),
+            "cwd": os.getcwd(),
+            "env": dict(os.environ),
+            "terminal": {
+                "stdout": sys.stdout.isatty(),
+                "stderr": sys.stderr.isatty(),
+                "columns": shutil.get_terminal_size().columns
+                if sys.stdout.isatty()
+                else None,
+            },
+        },
+        socket_path=socket_path,
+        on_output=write,
+    )
+    if response is None or response.get("status") != "ok":
+        if not written:
+            return None
+        # Output has already been replayed, so running again would repeat it.
+        write("stderr", "ERROR: lost connection to the agentsgen daemon\n")
+        return 1
+    exit_code = response.get("exit_code", 1)
+    return exit_code if isinstance(exit_code, int) else 1
+
+
+def _exit_code(exc: SystemExit, stderr: IO[str]) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    stderr.write(f"{exc.code}\n")
+    return 1
+
+
+def run_cli(
+    argv: list[str],
+    stdout: IO[str],
+    stderr: IO[str],
+    *,
+    stdout_tty: bool = False,
+    stderr_tty: bool = False,
+    width: int | None = None,
+) -> int:
+    """Run one CLI invocation in this process with its output redirected.
+
+    Rich output is rendered for the given terminal rather than this
+    process's: colour only when ``stdout_tty``/``stderr_tty`` say the
+    client's stream is a terminal.
+    """
+    from .cli import app
+    from .cli_support import client_consoles
+
+    with (
+        redirect_stdout(stdout),
+        redirect_stderr(stderr),
+        client_consoles(stdout_tty=stdout_tty, stderr_tty=stderr_tty, width=width),
+    ):
+        try:
+            app(args=argv, prog_name="agentsgen")
+            return 0
+        except SystemExit as exc:
+            return _exit_code(exc, stderr)
+        except Exception:
+            traceback.print_exc(file=stderr)
+            return 1
+
+
+def run_cli_captured(argv: list[str]) -> tuple[int, str, str]:
+    """Run one CLI invocation in this process; ``(exit_code, stdout, stderr)``.
+
+    Output is rendered for a non-terminal, so it never carries colour codes.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    exit_code = run_cli(argv, stdout, stderr)
+    return exit_code, stdout.getvalue(), stderr.getvalue()
+
+
+class _FrameWriter(io.StringIO):
+    """A text stream that sends every write to the client as an output frame."""
+
+    def __init__(self, emit: Callable[[dict[str, Any]], None], name: str):
+        super().__init__()
+        self._emit = emit
+        self._name = name
+
+    def write(self, text: str) -> int:
+        if text:
+            self._emit({"status": "output", "stream": self._name, "data": text})
+        return len(text)
+
+
+class AgentsgenDaemon:
+    """Serves forwarded CLI runs on a Unix socket with warm per-repo state.
+
+    Requests run one at a time in this process, so modules and validators
+    stay loaded, and detection and import scans are reused through a
+    ``RepoCache``. Each run gets its own ``render_memo``, so the memo stays
+    bounded and edited templates are picked up by the next run. Each run
+    fingerprints the repos it touches, so edited files invalidate their
+    repo's entries before the next run uses them. Output is streamed back
+    as it is written, rendered for the client's terminal. The daemon exits
+    after ``idle_timeout_seconds`` without a request.
+    """
+
+    def __init__(
+        self,
+        socket_path: Path,
+        *,
+        idle_timeout_seconds: float = DEFAULT_IDLE_TIMEOUT_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        from .repo_cache import RepoCache
+
+        self.socket_path = socket_path
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self.cache = RepoCache()
+        self.requests = 0
+        self._clock = clock
+        self._stopping = False
+
+    def _bind(self) -> socket.socket:
+        if not hasattr(socket, "AF_UNIX"):
+            raise RuntimeError("agentsgen serve needs Unix domain sockets.")
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        if self.socket_path.exists():
+            # A busy daemon may not answer a ping in time; any daemon that
+            # accepts connections still owns the socket.
+            if _listening(self.socket_path):
+                raise RuntimeError(
+                    f"An agentsgen daemon is already listening on {self.socket_path}."
+                )
+            self.socket_path.unlink()
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            sock.bind(str(self.socket_path))
+            os.chmod(self.socket_path, 0o600)
+            sock.listen(16)
+        except OSError:
+            sock.close()
+            raise
+        return sock
+
+    def serve_forever(self) -> None:
+        sock = self._bind()
+        last_request = self._clock()
+        try:
+            while not self._stopping:
+                remaining = self.idle_timeout_seconds - (self._clock() - last_request)
+                if remaining <= 0:
+                    break
+                sock.settimeout(remaining)
+                try:
+                    conn, _addr = sock.accept()
+                except socket.timeout:
+                    continue
+                with conn:
+                    self._serve_connection(conn)
+                last_request = self._clock()
+        finally:
+            sock.close()
+            self.socket_path.unlink(missing_ok=True)
+
+    def _serve_connection(self, conn: socket.socket) -> None:
+        try:
+            conn.settimeout(_REQUEST_TIMEOUT_SECONDS)
+            _send(conn, {"status": "ready"})
+            request = _receive(conn.makefile("rb"))
+            conn.settimeout(None)
+        except OSError:
+            return
+        if request is None:
+            # The client gave up waiting, or never sent a request.
+            return
+        connected = True
+
+        def emit(payload: dict[str, Any]) -> None:
+            nonlocal connected
+            if not connected:
+                return
+            try:
+                _send(conn, payload)
+            except OSError:
+                connected = False
+
+        emit(self.handle(request, emit))
+
+    def handle(
+        self,
+        request: dict[str, Any],
+        emit: Callable[[dict[str, Any]], None] | None = None,
+    ) -> dict[str, Any]:
+        """Answer one request; a run streams its output frames to ``emit``."""
+        if (
+            request.get("protocol") != DAEMON_PROTOCOL_VERSION
+            or request.get("agentsgen_version") != __version__
+        ):
+            return {"status": "rejected", "reason": "version mismatch"}
+        op = request.get("op")
+        if op == "ping":
+            return {
+                "status": "ok",
+                "pid": os.getpid(),
+                "requests": self.requests,
+                "cache": self.cache.stats(),
+            }
+        if op == "shutdown":
+            self._stopping = True
+            return {"status": "ok"}
+        if op == "run":
+            argv = request.get("argv")
+            cwd = request.get("cwd")
+            env = request.get("env")
+            terminal = request.get("terminal", {})
+            if (
+                isinstance(argv, list)
+                and is_forwarded([str(item) for item in argv])
+                and isinstance(cwd, str)
+                and isinstance(env, dict)
+                and isinstance(terminal, dict)
+            ):
+                return self._run(
+                    [str(item) for item in argv],
+                    cwd,
+                    env,
+                    terminal,
+                    emit or (lambda _payload: None),
+                )
+        return {"status": "rejected", "reason": "unsupported request"}
+
+    def _run(
+        self,
+        argv: list[str],
+        cwd: str,
+        env: dict[str, Any],
+        terminal: dict[str, Any],
+        emit: Callable[[dict[str, Any]], None],
+    ) -> dict[str, Any]:
+        from .render_memo import render_memo
+        from .repo_cache import repo_cache_scope
+
+        self.requests += 1
+        stdout = _FrameWriter(emit, "stdout")
+        stderr = _FrameWriter(emit, "stderr")
+        columns = terminal.get("columns")
+        saved_env = dict(os.environ)
+        saved_cwd = os.getcwd()
+        try:
+            # The client's environment and cwd apply for exactly this run.
+            os.environ.clear()
+            os.environ.update({str(key): str(value) for key, value in env.items()})
+            os.chdir(cwd)
+            # A memo per run: it stays bounded and re-reads edited templates.
+            with repo_cache_scope(self.cache), render_memo():
+                exit_code = run_cli(
+                    argv,
+                    stdout,
+                    stderr,
+                    stdout_tty=terminal.get("stdout") is True,
+                    stderr_tty=terminal.get("stderr") is True,
+                    width=columns if isinstance(columns, int) and columns > 0 else None,
+                )
+        except OSError as exc:
+            stderr.write(f"ERROR: {exc}\n")
+            exit_code = 1
+        finally:
+            os.environ.clear()
+            os.environ.update(saved_env)
+            os.chdir(saved_cwd)
+        return {"status": "ok", "exit_code": exit_code}
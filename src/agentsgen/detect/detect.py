@@ -2,6 +2,7 @@ from __future__ import annotations
 
 from pathlib import Path
 
+from ..repo_cache import cached_for_repo
 from .github import detect_github_actions
 from .makefile import parse_makefile_targets
 from .model import DetectResult
@@ -57,6 +58,10 @@ def _detect_stack(py: bool, node: bool) -> str:
 
 
 def detect_repo(repo: Path) -> DetectResult:
+    return cached_for_repo(repo, "detect", lambda: _detect_repo(repo), copy_value=True)
+
+
+def _detect_repo(repo: Path) -> DetectResult:
     repo = repo.resolve()
     res = DetectResult()
 
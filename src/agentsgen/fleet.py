@@ -2,13 +2,22 @@ from __future__ import annotations
 
 import datetime as dt
 import json
+import os
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
 from .actions import apply_config, load_tool_config
 from .config import ToolConfig
 from .detect import detect_repo
-from .validators import validate_fleet_scan_report_payload
+from .render_memo import render_memo
+from .understand_context import apply_understanding
+from .validators import (
+    validate_fleet_scan_report_payload,
+    validate_fleet_understand_report_payload,
+)
 
 
 SKIP_DIRS = {
@@ -135,7 +144,9 @@ def build_fleet_scan_report(
     timestamp: str | None = None,
 ) -> dict[str, Any]:
     resolved_roots = [root.expanduser().resolve() for root in roots]
-    repos = [scan_repo(repo) for repo in iter_git_repos(resolved_roots, max_depth)]
+    # Repos built from a shared preset render identical templates; reuse them.
+    with render_memo():
+        repos = [scan_repo(repo) for repo in iter_git_repos(resolved_roots, max_depth)]
     summary = {
         "repos_count": len(repos),
         "failed_count": sum(1 for row in repos if row["errors"]),
@@ -213,8 +224,9 @@ def render_fleet_scan_markdown(report: dict[str, Any]) -> str:
     return "\n".join(lines) + "\n"
 
 
-def write_fleet_scan_outputs(
+def _write_report_outputs(
     report: dict[str, Any],
+    render_markdown: Callable[[dict[str, Any]], str],
     *,
     markdown_path: Path | None,
     json_path: Path | None,
@@ -222,10 +234,202 @@ def write_fleet_scan_outputs(
     written: list[Path] = []
     if markdown_path is not None:
         markdown_path.parent.mkdir(parents=True, exist_ok=True)
-        markdown_path.write_text(render_fleet_scan_markdown(report), encoding="utf-8")
+        markdown_path.write_text(render_markdown(report), encoding="utf-8")
         written.append(markdown_path)
     if json_path is not None:
         json_path.parent.mkdir(parents=True, exist_ok=True)
         json_path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
         written.append(json_path)
     return written
+
+
+def write_fleet_scan_outputs(
+    report: dict[str, Any],
+    *,
+    markdown_path: Path | None,
+    json_path: Path | None,
+) -> list[Path]:
+    return _write_report_outputs(
+        report,
+        render_fleet_scan_markdown,
+        markdown_path=markdown_path,
+        json_path=json_path,
+    )
+
+
+def _warm_understand_worker() -> None:
+    # Runs once per pool worker: load the schema catalog and the understand
+    # pipeline up front so every repo handled by the worker reuses them.
+    from . import contracts, understand_ast, understand_context  # noqa: F401
+
+    contracts.schema_snapshots()
+
+
+def understand_repo(
+    repo: Path,
+    *,
+    output_dir: str = "docs/ai",
+    compact_budget_tokens: int = 4000,
+    top_modules: int = 5,
+    dry_run: bool = False,
+) -> dict[str, Any]:
+    row: dict[str, Any] = {
+        "repo": str(repo.resolve()),
+        "stack": "unknown",
+        "files_count": 0,
+        "edges_count": 0,
+        "entrypoints_count": 0,
+        "top_modules": [],
+        "results": [],
+        "changed_count": 0,
+        "errors": [],
+    }
+
+    out_dir = Path(output_dir)
+    if not out_dir.is_absolute():
+        out_dir = repo / out_dir
+    try:
+        results, payload = apply_understanding(
+            repo,
+            output_dir=out_dir,
+            compact_budget_tokens=compact_budget_tokens,
+            dry_run=dry_run,
+        )
+        summary = payload["summary"]
+        knowledge = payload["knowledge"]
+        if not isinstance(summary, dict) or not isinstance(knowledge, dict):
+            raise ValueError("understand payload is missing summary or knowledge")
+        row["stack"] = str(payload["stack"])
+        row["files_count"] = int(summary["files_count"])
+        row["edges_count"] = int(summary["edges_count"])
+        row["entrypoints_count"] = int(summary["entrypoints_count"])
+        row["top_modules"] = [
+            str(item["path"]) for item in knowledge.get("relevance", [])[:top_modules]
+        ]
+        row["results"] = _result_payload(results)
+        row["changed_count"] = sum(1 for result in results if result.changed)
+        row["errors"].extend(
+            f"{result.path}: {result.message}"
+            for result in results
+            if result.action == "error"
+        )
+    except Exception as exc:
+        row["errors"].append(f"{type(exc).__name__}: {exc}")
+    return row
+
+
+def _pool_size(jobs: int, repos_count: int) -> int:
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, repos_count))
+
+
+def build_fleet_understand_report(
+    roots: list[Path],
+    *,
+    max_depth: int,
+    jobs: int = 0,
+    output_dir: str = "docs/ai",
+    compact_budget_tokens: int = 4000,
+    top_modules: int = 5,
+    dry_run: bool = False,
+    timestamp: str | None = None,
+) -> dict[str, Any]:
+    resolved_roots = [root.expanduser().resolve() for root in roots]
+    repo_paths = iter_git_repos(resolved_roots, max_depth)
+    worker = partial(
+        understand_repo,
+        output_dir=output_dir,
+        compact_budget_tokens=compact_budget_tokens,
+        top_modules=top_modules,
+        dry_run=dry_run,
+    )
+    workers = _pool_size(jobs, len(repo_paths))
+    if workers == 1:
+        repos = [worker(repo) for repo in repo_paths]
+    else:
+        chunksize = max(1, len(repo_paths) // (workers * 4))
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_warm_understand_worker
+        ) as pool:
+            repos = list(pool.map(worker, repo_paths, chunksize=chunksize))
+
+    summary = {
+        "repos_count": len(repos),
+        "failed_count": sum(1 for row in repos if row["errors"]),
+        "files_count": sum(int(row["files_count"]) for row in repos),
+        "edges_count": sum(int(row["edges_count"]) for row in repos),
+        "changed_count": sum(int(row["changed_count"]) for row in repos),
+    }
+    payload = {
+        "version": 1,
+        "command": "fleet understand",
+        "meta": {
+            "timestamp": timestamp
+            or dt.datetime.now(dt.timezone.utc).isoformat(timespec="seconds"),
+            "roots": [str(root) for root in resolved_roots],
+            "max_depth": max_depth,
+            "jobs": workers if repo_paths else 0,
+            "output_dir": output_dir,
+            "compact_budget_tokens": compact_budget_tokens,
+            "dry_run": dry_run,
+        },
+        "summary": summary,
+        "repos": repos,
+    }
+    validate_fleet_understand_report_payload(payload)
+    return payload
+
+
+def render_fleet_understand_markdown(report: dict[str, Any]) -> str:
+    meta = report["meta"]
+    summary = report["summary"]
+    lines = [
+        "# agentsgen fleet understand",
+        "",
+        f"Generated at: `{meta['timestamp']}`",
+        f"Roots: {', '.join('`' + root + '`' for root in meta['roots'])}",
+        f"Max depth: `{meta['max_depth']}`",
+        f"Output dir: `{meta['output_dir']}`"
+        + (" (dry run)" if meta["dry_run"] else ""),
+        "",
+        f"- Total repos: **{summary['repos_count']}**",
+        f"- Failed repos: **{summary['failed_count']}**",
+        f"- Files mapped: **{summary['files_count']}**",
+        f"- Import edges: **{summary['edges_count']}**",
+        f"- Changed artifacts: **{summary['changed_count']}**",
+        "",
+        "| repo | stack | files | edges | changed | top modules | errors |",
+        "|---|---|---:|---:|---:|---|---|",
+    ]
+    for row in report["repos"]:
+        lines.append(
+            "| "
+            + " | ".join(
+                [
+                    f"`{row['repo']}`",
+                    row["stack"],
+                    str(row["files_count"]),
+                    str(row["edges_count"]),
+                    str(row["changed_count"]),
+                    ", ".join(f"`{path}`" for path in row["top_modules"]),
+                    "; ".join(row["errors"]),
+                ]
+            )
+            + " |"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def write_fleet_understand_outputs(
+    report: dict[str, Any],
+    *,
+    markdown_path: Path | None,
+    json_path: Path | None,
+) -> list[Path]:
+    return _write_report_outputs(
+        report,
+        render_fleet_understand_markdown,
+        markdown_path=markdown_path,
+        json_path=json_path,
+    )
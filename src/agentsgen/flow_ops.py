@@ -126,6 +126,7 @@ def run_init_flow(
         dry_run=dry_run,
         print_diff=print_diff,
         llm_provider=normalized_llm.provider if normalized_llm.enabled else "",
+        llm_options=normalized_llm,
     )
     return InitFlowResult(
         config=cfg,
@@ -148,6 +149,7 @@ def run_update_flow(
         dry_run=dry_run,
         print_diff=print_diff,
         llm_provider=normalized_llm.provider if normalized_llm.enabled else "",
+        llm_options=normalized_llm,
     )
 
 
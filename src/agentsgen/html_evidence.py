@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+from html.parser import HTMLParser
+
+SEMANTIC_TAGS = frozenset({"main", "article", "section", "nav", "header", "footer"})
+HEADING_TAGS = frozenset({"h1", "h2", "h3", "h4", "h5", "h6"})
+TEXT_SAMPLE_CHARS = 5000
+_TITLE_MAX_CHARS = 1000
+_SKIPPED_TEXT_TAGS = frozenset({"script", "style"})
+
+
+class HtmlEvidence(HTMLParser):
+    """Collects the page signals ``analyze`` scores, in one pass over the HTML.
+
+    Feed the document in chunks as it arrives, then ``close()``. Only counters,
+    the first title and meta description, and a whitespace-collapsed sample
+    of the visible text (``text_chars`` long at most) are kept.
+    """
+
+    def __init__(self, *, text_chars: int = TEXT_SAMPLE_CHARS):
+        super().__init__(convert_charrefs=True)
+        self.title = ""
+        self.meta_description = ""
+        self.headings_count = 0
+        self.semantic_tags_count = 0
+        self.json_ld_present = False
+        self.word_count = 0
+        self._text_chars = text_chars
+        self._text: list[str] = []
+        self._text_len = 0
+        self._carry = ""
+        self._title_parts: list[str] | None = None
+        self._title_seen = False
+        self._skipping = ""
+
+    @property
+    def text_sample(self) -> str:
+        return " ".join(self._text)[: self._text_chars]
+
+    def handle_starttag(self, tag: str, attrs: list[tuple[str, str | None]]) -> None:
+        self._flush_word()
+        if tag in HEADING_TAGS:
+            self.headings_count += 1
+        elif tag in SEMANTIC_TAGS:
+            self.semantic_tags_count += 1
+        elif tag in _SKIPPED_TEXT_TAGS:
+            self._skipping = tag
+            if tag == "script" and not self.json_ld_present:
+                kind = dict(attrs).get("type") or ""
+                self.json_ld_present = kind.strip().lower() == "application/ld+json"
+        elif tag == "title" and not self._title_seen:
+            self._title_parts = []
+        elif tag == "meta" and not self.meta_description:
+            values = dict(attrs)
+            if (values.get("name") or "").strip().lower() == "description":
+                self.meta_description = " ".join((values.get("content") or "").split())
+
+    def handle_endtag(self, tag: str) -> None:
+        self._flush_word()
+        if tag == self._skipping:
+            self._skipping = ""
+        elif tag == "title" and self._title_parts is not None:
+            self.title = " ".join("".join(self._title_parts).split())
+            self._title_parts = None
+            self._title_seen = True
+
+    def handle_comment(self, data: str) -> None:
+        del data
+        self._flush_word()
+
+    def close(self) -> None:
+        super().close()
+        self._flush_word()
+        if self._title_parts is not None:
+            self.handle_endtag("title")
+
+    def handle_data(self, data: str) -> None:
+        if self._skipping:
+            return
+        if self._title_parts is not None and sum(map(len, self._title_parts)) < (
+            _TITLE_MAX_CHARS
+        ):
+            self._title_parts.append(data)
+        # Text may arrive split mid-word at chunk boundaries; hold back the
+        # trailing fragment until more text or the next tag arrives.
+        text = self._carry + data
+        words = text.split()
+        self._carry = words.pop() if words and not text[-1].isspace() else ""
+        self._add_words(words)
+
+    def _flush_word(self) -> None:
+        if self._carry:
+            self._add_words([self._carry])
+            self._carry = ""
+
+    def _add_words(self, words: list[str]) -> None:
+        self.word_count += len(words)
+        if self._text_len < self._text_chars:
+            for word in words:
+                self._text.append(word)
+                self._text_len += len(word) + 1
+                if self._text_len >= self._text_chars:
+                    break
+
+
+def extract_html_evidence(
+    html: str, *, text_chars: int = TEXT_SAMPLE_CHARS
+) -> HtmlEvidence:
+    parser = HtmlEvidence(text_chars=text_chars)
+    parser.feed(html)
+    parser.close()
+    return parser
@@ -0,0 +1,384 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import http.client
+import json
+import os
+import ssl
+import threading
+import time
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from email.message import Message
+from pathlib import Path
+from urllib.parse import unquote, urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+from .io_utils import write_bytes_atomic, write_json_atomic
+
+USER_AGENT = "agentsgen/0.1 (+https://github.com/markoblogo/AGENTS.md_generator)"
+MAX_REDIRECTS = 5
+# Request starts per second against one host for the shared fetcher;
+# override with AGENTSGEN_HTTP_RATE_PER_HOST (0 disables spacing).
+DEFAULT_RATE_PER_HOST = 8.0
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+
+class FetchError(OSError):
+    """A request failed at the transport level or returned an error status."""
+
+    def __init__(self, url: str, message: str, *, status: int = 0):
+        super().__init__(f"{url}: {message}")
+        self.url = url
+        self.status = status
+
+
+@dataclass(frozen=True)
+class HttpResponse:
+    url: str
+    status: int
+    headers: dict[str, str]
+    body: bytes
+    from_cache: bool = False
+
+    def text(self) -> str:
+        message = Message()
+        message["content-type"] = self.headers.get("content-type", "")
+        charset = message.get_content_charset() or "utf-8"
+        try:
+            return self.body.decode(charset, errors="replace")
+        except LookupError:
+            return self.body.decode("utf-8", errors="replace")
+
+
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "agentsgen" / "http"
+
+
+class ResponseCache:
+    """On-disk bodies plus validators (ETag / Last-Modified) keyed by URL.
+
+    Best-effort: an unreadable or unwritable cache directory only means
+    responses are not cached.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    def _paths(self, url: str) -> tuple[Path, Path]:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        base = self.root / digest[:2] / digest
+        return base.with_suffix(".json"), base.with_suffix(".body")
+
+    def load(self, url: str) -> tuple[dict[str, object], bytes] | None:
+        meta_path, body_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        if not isinstance(meta, dict) or meta.get("url") != url:
+            return None
+        return meta, body
+
+    def store(self, response: HttpResponse, request_url: str) -> None:
+        etag = response.headers.get("etag", "")
+        last_modified = response.headers.get("last-modified", "")
+        if not (etag or last_modified):
+            return
+        meta_path, body_path = self._paths(request_url)
+        try:
+            write_bytes_atomic(body_path, response.body)
+            write_json_atomic(
+                meta_path,
+                {
+                    "url": request_url,
+                    "final_url": response.url,
+                    "status": response.status,
+                    "headers": response.headers,
+                    "etag": etag,
+                    "last_modified": last_modified,
+                },
+            )
+        except OSError:
+            return
+
+
+@dataclass(frozen=True)
+class _Proxy:
+    host: str
+    port: int
+    authorization: str = ""
+
+    def headers(self) -> dict[str, str]:
+        if not self.authorization:
+            return {}
+        return {"Proxy-Authorization": self.authorization}
+
+
+def _proxy_for(scheme: str, host: str) -> _Proxy | None:
+    """The proxy ``HTTP(S)_PROXY`` names for ``scheme``, unless ``NO_PROXY``
+    (or the platform's bypass list) exempts ``host``; as urlopen resolves it.
+    """
+    raw = getproxies().get(scheme, "")
+    if not raw or proxy_bypass(host):
+        return None
+    if "://" not in raw:
+        raw = f"http://{raw}"
+    parts = urlsplit(raw)
+    if not parts.hostname:
+        return None
+    authorization = ""
+    if parts.username is not None:
+        credentials = f"{unquote(parts.username)}:{unquote(parts.password or '')}"
+        token = base64.b64encode(credentials.encode("utf-8")).decode("ascii")
+        authorization = f"Basic {token}"
+    return _Proxy(parts.hostname, parts.port or 80, authorization)
+
+
+@dataclass
+class _HostPool:
+    slots: threading.BoundedSemaphore
+    idle: list[http.client.HTTPConnection] = field(default_factory=list)
+    lock: threading.Lock = field(default_factory=threading.Lock)
+    next_request_at: float = 0.0
+
+
+class HttpFetcher:
+    """GET-only client shared by analyze, meta and site packs.
+
+    Connections are kept alive and reused per host, at most
+    ``max_per_host`` requests run against one host at a time, request starts
+    per host are spaced by ``1 / rate_per_host`` seconds, and responses with
+    validators are cached on disk and revalidated with conditional requests.
+    """
+
+    def __init__(
+        self,
+        *,
+        cache_dir: Path | None = None,
+        max_workers: int = 8,
+        max_per_host: int = 4,
+        rate_per_host: float = 0.0,
+        timeout: float = 10.0,
+        user_agent: str = USER_AGENT,
+    ):
+        self.cache = ResponseCache(cache_dir) if cache_dir is not None else None
+        self.max_workers = max(1, max_workers)
+        self.max_per_host = max(1, max_per_host)
+        self.rate_per_host = rate_per_host
+        self.timeout = timeout
+        self.user_agent = user_agent
+        self.connections_opened = 0
+        self._hosts: dict[tuple[str, str, int, _Proxy | None], _HostPool] = {}
+        self._hosts_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def _host(self, key: tuple[str, str, int, _Proxy | None]) -> _HostPool:
+        with self._hosts_lock:
+            pool = self._hosts.get(key)
+            if pool is None:
+                pool = _HostPool(slots=threading.BoundedSemaphore(self.max_per_host))
+                self._hosts[key] = pool
+            return pool
+
+    def _wait_turn(self, pool: _HostPool) -> None:
+        if self.rate_per_host <= 0:
+            return
+        interval = 1.0 / self.rate_per_host
+        with pool.lock:
+            now = time.monotonic()
+            start = max(now, pool.next_request_at)
+            pool.next_request_at = start + interval
+        if start > now:
+            time.sleep(start - now)
+
+    def _connect(
+        self, scheme: str, host: str, port: int, proxy: _Proxy | None = None
+    ) -> http.client.HTTPConnection:
+        with self._hosts_lock:
+            self.connections_opened += 1
+        if scheme == "https":
+            if proxy is None:
+                return http.client.HTTPSConnection(
+                    host,
+                    port,
+                    timeout=self.timeout,
+                    context=ssl.create_default_context(),
+                )
+            # TLS runs end to end through a CONNECT tunnel to the origin.
+            conn = http.client.HTTPSConnection(
+                proxy.host,
+                proxy.port,
+                timeout=self.timeout,
+                context=ssl.create_default_context(),
+            )
+            conn.set_tunnel(host, port, headers=proxy.headers())
+            return conn
+        if proxy is not None:
+            return http.client.HTTPConnection(
+                proxy.host, proxy.port, timeout=self.timeout
+            )
+        return http.client.HTTPConnection(host, port, timeout=self.timeout)
+
+    def _request_once(
+        self, url: str, headers: dict[str, str]
+    ) -> tuple[int, dict[str, str], bytes]:
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in {"http", "https"} or not parts.hostname:
+            raise FetchError(url, "unsupported URL")
+        port = parts.port or (443 if scheme == "https" else 80)
+        proxy = _proxy_for(scheme, parts.hostname)
+        key = (scheme, parts.hostname, port, proxy)
+        target = parts.path or "/"
+        if parts.query:
+            target = f"{target}?{parts.query}"
+        if proxy is not None and scheme == "http":
+            # Plain HTTP proxies take the absolute URI as the request target.
+            target = f"http://{parts.netloc.rpartition('@')[2]}{target}"
+            headers = {**headers, **proxy.headers()}
+        pool = self._host(key)
+        with pool.slots:
+            self._wait_turn(pool)
+            for attempt in range(2):
+                with pool.lock:
+                    conn = pool.idle.pop() if pool.idle else None
+                reused = conn is not None
+                if conn is None:
+                    conn = self._connect(*key)
+                try:
+                    conn.request("GET", target, headers=headers)
+                    response = conn.getresponse()
+                    body = response.read()
+                except (http.client.HTTPException, OSError) as exc:
+                    conn.close()
+                    # A kept-alive socket may have been closed by the server
+                    # while idle; retry once on a fresh connection.
+                    if reused and attempt == 0:
+                        continue
+                    raise FetchError(url, str(exc) or type(exc).__name__) from exc
+                response_headers = {
+                    str(name).lower(): str(value)
+                    for name, value in response.getheaders()
+                }
+                if response.will_close:
+                    conn.close()
+                else:
+                    with pool.lock:
+                        pool.idle.append(conn)
+                return response.status, response_headers, body
+        raise FetchError(url, "connection failed")
+
+    def fetch(self, url: str) -> HttpResponse:
+        current = url
+        for _ in range(MAX_REDIRECTS + 1):
+            headers = {"User-Agent": self.user_agent, "Accept-Encoding": "identity"}
+            cached = self.cache.load(current) if self.cache is not None else None
+            if cached is not None:
+                meta = cached[0]
+                if meta.get("etag"):
+                    headers["If-None-Match"] = str(meta["etag"])
+                if meta.get("last_modified"):
+                    headers["If-Modified-Since"] = str(meta["last_modified"])
+            status, response_headers, body = self._request_once(current, headers)
+            if status in _REDIRECT_STATUSES and response_headers.get("location"):
+                current = urljoin(current, response_headers["location"])
+                continue
+            if status == 304 and cached is not None:
+                meta, cached_body = cached
+                stored_headers = meta.get("headers")
+                return HttpResponse(
+                    url=str(meta.get("final_url") or current),
+                    status=int(str(meta.get("status") or 200)),
+                    headers=dict(stored_headers)
+                    if isinstance(stored_headers, dict)
+                    else {},
+                    body=cached_body,
+                    from_cache=True,
+                )
+            if status >= 400:
+                raise FetchError(current, f"HTTP {status}", status=status)
+            response = HttpResponse(
+                url=current, status=status, headers=response_headers, body=body
+            )
+            if self.cache is not None and status == 200:
+                self.cache.store(response, current)
+            return response
+        raise FetchError(url, "too many redirects")
+
+    def executor(self) -> ThreadPoolExecutor:
+        """Bounded worker pool for running fetch-bound callables concurrently."""
+        with self._hosts_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="agentsgen-http"
+                )
+            return self._executor
+
+    def fetch_many(self, urls: Sequence[str]) -> list[HttpResponse | FetchError]:
+        """Fetch concurrently; results (or the error per URL) in input order."""
+        if not urls:
+            return []
+
+        def attempt(url: str) -> HttpResponse | FetchError:
+            try:
+                return self.fetch(url)
+            except FetchError as exc:
+                return exc
+
+        return list(self.executor().map(attempt, urls))
+
+    def close(self) -> None:
+        with self._hosts_lock:
+            pools = list(self._hosts.values())
+            self._hosts.clear()
+        for pool in pools:
+            with pool.lock:
+                for conn in pool.idle:
+                    conn.close()
+                pool.idle.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+_DEFAULT: HttpFetcher | None = None
+_DEFAULT_LOCK = threading.Lock()
+
+
+def _default_rate_per_host() -> float:
+    raw = os.environ.get("AGENTSGEN_HTTP_RATE_PER_HOST", "").strip()
+    if not raw:
+        return DEFAULT_RATE_PER_HOST
+    try:
+        return max(0.0, float(raw))
+    except ValueError:
+        return DEFAULT_RATE_PER_HOST
+
+
+def default_fetcher() -> HttpFetcher:
+    """Process-wide fetcher with the user-cache response cache.
+
+    ``AGENTSGEN_NO_HTTP_CACHE=1`` turns the response cache off and
+    ``AGENTSGEN_HTTP_RATE_PER_HOST`` sets the per-host request rate.
+    """
+    global _DEFAULT
+    cache_dir = (
+        None if os.environ.get("AGENTSGEN_NO_HTTP_CACHE") else default_cache_dir()
+    )
+    rate_per_host = _default_rate_per_host()
+    with _DEFAULT_LOCK:
+        if (
+            _DEFAULT is None
+            or (_DEFAULT.cache.root if _DEFAULT.cache is not None else None)
+            != cache_dir
+            or _DEFAULT.rate_per_host != rate_per_host
+        ):
+            if _DEFAULT is not None:
+                _DEFAULT.close()
+            _DEFAULT = HttpFetcher(cache_dir=cache_dir, rate_per_host=rate_per_host)
+        return _DEFAULT
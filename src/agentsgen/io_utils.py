@@ -26,6 +26,21 @@ def write_text_atomic(path: Path, content: str) -> None:
             pass
 
 
+def write_bytes_atomic(path: Path, content: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    fd, tmp = tempfile.mkstemp(prefix=f".{path.name}.", dir=str(path.parent))
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+        Path(tmp).replace(path)
+    finally:
+        try:
+            Path(tmp).unlink(missing_ok=True)
+        except Exception:
+            pass
+
+
 def read_json(path: Path) -> dict[str, Any]:
     return json.loads(read_text(path))
 
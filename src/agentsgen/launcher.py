@@ -0,0 +1,15 @@
+from __future__ import annotations
+
+import sys
+
+from .daemon import forward_command
+
+
+def main() -> None:
+    """Console entry point: delegate to a running daemon, else run in-process."""
+    exit_code = forward_command(sys.argv[1:])
+    if exit_code is not None:
+        raise SystemExit(exit_code)
+    from .cli import main as cli_main
+
+    cli_main()
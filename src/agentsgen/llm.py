@@ -1,15 +1,35 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import queue
+import threading
+import time
+from dataclasses import dataclass, field, replace
 from pathlib import Path
 from typing import Callable
 
+from .constants import (
+    AGENTS_FILENAME,
+    AGENTS_GENERATED_FILENAME,
+    RUNBOOK_FILENAME,
+    RUNBOOK_GENERATED_FILENAME,
+)
+from .llm_cache import cache_key, default_llm_cache, llm_cache_enabled
 from .validators import (
     validate_llm_enhancement_result_payload,
     validate_llm_options_payload,
 )
 
 
+ENHANCED_OUTPUTS = frozenset(
+    {
+        AGENTS_FILENAME,
+        AGENTS_GENERATED_FILENAME,
+        RUNBOOK_FILENAME,
+        RUNBOOK_GENERATED_FILENAME,
+    }
+)
+
+
 @dataclass(frozen=True)
 class LLMOptions:
     enabled: bool = False
@@ -67,6 +87,9 @@ class LLMEnhancementRequest:
     narrative_sections: tuple[str, ...] = field(
         default_factory=lambda: ("repo_context",)
     )
+    context: dict[str, object] | None = None
+    # Off with AGENTSGEN_NO_LLM_CACHE=1: every section calls the provider.
+    use_cache: bool = field(default_factory=llm_cache_enabled)
 
 
 @dataclass(frozen=True)
@@ -75,6 +98,7 @@ class LLMEnhancementResult:
     applied: bool
     sections: dict[str, str]
     message: str = ""
+    section_latency_ms: dict[str, int] = field(default_factory=dict)
 
     def to_json(self) -> dict[str, object]:
         payload: dict[str, object] = {
@@ -82,20 +106,60 @@ class LLMEnhancementResult:
             "applied": self.applied,
             "sections": dict(self.sections),
             "message": self.message,
+            "section_latency_ms": dict(self.section_latency_ms),
         }
         validate_llm_enhancement_result_payload(payload)
         return payload
 
 
 class LLMEnhancer:
+    # Bump when a provider's prompt or post-processing changes, so cached
+    # responses produced by the old template are not reused.
+    template_version = 1
+    # Smallest repo context the enhancer needs; see llm_context.CONTEXT_TIERS.
+    context_tier = "understand"
+
     def enhance(self, request: LLMEnhancementRequest) -> LLMEnhancementResult:
         raise NotImplementedError
 
 
-def build_repo_context(target: Path) -> dict[str, object]:
-    from .understand_context import build_understanding_payload
+def build_repo_context(target: Path, tier: str = "understand") -> dict[str, object]:
+    from .llm_context import build_tiered_context
+
+    return build_tiered_context(target, tier)
+
+
+def request_context(
+    request: LLMEnhancementRequest, *, tier: str = "understand"
+) -> dict[str, object]:
+    if request.context is not None:
+        return request.context
+    return build_repo_context(request.target, tier)
+
+
+def _cache_context(context: dict[str, object]) -> dict[str, object]:
+    """What identifies an enhancement: the repo knowledge (files, edges,
+    entrypoints), minus the files enhancement itself rewrites, so applying a
+    cached narrative does not invalidate it on the next run."""
+    knowledge = context.get("knowledge")
+    if not isinstance(knowledge, dict):
+        return {"stack": context.get("stack"), "context": context}
 
-    return build_understanding_payload(target, output_dir=target / "docs" / "ai")
+    def rows(name: str, *fields: str) -> list[object]:
+        value = knowledge.get(name)
+        return [
+            row
+            for row in (value if isinstance(value, list) else [])
+            if not isinstance(row, dict)
+            or not any(row.get(field) in ENHANCED_OUTPUTS for field in fields)
+        ]
+
+    return {
+        "stack": context.get("stack"),
+        "files": rows("files", "path"),
+        "edges": rows("edges", "from", "to"),
+        "entrypoints": rows("entrypoints"),
+    }
 
 
 EnhancerFactory = Callable[[], LLMEnhancer]
@@ -113,9 +177,16 @@ def _anthropic_factory() -> LLMEnhancer:
     return AnthropicEnhancer()
 
 
+def _stub_factory() -> LLMEnhancer:
+    from .providers.stub import StubEnhancer
+
+    return StubEnhancer()
+
+
 PROVIDER_FACTORIES: dict[str, EnhancerFactory] = {
     "openai": _openai_factory,
     "anthropic": _anthropic_factory,
+    "stub": _stub_factory,
 }
 
 
@@ -144,24 +215,145 @@ def enhance_sections(request: LLMEnhancementRequest) -> LLMEnhancementResult:
             message=f"Unsupported LLM provider: {provider_name}",
         )
     try:
+        request = replace(
+            request, context=request_context(request, tier=enhancer.context_tier)
+        )
+    except Exception as exc:
+        return _fallback(provider_name, f"enhancement failed: {exc}")
+    return _enhance_concurrently(enhancer, provider_name, request)
+
+
+def _fallback(
+    provider_name: str, reason: str, latency: dict[str, int] | None = None
+) -> LLMEnhancementResult:
+    return LLMEnhancementResult(
+        provider=provider_name,
+        applied=False,
+        sections={},
+        message=f"{provider_name} {reason}; falling back to local-only generation",
+        section_latency_ms=dict(latency or {}),
+    )
+
+
+def _enhance_one(
+    enhancer: LLMEnhancer, provider_name: str, request: LLMEnhancementRequest
+) -> LLMEnhancementResult:
+    if not request.use_cache:
         return enhancer.enhance(request)
-    except TimeoutError:
+    return _enhance_cached(enhancer, provider_name, request)
+
+
+def _enhance_concurrently(
+    enhancer: LLMEnhancer, provider_name: str, request: LLMEnhancementRequest
+) -> LLMEnhancementResult:
+    """One provider call per narrative section, all under one deadline.
+
+    Sections run on daemon threads so a hung provider call can neither delay
+    the caller past ``timeout_seconds`` nor block interpreter exit. Sections
+    that finish in time are applied; late or failed ones keep local text.
+    """
+    sections = request.narrative_sections or ("repo_context",)
+    outcomes: queue.Queue[tuple[str, LLMEnhancementResult | Exception, int]] = (
+        queue.Queue()
+    )
+
+    def run(section: str) -> None:
+        started = time.monotonic()
+        try:
+            outcome: LLMEnhancementResult | Exception = _enhance_one(
+                enhancer,
+                provider_name,
+                replace(request, narrative_sections=(section,)),
+            )
+        except Exception as exc:  # reported to the caller below
+            outcome = exc
+        elapsed_ms = int((time.monotonic() - started) * 1000)
+        outcomes.put((section, outcome, elapsed_ms))
+
+    for section in sections:
+        threading.Thread(
+            target=run, args=(section,), name=f"agentsgen-llm-{section}", daemon=True
+        ).start()
+
+    deadline = time.monotonic() + max(1, request.timeout_seconds)
+    finished: dict[str, tuple[LLMEnhancementResult | Exception, int]] = {}
+    while len(finished) < len(sections):
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        try:
+            section, outcome, elapsed_ms = outcomes.get(timeout=remaining)
+        except queue.Empty:
+            break
+        finished[section] = (outcome, elapsed_ms)
+
+    applied: dict[str, str] = {}
+    messages: list[str] = []
+    errors: list[Exception] = []
+    for section in sections:
+        if section not in finished:
+            continue
+        result, _ = finished[section]
+        if isinstance(result, Exception):
+            errors.append(result)
+        else:
+            if result.applied:
+                applied.update(result.sections)
+            if result.message and result.message not in messages:
+                messages.append(result.message)
+    latency = {section: elapsed for section, (_, elapsed) in finished.items()}
+    late = [section for section in sections if section not in finished]
+    timed_out = bool(late) or any(isinstance(exc, TimeoutError) for exc in errors)
+
+    if not applied:
+        if timed_out:
+            return _fallback(provider_name, "enhancement timed out", latency)
+        if errors:
+            return _fallback(provider_name, f"enhancement failed: {errors[0]}", latency)
         return LLMEnhancementResult(
             provider=provider_name,
             applied=False,
             sections={},
-            message=(
-                f"{provider_name} enhancement timed out; "
-                "falling back to local-only generation"
-            ),
+            message="; ".join(messages),
+            section_latency_ms=latency,
         )
-    except Exception as exc:
+    fell_back = [section for section in sections if section not in applied]
+    message = "; ".join(messages)
+    if fell_back:
+        message = f"{message}; local text kept for: {', '.join(fell_back)}"
+    return LLMEnhancementResult(
+        provider=provider_name,
+        applied=True,
+        sections=applied,
+        message=message,
+        section_latency_ms=latency,
+    )
+
+
+def _enhance_cached(
+    enhancer: LLMEnhancer, provider_name: str, request: LLMEnhancementRequest
+) -> LLMEnhancementResult:
+    """Serve applied results from the content-addressed cache when the repo
+    context, provider, model and template are unchanged."""
+    cache = default_llm_cache()
+    key = cache_key(
+        provider=provider_name,
+        model=request.model,
+        template_version=enhancer.template_version,
+        context={
+            "repo": _cache_context(request.context or {}),
+            "sections": sorted(request.narrative_sections),
+        },
+    )
+    cached = cache.get(key)
+    if cached is not None and isinstance(cached.get("sections"), dict):
         return LLMEnhancementResult(
             provider=provider_name,
-            applied=False,
-            sections={},
-            message=(
-                f"{provider_name} enhancement failed: {exc}; "
-                "falling back to local-only generation"
-            ),
+            applied=True,
+            sections={str(k): str(v) for k, v in cached["sections"].items()},
+            message=f"{cached.get('message', '')} (cached)".strip(),
         )
+    result = enhancer.enhance(request)
+    if result.applied:
+        cache.put(key, {"sections": result.sections, "message": result.message})
+    return result
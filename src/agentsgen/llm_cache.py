@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from .io_utils import write_json_atomic
+
+LLM_CACHE_VERSION = 1
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def default_cache_dir() -> Path:
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    return Path(cache_home) / "agentsgen" / "llm"
+
+
+def llm_cache_enabled() -> bool:
+    """False when ``AGENTSGEN_NO_LLM_CACHE`` asks for fresh provider calls."""
+    return not os.environ.get("AGENTSGEN_NO_LLM_CACHE")
+
+
+def cache_key(
+    *, provider: str, model: str, template_version: int, context: object
+) -> str:
+    """Content address for one provider call.
+
+    ``context`` is everything the prompt is built from; it is hashed as
+    canonical JSON, so equal inputs map to the same entry across runs.
+    """
+    material = json.dumps(
+        {
+            "cache_version": LLM_CACHE_VERSION,
+            "provider": provider,
+            "model": model,
+            "template_version": template_version,
+            "context": context,
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+        ensure_ascii=False,
+        default=str,
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """On-disk provider responses with a TTL and a size-bounded LRU.
+
+    Entries live at ``<root>/<key[:2]>/<key>.json``. A hit refreshes the
+    file's mtime, and when the cache grows past ``max_bytes`` the entries
+    with the oldest mtime are evicted first. Cache I/O is best-effort: an
+    unwritable cache directory never loses a response already paid for.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        *,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.root = root
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self.hits = 0
+        self.misses = 0
+
+    def _path(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.json"
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        path = self._path(key)
+        try:
+            stored = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.misses += 1
+            return None
+        value = stored.get("value") if isinstance(stored, dict) else None
+        stored_at = stored.get("stored_at") if isinstance(stored, dict) else None
+        now = self._clock()
+        if (
+            not isinstance(value, dict)
+            or not isinstance(stored_at, (int, float))
+            or now - stored_at > self.ttl_seconds
+        ):
+            try:
+                path.unlink(missing_ok=True)
+            except OSError:
+                pass
+            self.misses += 1
+            return None
+        try:
+            os.utime(path, (now, now))
+        except OSError:
+            pass
+        self.hits += 1
+        return value
+
+    def put(self, key: str, value: dict[str, Any]) -> None:
+        now = self._clock()
+        path = self._path(key)
+        try:
+            write_json_atomic(path, {"key": key, "stored_at": now, "value": value})
+            os.utime(path, (now, now))
+            self._evict()
+        except OSError:
+            return
+
+    def _evict(self) -> None:
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.root.glob("*/*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+
+def default_llm_cache() -> LLMResponseCache:
+    return LLMResponseCache(default_cache_dir())
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+from .detect import detect_repo
+from .llm import ENHANCED_OUTPUTS
+from .understand_ast import rel, repo_files
+from .understand_context import build_understanding_payload
+
+# Cheapest first: "detect" reads manifests only, "knowledge" reuses a fresh
+# agents.knowledge.json, "understand" runs the full scan, ranking and render.
+CONTEXT_TIERS = ("detect", "knowledge", "understand")
+KNOWLEDGE_FILENAME = "agents.knowledge.json"
+# Written by the same understand run, just before the knowledge file.
+_UNDERSTAND_OUTPUTS = ("repomap.compact.md",)
+
+
+def _detected_stack(target: Path) -> str:
+    det = detect_repo(target)
+    return (
+        str(det.project.get("primary_stack", "") or "unknown").strip().lower()
+        or "unknown"
+    )
+
+
+def fresh_knowledge(target: Path, output_dir: Path) -> dict[str, object] | None:
+    """The stored knowledge payload, if the repo files it lists are unchanged.
+
+    Fresh means the same set of scanned files with the same sizes, none
+    modified after the knowledge file was written. Files that enhancement
+    rewrites are ignored, so applying a narrative does not make it stale.
+    """
+    path = target / KNOWLEDGE_FILENAME
+    try:
+        written_ns = path.stat().st_mtime_ns
+        knowledge = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    rows = knowledge.get("files") if isinstance(knowledge, dict) else None
+    if not isinstance(rows, list):
+        return None
+    skipped = set(ENHANCED_OUTPUTS) | {
+        rel(output_dir / name, target) for name in _UNDERSTAND_OUTPUTS
+    }
+    recorded = {
+        str(row.get("path")): row.get("size")
+        for row in rows
+        if isinstance(row, dict) and row.get("path") not in skipped
+    }
+    current: dict[str, int] = {}
+    for file_path in repo_files(target, output_dir):
+        name = rel(file_path, target)
+        if name in skipped:
+            continue
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return None
+        if stat.st_mtime_ns > written_ns:
+            return None
+        current[name] = stat.st_size
+    return knowledge if current == recorded else None
+
+
+def _knowledge_summary(knowledge: dict[str, object]) -> dict[str, object]:
+    def count(name: str) -> int:
+        value = knowledge.get(name)
+        return len(value) if isinstance(value, list) else 0
+
+    return {
+        "files_count": count("files"),
+        "edges_count": count("edges"),
+        "entrypoints_count": count("entrypoints"),
+    }
+
+
+def build_tiered_context(target: Path, tier: str) -> dict[str, object]:
+    """The smallest repo context that satisfies ``tier``.
+
+    A ``knowledge`` request falls through to a full ``understand`` pass when
+    there is no fresh knowledge file to reuse.
+    """
+    if tier not in CONTEXT_TIERS:
+        raise ValueError(f"Unknown LLM context tier: {tier}")
+    output_dir = target / "docs" / "ai"
+    if tier == "detect":
+        return {"tier": "detect", "stack": _detected_stack(target), "summary": {}}
+    if tier == "knowledge":
+        knowledge = fresh_knowledge(target, output_dir)
+        if knowledge is not None:
+            return {
+                "tier": "knowledge",
+                "stack": _detected_stack(target),
+                "knowledge": knowledge,
+                "summary": _knowledge_summary(knowledge),
+            }
+    payload = build_understanding_payload(target, output_dir=output_dir)
+    return {**payload, "tier": "understand"}
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import asyncio
+import contextvars
+import json
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from .cancellation import cancel_scope
+
+
+@dataclass
+class _InFlight:
+    future: asyncio.Future[Any]
+    cancel_event: threading.Event
+    generation: int = 0
+    waiters: int = 0
+
+
+class ToolRunner:
+    """Runs blocking MCP tool bodies on a bounded pool off the event loop.
+
+    Read-only calls with identical arguments share one in-flight execution,
+    and the scan is cancelled once every caller waiting on it has gone. A
+    read never joins one that started before the last write to its path
+    finished. Writes to the same repo path are serialized and never
+    cancelled midway; the path stays locked until the write has finished,
+    even if its caller has gone.
+    """
+
+    def __init__(self, max_workers: int = 4):
+        self.max_workers = max(1, max_workers)
+        self._pool: ThreadPoolExecutor | None = None
+        self._inflight: dict[str, _InFlight] = {}
+        self._write_locks: dict[str, asyncio.Lock] = {}
+        self._write_generations: dict[str, int] = {}
+
+    @staticmethod
+    def _path_key(path: Any) -> str:
+        return str(Path(str(path)).resolve())
+
+    @staticmethod
+    def request_key(tool: str, **kwargs: Any) -> str:
+        # The shared cache is the same for every call, and repo paths are keyed
+        # by where they point so "." and its absolute form coalesce.
+        key_args = {name: value for name, value in kwargs.items() if name != "cache"}
+        if "path" in key_args:
+            key_args["path"] = ToolRunner._path_key(key_args["path"])
+        return json.dumps([tool, key_args], sort_keys=True, default=str)
+
+    def _submit(
+        self, fn: Callable[..., Any], kwargs: dict[str, Any], event: threading.Event
+    ) -> asyncio.Future[Any]:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="agentsgen-mcp"
+            )
+        ctx = contextvars.copy_context()
+
+        def call() -> Any:
+            with cancel_scope(event):
+                return fn(**kwargs)
+
+        return asyncio.get_running_loop().run_in_executor(self._pool, ctx.run, call)
+
+    async def run_read(self, tool: str, fn: Callable[..., Any], **kwargs: Any) -> Any:
+        key = self.request_key(tool, **kwargs)
+        generation = (
+            self._write_generations.get(self._path_key(kwargs["path"]), 0)
+            if "path" in kwargs
+            else 0
+        )
+        flight = self._inflight.get(key)
+        if flight is not None and flight.generation != generation:
+            # It may have read the repo before a write that has since finished.
+            flight = None
+        if flight is None:
+            event = threading.Event()
+            flight = _InFlight(
+                future=self._submit(fn, kwargs, event),
+                cancel_event=event,
+                generation=generation,
+            )
+            self._inflight[key] = flight
+            current = flight
+
+            def _forget(_future: asyncio.Future[Any]) -> None:
+                if self._inflight.get(key) is current:
+                    del self._inflight[key]
+
+            flight.future.add_done_callback(_forget)
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.future)
+        except asyncio.CancelledError:
+            if flight.waiters == 1:
+                flight.cancel_event.set()
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+            raise
+        finally:
+            flight.waiters -= 1
+
+    async def run_write(
+        self, tool: str, fn: Callable[..., Any], *, path: str, **kwargs: Any
+    ) -> Any:
+        lock_key = self._path_key(path)
+        lock = self._write_locks.setdefault(lock_key, asyncio.Lock())
+        await lock.acquire()
+        try:
+            # Shielded and never signalled: a half-applied write is worse
+            # than finishing a request nobody waits for.
+            future = self._submit(fn, {"path": path, **kwargs}, threading.Event())
+        except BaseException:
+            lock.release()
+            raise
+
+        def _finished(_future: asyncio.Future[Any]) -> None:
+            # Released when the write ends, not when its caller stops waiting.
+            self._write_generations[lock_key] = (
+                self._write_generations.get(lock_key, 0) + 1
+            )
+            lock.release()
+
+        future.add_done_callback(_finished)
+        return await asyncio.shield(future)
+
+    def shutdown(self) -> None:
+        for flight in list(self._inflight.values()):
+            flight.cancel_event.set()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import base64
 import json
 from pathlib import Path
 
@@ -7,8 +8,11 @@ from .actions import aggregate_check, status_repo
 from .detect import detect_repo
 from .flow_ops import run_init_flow, run_pack_flow, run_update_flow
 from .llm import LLMOptions
-from .understand_context import build_understanding_payload
+from .mcp_runner import ToolRunner
+from .repo_cache import RepoCache
+from .understand_context import build_understanding_payload, scan_repository
 from .validators import (
+    validate_mcp_cache_stats_response_payload,
     validate_mcp_init_response_payload,
     validate_mcp_check_response_payload,
     validate_mcp_detect_response_payload,
@@ -25,6 +29,12 @@ def _json_safe(payload: dict[str, object]) -> dict[str, object]:
     return json.loads(json.dumps(payload))
 
 
+def _cached(cache: RepoCache | None, repo_path: Path, key: str, compute) -> object:
+    if cache is None:
+        return compute()
+    return cache.view(repo_path).get(key, compute)
+
+
 def _results_payload(results: list[object]) -> list[dict[str, object]]:
     rows: list[dict[str, object]] = []
     for result in results:
@@ -67,66 +77,205 @@ def _write_policy(
     return payload
 
 
-def build_mcp_status_response(path: str = ".") -> dict[str, object]:
+def build_mcp_status_response(
+    path: str = ".", *, cache: RepoCache | None = None
+) -> dict[str, object]:
     repo_path = Path(path)
     payload = {
         "version": MCP_RESPONSE_VERSION,
         "tool": "status",
         "path": str(repo_path),
-        "result": status_repo(repo_path).to_json(),
+        "result": _cached(
+            cache, repo_path, "status", lambda: status_repo(repo_path).to_json()
+        ),
     }
     validate_mcp_status_response_payload(payload)
     return _json_safe(payload)
 
 
-def build_mcp_check_response(path: str = ".") -> dict[str, object]:
+def build_mcp_check_response(
+    path: str = ".", *, cache: RepoCache | None = None
+) -> dict[str, object]:
     repo_path = Path(path)
     payload = {
         "version": MCP_RESPONSE_VERSION,
         "tool": "check",
         "path": str(repo_path),
-        "result": aggregate_check(
+        "result": _cached(
+            cache,
             repo_path,
-            pack_check=False,
-            snippets_check=False,
-        ).to_json(),
+            "check",
+            lambda: aggregate_check(
+                repo_path,
+                pack_check=False,
+                snippets_check=False,
+            ).to_json(),
+        ),
     }
     validate_mcp_check_response_payload(payload)
     return _json_safe(payload)
 
 
-def build_mcp_detect_response(path: str = ".") -> dict[str, object]:
+def build_mcp_detect_response(
+    path: str = ".", *, cache: RepoCache | None = None
+) -> dict[str, object]:
     repo_path = Path(path)
+    det = _cached(cache, repo_path, "detect", lambda: detect_repo(repo_path))
     payload = {
         "version": MCP_RESPONSE_VERSION,
         "tool": "detect",
         "path": str(repo_path),
-        "result": detect_repo(repo_path).to_json(),
+        "result": det.to_json(),
     }
     validate_mcp_detect_response_payload(payload)
     return _json_safe(payload)
 
 
+UNDERSTAND_FIELDS = ("repomap", "compact_repomap", "graph", "files", "edges")
+
+
+def _understanding_payload(
+    repo_path: Path,
+    *,
+    output_dir: Path,
+    compact_budget_tokens: int,
+    focus: str | None,
+    changed_only: bool,
+    cache: RepoCache | None,
+) -> dict[str, object]:
+    if cache is None:
+        return build_understanding_payload(
+            repo_path,
+            output_dir=output_dir,
+            compact_budget_tokens=compact_budget_tokens,
+            focus=focus,
+            changed_only=changed_only,
+        )
+    view = cache.view(repo_path)
+
+    def scan():
+        det = view.get("detect", lambda: detect_repo(repo_path))
+        return scan_repository(repo_path, output_dir=output_dir, det=det)
+
+    def build() -> dict[str, object]:
+        return build_understanding_payload(
+            repo_path,
+            output_dir=output_dir,
+            compact_budget_tokens=compact_budget_tokens,
+            focus=focus,
+            changed_only=changed_only,
+            scan=view.get(f"scan:{output_dir}", scan),
+        )
+
+    key = (
+        f"understand:{output_dir}:{compact_budget_tokens}:{focus or ''}:{changed_only}"
+    )
+    return view.get(key, build)
+
+
+def _encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"v1:{offset}".encode("ascii")).decode("ascii")
+
+
+def _decode_cursor(cursor: str) -> int:
+    if not cursor:
+        return 0
+    try:
+        prefix, raw = (
+            base64.urlsafe_b64decode(cursor.encode("ascii")).decode("ascii").split(":")
+        )
+        offset = int(raw)
+    except (ValueError, UnicodeError) as exc:
+        raise ValueError(f"Invalid understand cursor: {cursor}") from exc
+    if prefix != "v1" or offset < 0:
+        raise ValueError(f"Invalid understand cursor: {cursor}")
+    return offset
+
+
+def _slice_understanding(
+    payload: dict[str, object],
+    *,
+    fields: list[str] | None,
+    cursor: str,
+    page_size: int,
+) -> tuple[dict[str, object], dict[str, object]]:
+    selected = list(UNDERSTAND_FIELDS) if fields is None else list(fields)
+    unknown = sorted(set(selected) - set(UNDERSTAND_FIELDS))
+    if unknown:
+        raise ValueError(
+            f"Unknown understand fields: {', '.join(unknown)} "
+            f"(expected: {', '.join(UNDERSTAND_FIELDS)})"
+        )
+    knowledge = dict(payload["knowledge"])
+    all_files = list(knowledge["files"])
+    all_edges = list(knowledge["edges"])
+    files = all_files if "files" in selected else []
+    edges = all_edges if "edges" in selected else []
+    offset = _decode_cursor(cursor)
+    total = max(len(files), len(edges))
+    end = offset + page_size if page_size > 0 else total
+    knowledge["files"] = files[offset:end]
+    knowledge["edges"] = edges[offset:end]
+
+    # The cached payload is shared between calls: build a new top-level dict
+    # and never mutate the nested values.
+    result: dict[str, object] = {
+        "stack": payload["stack"],
+        "summary": payload["summary"],
+        "knowledge": knowledge,
+    }
+    for name in ("repomap", "compact_repomap", "graph"):
+        if name in selected:
+            result[name] = payload[name]
+    page = {
+        "fields": selected,
+        "cursor": cursor or None,
+        "next_cursor": _encode_cursor(end) if end < total else None,
+        "page_size": page_size,
+        "files_total": len(all_files),
+        "edges_total": len(all_edges),
+    }
+    return result, page
+
+
 def build_mcp_understand_response(
     path: str = ".",
     compact_budget_tokens: int = 4000,
+    *,
+    focus: str = "",
+    changed_only: bool = False,
+    fields: list[str] | None = None,
+    cursor: str = "",
+    page_size: int = 0,
+    cache: RepoCache | None = None,
 ) -> dict[str, object]:
     repo_path = Path(path)
     output_dir = repo_path / "docs" / "ai"
+    result, page = _slice_understanding(
+        _understanding_payload(
+            repo_path,
+            output_dir=output_dir,
+            compact_budget_tokens=compact_budget_tokens,
+            focus=focus or None,
+            changed_only=changed_only,
+            cache=cache,
+        ),
+        fields=fields,
+        cursor=cursor,
+        page_size=page_size,
+    )
     payload = {
         "version": MCP_RESPONSE_VERSION,
         "tool": "understand",
         "path": str(repo_path),
         "output_dir": str(output_dir),
         "compact_budget_tokens": compact_budget_tokens,
-        "result": build_understanding_payload(
-            repo_path,
-            output_dir=output_dir,
-            compact_budget_tokens=compact_budget_tokens,
-        ),
+        "page": page,
+        "result": result,
     }
     validate_mcp_understand_response_payload(payload)
-    return _json_safe(payload)
+    # Already JSON-native: skip the _json_safe round trip for large payloads.
+    return payload
 
 
 def build_mcp_init_response(
@@ -278,7 +427,17 @@ def build_mcp_pack_response(
     return _json_safe(payload)
 
 
-def serve_stdio() -> None:
+def build_mcp_cache_stats_response(cache: RepoCache) -> dict[str, object]:
+    payload = {
+        "version": MCP_RESPONSE_VERSION,
+        "tool": "cache_stats",
+        "result": cache.stats(),
+    }
+    validate_mcp_cache_stats_response_payload(payload)
+    return _json_safe(payload)
+
+
+def serve_stdio(max_workers: int = 4) -> None:
     try:
         from mcp.server.fastmcp import FastMCP
     except Exception as exc:  # pragma: no cover - optional dependency
@@ -287,30 +446,57 @@ def serve_stdio() -> None:
         ) from exc
 
     server = FastMCP("agentsgen")
+    # Read-only tools share warm per-repo state for the life of the server.
+    cache = RepoCache()
+    runner = ToolRunner(max_workers=max_workers)
 
     @server.tool()
-    def status(path: str = ".") -> dict[str, object]:
-        return build_mcp_status_response(path)
+    async def status(path: str = ".") -> dict[str, object]:
+        return await runner.run_read(
+            "status", build_mcp_status_response, path=path, cache=cache
+        )
 
     @server.tool()
-    def check(path: str = ".") -> dict[str, object]:
-        return build_mcp_check_response(path)
+    async def check(path: str = ".") -> dict[str, object]:
+        return await runner.run_read(
+            "check", build_mcp_check_response, path=path, cache=cache
+        )
 
     @server.tool()
-    def detect(path: str = ".") -> dict[str, object]:
-        return build_mcp_detect_response(path)
+    async def detect(path: str = ".") -> dict[str, object]:
+        return await runner.run_read(
+            "detect", build_mcp_detect_response, path=path, cache=cache
+        )
 
     @server.tool()
-    def understand(
-        path: str = ".", compact_budget_tokens: int = 4000
+    async def understand(
+        path: str = ".",
+        compact_budget_tokens: int = 4000,
+        focus: str = "",
+        changed_only: bool = False,
+        fields: list[str] | None = None,
+        cursor: str = "",
+        page_size: int = 0,
     ) -> dict[str, object]:
-        return build_mcp_understand_response(
+        return await runner.run_read(
+            "understand",
+            build_mcp_understand_response,
             path=path,
             compact_budget_tokens=compact_budget_tokens,
+            focus=focus,
+            changed_only=changed_only,
+            fields=fields,
+            cursor=cursor,
+            page_size=page_size,
+            cache=cache,
         )
 
     @server.tool()
-    def init(
+    async def cache_stats() -> dict[str, object]:
+        return build_mcp_cache_stats_response(cache)
+
+    @server.tool()
+    async def init(
         path: str = ".",
         stack: str = "",
         name: str = "",
@@ -324,7 +510,9 @@ def serve_stdio() -> None:
         llm_model: str = "",
         llm_timeout_seconds: int = 30,
     ) -> dict[str, object]:
-        return build_mcp_init_response(
+        return await runner.run_write(
+            "init",
+            build_mcp_init_response,
             path=path,
             stack=stack,
             name=name,
@@ -340,7 +528,7 @@ def serve_stdio() -> None:
         )
 
     @server.tool()
-    def update(
+    async def update(
         path: str = ".",
         dry_run: bool = False,
         llm_enabled: bool = False,
@@ -348,7 +536,9 @@ def serve_stdio() -> None:
         llm_model: str = "",
         llm_timeout_seconds: int = 30,
     ) -> dict[str, object]:
-        return build_mcp_update_response(
+        return await runner.run_write(
+            "update",
+            build_mcp_update_response,
             path=path,
             dry_run=dry_run,
             llm_enabled=llm_enabled,
@@ -358,7 +548,7 @@ def serve_stdio() -> None:
         )
 
     @server.tool()
-    def pack(
+    async def pack(
         path: str = ".",
         autodetect: bool = True,
         stack: str = "",
@@ -369,7 +559,9 @@ def serve_stdio() -> None:
         check: bool = False,
         dry_run: bool = False,
     ) -> dict[str, object]:
-        return build_mcp_pack_response(
+        return await runner.run_write(
+            "pack",
+            build_mcp_pack_response,
             path=path,
             autodetect=autodetect,
             stack=stack,
@@ -381,4 +573,7 @@ def serve_stdio() -> None:
             dry_run=dry_run,
         )
 
-    server.run()
+    try:
+        server.run()
+    finally:
+        runner.shutdown()
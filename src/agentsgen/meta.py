@@ -5,13 +5,13 @@ from pathlib import Path
 from typing import Any
 
 from .analyze import (
-    _extract_text_content,
     _fetch_url,
     _normalize_url,
     _openai_chat_json,
     _stable_payload_without_timestamp,
     _utc_now_iso,
 )
+from .html_evidence import extract_html_evidence
 from .result_types import FileResult
 from .generated_artifacts import handle_generated_json_artifact
 from .validators import validate_metadata_payload
@@ -60,7 +60,7 @@ def _build_metadata_result(url: str, text_content: str) -> dict[str, Any]:
 def build_metadata_payload(url: str) -> dict[str, Any]:
     normalized_url = _normalize_url(url)
     fetch = _fetch_url(normalized_url)
-    text_content = _extract_text_content(fetch.text)
+    text_content = extract_html_evidence(fetch.text).text_sample
     payload = {
         "version": 1,
         "generated_by": "agentsgen",
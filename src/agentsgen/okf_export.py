@@ -1,15 +1,34 @@
 from __future__ import annotations
-from dataclasses import dataclass
+
+import gzip
+import hashlib
+import io
+import json
+import os
+import tarfile
+import tempfile
+import zipfile
+from collections.abc import Callable
+from dataclasses import asdict, dataclass, replace
+from functools import partial
 from pathlib import Path
+from typing import BinaryIO
 
 from .config import ToolConfig
 from .config_io import load_tool_config
 from .detect import detect_repo
-from .io_utils import read_json, read_text
+from .io_utils import read_json, read_text, write_json_atomic
 from .normalize import normalize_markdown
 from .patch_engine import write_or_diff
 from .result_types import FileResult
 
+# Bump when rendering changes so incremental exports re-render everything.
+OKF_RENDER_VERSION = 2
+_ARCHIVE_SUFFIXES = ((".tar.gz", "tar.gz"), (".tgz", "tar.gz"), (".zip", "zip"))
+# 1980-01-01, the earliest timestamp a zip entry can hold; used for tar too.
+_ZIP_DATE_TIME = (1980, 1, 1, 0, 0, 0)
+_ARCHIVE_MTIME = 315532800
+
 
 @dataclass(frozen=True)
 class OkfConceptSpec:
@@ -185,11 +204,30 @@ def _entrypoints_body(target: Path) -> str:
     return "\n".join(lines)
 
 
-def _source_concepts(target: Path, source_dir: Path) -> list[OkfConceptSpec]:
-    cfg = (
-        load_tool_config(target)
-        if (target / ".agentsgen.json").exists()
-        else ToolConfig.from_detect(detect_repo(target))
+@dataclass(frozen=True)
+class _ConceptSource:
+    """A concept whose body is only built when it is rendered.
+
+    ``concept`` carries an empty body; ``inputs`` digests the source bytes
+    the body is built from, so unchanged concepts are recognised without
+    reading their sources, loading config or rendering tables.
+    """
+
+    concept: OkfConceptSpec
+    inputs: str
+    build_body: Callable[[], str]
+
+
+def _source_digest(path: Path) -> str:
+    return _file_sha256(path) if path.is_file() else "missing"
+
+
+def _source_concepts(target: Path, source_dir: Path) -> list[_ConceptSource]:
+    config_path = target / ".agentsgen.json"
+    # Without a config file the overview falls back to detection, which has
+    # no single source file to hash; digest the derived config instead.
+    detected = (
+        None if config_path.exists() else ToolConfig.from_detect(detect_repo(target))
     )
     mapping = [
         (
@@ -229,90 +267,190 @@ def _source_concepts(target: Path, source_dir: Path) -> list[OkfConceptSpec]:
             "contracts",
         ),
     ]
-
-    concepts: list[OkfConceptSpec] = [
-        OkfConceptSpec(
-            rel_path=Path("repo/overview.md"),
-            type_name="Repo Overview",
-            title="Repository Overview",
-            description="Generated summary of the repo context and exported knowledge surfaces.",
-            tags=("repo", "overview", "generated"),
-            canonical=".agentsgen.json",
-            body=_repo_overview_body(target, cfg, source_dir),
-            kind="overview",
+    available = [row for row in mapping if row[0].is_file()]
+
+    concepts: list[_ConceptSource] = [
+        _ConceptSource(
+            concept=OkfConceptSpec(
+                rel_path=Path("repo/overview.md"),
+                type_name="Repo Overview",
+                title="Repository Overview",
+                description="Generated summary of the repo context and exported knowledge surfaces.",
+                tags=("repo", "overview", "generated"),
+                canonical=".agentsgen.json",
+                body="",
+                kind="overview",
+            ),
+            inputs=_digest(
+                _source_digest(config_path) if detected is None else detected.to_json(),
+                [row[0].name for row in available],
+                str(target.resolve()),
+            ),
+            build_body=lambda: _repo_overview_body(
+                target, detected or load_tool_config(target), source_dir
+            ),
         )
     ]
 
-    for source_path, rel_path, type_name, title, description, tags, kind in mapping:
-        if not source_path.is_file():
-            continue
+    for source_path, rel_path, type_name, title, description, tags, kind in available:
         concepts.append(
-            OkfConceptSpec(
-                rel_path=rel_path,
-                type_name=type_name,
-                title=title,
-                description=description,
-                tags=tags,
-                canonical=str(source_path.relative_to(target)).replace("\\", "/"),
-                body=read_text(source_path),
-                kind=kind,
+            _ConceptSource(
+                concept=OkfConceptSpec(
+                    rel_path=rel_path,
+                    type_name=type_name,
+                    title=title,
+                    description=description,
+                    tags=tags,
+                    canonical=str(source_path.relative_to(target)).replace("\\", "/"),
+                    body="",
+                    kind=kind,
+                ),
+                inputs=_source_digest(source_path),
+                build_body=partial(read_text, source_path),
             )
         )
 
     concepts.append(
-        OkfConceptSpec(
-            rel_path=Path("assets/entrypoints.md"),
-            type_name="Command Surface",
-            title="Command Surface",
-            description="Machine-readable repo commands rendered as a human- and agent-readable concept.",
-            tags=("repo", "commands", "entrypoints"),
-            canonical="agents.entrypoints.json",
-            body=_entrypoints_body(target),
-            kind="entrypoints",
-            resource="agents.entrypoints.json",
+        _ConceptSource(
+            concept=OkfConceptSpec(
+                rel_path=Path("assets/entrypoints.md"),
+                type_name="Command Surface",
+                title="Command Surface",
+                description="Machine-readable repo commands rendered as a human- and agent-readable concept.",
+                tags=("repo", "commands", "entrypoints"),
+                canonical="agents.entrypoints.json",
+                body="",
+                kind="entrypoints",
+                resource="agents.entrypoints.json",
+            ),
+            inputs=_source_digest(target / "agents.entrypoints.json"),
+            build_body=partial(_entrypoints_body, target),
         )
     )
     return concepts
 
 
-def export_okf_bundle(
-    target: Path,
-    *,
-    source_dir: Path,
-    output_dir: Path,
-    dry_run: bool,
-    print_diff: bool,
-) -> list[FileResult]:
-    results: list[FileResult] = []
-    concepts = _source_concepts(target, source_dir)
+@dataclass(frozen=True)
+class _BundleMember:
+    rel_path: str
+    digest: str
+    render: Callable[[], str]
+
+
+def _digest(*parts: object) -> str:
+    material = json.dumps(
+        [OKF_RENDER_VERSION, *parts], sort_keys=True, separators=(",", ":")
+    )
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+def _concept_member(source: _ConceptSource) -> _BundleMember:
+    concept = source.concept
+    fields = {**asdict(concept), "rel_path": concept.rel_path.as_posix()}
+    return _BundleMember(
+        rel_path=concept.rel_path.as_posix(),
+        digest=_digest(fields, source.inputs),
+        render=lambda: _render_concept(replace(concept, body=source.build_body())),
+    )
+
 
+def _bundle_members(target: Path, source_dir: Path) -> list[_BundleMember]:
+    """Every bundle file in write order (root index first), not yet rendered.
+
+    Each member carries a digest of the source bytes and metadata its
+    rendering depends on, so an incremental export can tell unchanged
+    concepts apart without building or rendering them.
+    """
+    sources = _source_concepts(target, source_dir)
     repo_entries: list[tuple[str, str]] = []
     assets_entries: list[tuple[str, str]] = []
-    payloads: list[tuple[Path, str]] = []
-
-    for concept in concepts:
-        payloads.append((output_dir / concept.rel_path, _render_concept(concept)))
-        entry = (
-            concept.rel_path.name,
-            concept.description,
-        )
+    for source in sources:
+        concept = source.concept
+        entry = (concept.rel_path.name, concept.description)
         if concept.rel_path.parts[0] == "repo":
             repo_entries.append(entry)
         elif concept.rel_path.parts[0] == "assets":
             assets_entries.append(entry)
 
-    payloads.insert(
-        0, (output_dir / "index.md", _render_root_index(repo_entries, assets_entries))
-    )
-    payloads.append(
-        (output_dir / "repo" / "index.md", _render_index("Repo", repo_entries))
-    )
-    payloads.append(
-        (output_dir / "assets" / "index.md", _render_index("Assets", assets_entries))
+    return [
+        _BundleMember(
+            "index.md",
+            _digest("root-index", repo_entries, assets_entries),
+            lambda: _render_root_index(repo_entries, assets_entries),
+        ),
+        *(_concept_member(source) for source in sources),
+        _BundleMember(
+            "repo/index.md",
+            _digest("index", "Repo", repo_entries),
+            lambda: _render_index("Repo", repo_entries),
+        ),
+        _BundleMember(
+            "assets/index.md",
+            _digest("index", "Assets", assets_entries),
+            lambda: _render_index("Assets", assets_entries),
+        ),
+    ]
+
+
+def okf_digests_path(output: Path) -> Path:
+    """Where incremental exports keep member digests: beside the bundle."""
+    return output.with_name(output.name + ".digests.json")
+
+
+def _load_digests(output: Path) -> dict[str, str]:
+    path = okf_digests_path(output)
+    try:
+        payload = read_json(path)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(payload, dict):
+        return {}
+    members = payload.get("members")
+    if payload.get("render_version") != OKF_RENDER_VERSION or not isinstance(
+        members, dict
+    ):
+        return {}
+    return {str(key): str(value) for key, value in members.items()}
+
+
+def _store_digests(output: Path, members: list[_BundleMember]) -> None:
+    write_json_atomic(
+        okf_digests_path(output),
+        {
+            "version": 1,
+            "render_version": OKF_RENDER_VERSION,
+            "members": {member.rel_path: member.digest for member in members},
+        },
     )
 
-    for path, content in payloads:
-        changed, diff = write_or_diff(path, content, dry_run, print_diff)
+
+def export_okf_bundle(
+    target: Path,
+    *,
+    source_dir: Path,
+    output_dir: Path,
+    dry_run: bool,
+    print_diff: bool,
+    incremental: bool = False,
+) -> list[FileResult]:
+    results: list[FileResult] = []
+    members = _bundle_members(target, source_dir)
+    previous = _load_digests(output_dir) if incremental else {}
+
+    for member in members:
+        path = output_dir / member.rel_path
+        if previous.get(member.rel_path) == member.digest and path.is_file():
+            results.append(
+                FileResult(
+                    path=path,
+                    action="skipped",
+                    message="source unchanged",
+                    changed=False,
+                    diff="",
+                )
+            )
+            continue
+        changed, diff = write_or_diff(path, member.render(), dry_run, print_diff)
         action = "created"
         message = "created OKF file"
         if path.exists() and not changed:
@@ -331,9 +469,162 @@ def export_okf_bundle(
             )
         )
 
+    if incremental and not dry_run:
+        _store_digests(output_dir, members)
     return results
 
 
+def okf_archive_format(path: Path) -> str:
+    name = path.name.lower()
+    for suffix, archive_format in _ARCHIVE_SUFFIXES:
+        if name.endswith(suffix):
+            return archive_format
+    raise ValueError(
+        f"Unsupported OKF archive {path.name}: use a .tar.gz, .tgz or .zip path."
+    )
+
+
+def _read_archive_members(
+    path: Path, archive_format: str, names: set[str]
+) -> dict[str, bytes]:
+    found: dict[str, bytes] = {}
+    if not names or not path.is_file():
+        return found
+    try:
+        if archive_format == "zip":
+            with zipfile.ZipFile(path) as archive:
+                for name in names & set(archive.namelist()):
+                    found[name] = archive.read(name)
+        else:
+            with tarfile.open(path, mode="r:gz") as archive:
+                for info in archive:
+                    if info.name in names and info.isfile():
+                        handle = archive.extractfile(info)
+                        if handle is not None:
+                            found[info.name] = handle.read()
+    except (OSError, EOFError, tarfile.TarError, zipfile.BadZipFile):
+        return {}
+    return found
+
+
+class _ArchiveWriter:
+    """Writes members one at a time with fixed metadata, so equal inputs
+    always produce byte-identical archives."""
+
+    def __init__(self, raw: BinaryIO, archive_format: str):
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: tarfile.TarFile | None = None
+        self._gzip: gzip.GzipFile | None = None
+        if archive_format == "zip":
+            self._zip = zipfile.ZipFile(raw, mode="w")
+        else:
+            self._gzip = gzip.GzipFile(filename="", mode="wb", fileobj=raw, mtime=0)
+            self._tar = tarfile.open(
+                fileobj=self._gzip, mode="w", format=tarfile.USTAR_FORMAT
+            )
+
+    def add(self, name: str, data: bytes) -> None:
+        if self._zip is not None:
+            info = zipfile.ZipInfo(name, date_time=_ZIP_DATE_TIME)
+            info.compress_type = zipfile.ZIP_DEFLATED
+            info.create_system = 3
+            info.external_attr = 0o100644 << 16
+            self._zip.writestr(info, data)
+            return
+        assert self._tar is not None
+        tar_info = tarfile.TarInfo(name)
+        tar_info.size = len(data)
+        tar_info.mtime = _ARCHIVE_MTIME
+        tar_info.mode = 0o644
+        self._tar.addfile(tar_info, io.BytesIO(data))
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        if self._tar is not None:
+            self._tar.close()
+        if self._gzip is not None:
+            self._gzip.close()
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(1 << 16), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def export_okf_archive(
+    target: Path,
+    *,
+    source_dir: Path,
+    archive_path: Path,
+    dry_run: bool,
+    incremental: bool = False,
+) -> FileResult:
+    """Stream the bundle into one deterministic ``.tar.gz`` or ``.zip``.
+
+    Members are rendered one at a time straight into the archive, in sorted
+    order with fixed timestamps and modes; no bundle directory is written.
+    With ``incremental``, members whose digest is unchanged are copied from
+    the previous archive instead of being rendered again, and an archive
+    whose members are all unchanged is left alone.
+    """
+    archive_format = okf_archive_format(archive_path)
+    members = sorted(
+        _bundle_members(target, source_dir), key=lambda member: member.rel_path
+    )
+    previous = _load_digests(archive_path) if incremental else {}
+    unchanged = {
+        member.rel_path
+        for member in members
+        if previous.get(member.rel_path) == member.digest
+    }
+    if archive_path.is_file() and len(unchanged) == len(members) == len(previous):
+        return FileResult(
+            path=archive_path,
+            action="skipped",
+            message="source unchanged",
+            changed=False,
+            diff="",
+        )
+    reused = _read_archive_members(archive_path, archive_format, unchanged)
+
+    archive_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(
+        prefix=f".{archive_path.name}.", dir=str(archive_path.parent)
+    )
+    tmp = Path(tmp_name)
+    try:
+        with os.fdopen(fd, "wb") as raw:
+            writer = _ArchiveWriter(raw, archive_format)
+            for member in members:
+                data = reused.get(member.rel_path)
+                if data is None:
+                    data = normalize_markdown(member.render()).encode("utf-8")
+                writer.add(member.rel_path, data)
+            writer.close()
+        existed = archive_path.is_file()
+        changed = not existed or _file_sha256(tmp) != _file_sha256(archive_path)
+        if changed and not dry_run:
+            tmp.replace(archive_path)
+    finally:
+        tmp.unlink(missing_ok=True)
+
+    if incremental and not dry_run:
+        _store_digests(archive_path, members)
+    if not changed:
+        action, message = "skipped", "already up to date"
+    elif existed:
+        action, message = "updated", f"updated OKF archive ({len(members)} files)"
+    else:
+        action, message = "created", f"created OKF archive ({len(members)} files)"
+    return FileResult(
+        path=archive_path, action=action, message=message, changed=changed, diff=""
+    )
+
+
 def okf_results_payload(results: list[FileResult]) -> list[dict[str, object]]:
     return [
         {
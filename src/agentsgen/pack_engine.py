@@ -4,7 +4,7 @@ import json
 import re
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Callable
+from typing import Callable, Collection
 
 from .config import ToolConfig, merge_detect_hints
 from .config_io import load_tool_config
@@ -28,6 +28,7 @@ from .markers import (
 from .normalize import normalize_markdown
 from .patch_engine import generated_sibling_path, handle_file, unified_diff
 from .render import load_template, render_template
+from .render_memo import memoized_render
 from .result_types import (
     AggregatedCheckReport,
     FileResult,
@@ -493,6 +494,24 @@ _handle_generated_json_file = handle_generated_json_artifact
 
 
 def _render_pack_file(cfg: ToolConfig, stack_tpl: str, template_name: str) -> str:
+    return memoized_render(
+        f"pack:{stack_tpl}/{template_name}",
+        cfg,
+        depends=lambda c: {
+            "project": c.project,
+            "project_info": c.project_info.to_json(),
+            "paths": c.paths,
+            "commands": c.commands,
+            "output_dir": c.pack.output_dir,
+        },
+        templates=[pack_template_path(stack_tpl, template_name)],
+        render=lambda c: _render_pack_file_uncached(c, stack_tpl, template_name),
+    )
+
+
+def _render_pack_file_uncached(
+    cfg: ToolConfig, stack_tpl: str, template_name: str
+) -> str:
     primary = str((cfg.project or {}).get("primary_stack", "")).strip().lower()
     is_mixed = primary not in ("python", "node", "static")
     project_name = (
@@ -535,19 +554,11 @@ def _resolve_target_child(target: Path, rel_path: Path) -> Path | None:
     return out_path
 
 
-def _pack_output_specs(
-    target: Path,
-    cfg: ToolConfig,
-    *,
-    autodetect: bool,
-    site_url: str | None = None,
-    site_manifest_builder: Callable[[str], str] | None = None,
-) -> list[tuple[Path, str, list[str]]]:
+def _pack_output_plan(cfg: ToolConfig) -> list[tuple[Path, str, list[str]]]:
     llms_format = (cfg.pack.llms_format or DEFAULT_PACK_LLMS_FORMAT).strip().lower()
     if llms_format not in ("txt", "md"):
         llms_format = DEFAULT_PACK_LLMS_FORMAT
     output_dir = Path((cfg.pack.output_dir or DEFAULT_PACK_OUTPUT_DIR).strip())
-    stack_tpl, _stack_label = _pick_stack_for_pack(cfg)
     llms_name = "llms.txt" if llms_format == "txt" else "LLMS.md"
     llms_tpl = "llms.txt.tpl" if llms_format == "txt" else "LLMS.md.tpl"
     specs: list[tuple[Path, str, list[str]]] = [
@@ -580,6 +591,27 @@ def _pack_output_specs(
             filtered.append((rel_path, tpl_name, required))
     if not filtered:
         filtered = [(Path(llms_name), llms_tpl, ["llms"])]
+    return filtered
+
+
+def pack_output_paths(cfg: ToolConfig) -> list[str]:
+    """Repo-relative paths ``pack`` writes for ``cfg``, without rendering."""
+    return [rel_path.as_posix() for rel_path, _tpl, _req in _pack_output_plan(cfg)]
+
+
+def _pack_output_specs(
+    target: Path,
+    cfg: ToolConfig,
+    *,
+    autodetect: bool,
+    site_url: str | None = None,
+    site_manifest_builder: Callable[[str], str] | None = None,
+    only: Collection[str] | None = None,
+) -> list[tuple[Path, str, list[str]]]:
+    stack_tpl, _stack_label = _pick_stack_for_pack(cfg)
+    filtered = _pack_output_plan(cfg)
+    if only is not None:
+        filtered = [spec for spec in filtered if spec[0].as_posix() in only]
     rendered: list[tuple[Path, str, list[str]]] = []
     manifest_builder = site_manifest_builder or build_site_llms_manifest
     for rel_path, tpl_name, required in filtered:
@@ -638,7 +670,9 @@ def apply_pack(
     site_manifest_builder: Callable[[str], str] | None = None,
     dry_run: bool,
     print_diff: bool,
+    only: Collection[str] | None = None,
 ) -> list[FileResult]:
+    """Render and write pack outputs; ``only`` limits it to those rel paths."""
     if not cfg.pack.enabled:
         return [
             FileResult(
@@ -655,6 +689,7 @@ def apply_pack(
         autodetect=autodetect,
         site_url=site_url,
         site_manifest_builder=site_manifest_builder,
+        only=only,
     ):
         out_path = _resolve_target_child(target, rel_path)
         if out_path is None:
@@ -754,18 +789,65 @@ def run_core_check(target: Path) -> dict[str, object]:
     }
 
 
-def run_pack_check(target: Path) -> dict[str, object]:
-    try:
-        from .detect import detect_repo
+def pack_check_config(
+    target: Path,
+    *,
+    autodetect: bool = True,
+    stack: str = "",
+    llms_format: str = "",
+    output_dir: str = "",
+    files: list[str] | None = None,
+) -> ToolConfig:
+    """The config ``pack`` renders with, including its CLI overrides.
+
+    The ``pack`` command and in-process checks both build their config
+    here; without autodetect or a config file, ``init --defaults`` info is
+    used.
+    """
+    from .detect import detect_repo
+    from .stacks import default_project_info
 
-        cfg_path = target / CONFIG_FILENAME
-        cfg = load_tool_config(target) if cfg_path.exists() else ToolConfig()
+    cfg_path = target / CONFIG_FILENAME
+    cfg = load_tool_config(target) if cfg_path.exists() else ToolConfig()
+    if autodetect:
         det_cfg = ToolConfig.from_detect(detect_repo(target))
         existing_pack = cfg.pack
         cfg = merge_detect_hints(cfg, det_cfg)
         cfg.pack = existing_pack
+    elif not cfg_path.exists():
+        cfg = ToolConfig.from_project_info(
+            default_project_info(target, stack.strip() or None)
+        )
+    if stack.strip():
+        cfg.project["primary_stack"] = stack.strip().lower()
+        cfg = ToolConfig.from_json(cfg.to_json())
+    if llms_format.strip():
+        cfg.pack.llms_format = llms_format.strip().lower()
+    if output_dir.strip():
+        cfg.pack.output_dir = output_dir.strip()
+    if files is not None:
+        cfg.pack.files = list(files)
+    return cfg
+
+
+def run_pack_check(
+    target: Path,
+    *,
+    cfg: ToolConfig | None = None,
+    autodetect: bool = True,
+    only: Collection[str] | None = None,
+) -> dict[str, object]:
+    """``pack --check`` in-process; ``only`` limits it to those output paths."""
+    try:
+        if cfg is None:
+            cfg = pack_check_config(target, autodetect=autodetect)
         results = apply_pack(
-            target, cfg, autodetect=True, dry_run=True, print_diff=False
+            target,
+            cfg,
+            autodetect=autodetect,
+            dry_run=True,
+            print_diff=False,
+            only=only,
         )
     except Exception as exc:
         return {
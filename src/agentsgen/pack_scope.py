@@ -0,0 +1,138 @@
+from __future__ import annotations
+
+import subprocess
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path, PurePosixPath
+
+from .config import ToolConfig
+from .constants import CONFIG_FILENAME
+from .detect.detect import COMMON_CONFIG_FILES, COMMON_SOURCE_DIRS
+from .detect.python import PYTHON_SENTINELS
+from .pack_engine import pack_output_paths
+
+# Root files whose content (or mere presence) feeds detection and so every
+# rendered pack file. Lockfiles and tool configs pick toolchains/commands.
+_ROOT_INPUTS = frozenset(
+    {
+        CONFIG_FILENAME,
+        *COMMON_CONFIG_FILES,
+        *PYTHON_SENTINELS,
+        "makefile",
+        "GNUmakefile",
+        "uv.lock",
+        "poetry.lock",
+        "README.md",
+        "RUNBOOK.md",
+        "CONTRIBUTING.md",
+    }
+)
+# Nested manifests count too: detection scans a few levels for monorepos.
+_NESTED_INPUTS = frozenset({"package.json", "pyproject.toml"})
+_NESTED_DEPTH = 4
+# Detection only checks whether these top-level directories exist.
+_PRESENCE_DIRS = frozenset({*COMMON_SOURCE_DIRS, "scripts", "plans", "drafts"})
+
+
+@dataclass(frozen=True)
+class ChangedPath:
+    """One changed file, with its ``git diff --name-status`` letter."""
+
+    path: str
+    status: str = "M"
+
+    @property
+    def adds_or_removes(self) -> bool:
+        return self.status[:1] in {"A", "D", "R", "C"}
+
+
+def parse_changed_paths(lines: Iterable[str]) -> list[ChangedPath]:
+    """Parse ``--name-status`` rows (``M\\tpath``) or bare paths (modified)."""
+    rows: list[ChangedPath] = []
+    for line in lines:
+        parts = [part.strip() for part in line.split("\t") if part.strip()]
+        if not parts:
+            continue
+        if len(parts) == 1:
+            rows.append(ChangedPath(parts[0].replace("\\", "/")))
+            continue
+        status = parts[0].upper()
+        # Renames and copies list the old and new path; both changed.
+        for path in parts[1:]:
+            rows.append(ChangedPath(path.replace("\\", "/"), status))
+    return rows
+
+
+def git_changed_paths(target: Path, base: str, head: str) -> list[ChangedPath] | None:
+    """Files changed between two commits, relative to ``target``.
+
+    Returns ``None`` when git cannot answer (shallow clone without the base
+    commit, not a repo), so callers fall back to checking everything.
+    """
+    try:
+        proc = subprocess.run(
+            ["git", "diff", "--name-status", "--relative", f"{base}...{head}"],
+            cwd=target,
+            check=False,
+            capture_output=True,
+            text=True,
+        )
+    except OSError:
+        return None
+    if proc.returncode != 0:
+        return None
+    return parse_changed_paths(proc.stdout.splitlines())
+
+
+def touches_pack_inputs(
+    changed: Iterable[ChangedPath], extra_inputs: Iterable[str] = ()
+) -> bool:
+    """Whether any change can alter detection, and so every pack output.
+
+    ``extra_inputs`` are further path prefixes to treat as inputs, such as
+    template directories when the repo renders its own pack.
+    """
+    prefixes = tuple(
+        item.strip().removeprefix("./") for item in extra_inputs if item.strip()
+    )
+    for row in changed:
+        if prefixes and row.path.startswith(prefixes):
+            return True
+        path = PurePosixPath(row.path)
+        parts = path.parts
+        if not parts:
+            continue
+        if len(parts) == 1 and path.name in _ROOT_INPUTS:
+            return True
+        if path.name in _NESTED_INPUTS and len(parts) <= _NESTED_DEPTH:
+            return True
+        if parts[:2] == (".github", "workflows"):
+            return True
+        if len(parts) > 1 and parts[0] in _PRESENCE_DIRS and row.adds_or_removes:
+            return True
+    return False
+
+
+def affected_pack_outputs(
+    cfg: ToolConfig,
+    changed: Iterable[ChangedPath],
+    *,
+    extra_inputs: Iterable[str] = (),
+) -> list[str]:
+    """Pack output paths whose inputs or contents the changes touch.
+
+    Every output is affected when detection inputs change; otherwise only
+    outputs that were edited directly (or via their generated sibling).
+    """
+    rows = list(changed)
+    outputs = pack_output_paths(cfg)
+    if touches_pack_inputs(rows, extra_inputs):
+        return outputs
+    touched = {row.path for row in rows}
+    affected: list[str] = []
+    for output in outputs:
+        path = PurePosixPath(output)
+        sibling = path.with_name(f"{path.stem}.generated{path.suffix}").as_posix()
+        if output in touched or sibling in touched:
+            affected.append(output)
+    return affected
@@ -21,10 +21,16 @@ from .markers import (
 )
 from .model import ProjectInfo
 from .normalize import normalize_markdown
+from .render_memo import memoized_render
 from .result_types import FileResult
 from .shared_sections import render_all_shared
 from .templates import prompt_template_path, templates_base_dir
-from .llm import LLMEnhancementRequest, LLMEnhancementResult, enhance_sections
+from .llm import (
+    LLMEnhancementRequest,
+    LLMEnhancementResult,
+    LLMOptions,
+    enhance_sections,
+)
 
 
 def unified_diff(path: Path, old: str, new: str) -> str:
@@ -144,6 +150,7 @@ def render_shared_blocks_detailed(
     *,
     llm_provider: str = "",
     target: Path | None = None,
+    llm_options: LLMOptions | None = None,
 ) -> tuple[dict[str, str], LLMEnhancementResult | None]:
     ctx = {
         "project": cfg.project or {},
@@ -154,8 +161,15 @@ def render_shared_blocks_detailed(
     blocks = render_all_shared(ctx)
     enhancement: LLMEnhancementResult | None = None
     if llm_provider and target is not None:
+        options = (llm_options or LLMOptions()).normalized()
         enhancement = enhance_sections(
-            LLMEnhancementRequest(target=target, provider=llm_provider)
+            LLMEnhancementRequest(
+                target=target,
+                provider=llm_provider,
+                model=options.model,
+                timeout_seconds=options.timeout_seconds,
+                narrative_sections=options.narrative_sections,
+            )
         )
         for section, extra in enhancement.sections.items():
             base = blocks.get(section, "").strip()
@@ -172,6 +186,32 @@ def render_all(
     *,
     llm_provider: str = "",
     target: Path | None = None,
+) -> tuple[str, str]:
+    if llm_provider and target is not None:
+        return _render_all(cfg, llm_provider=llm_provider, target=target)
+    agents_tpl, runbook_tpl = template_paths(
+        templates_base_dir(), cfg.project_info.stack
+    )
+    return memoized_render(
+        "render_all",
+        cfg,
+        depends=lambda c: {
+            "project_info": c.project_info.to_json(),
+            "project": c.project,
+            "paths": c.paths,
+            "commands": c.commands,
+            "defaults": c.defaults,
+        },
+        templates=[agents_tpl, runbook_tpl],
+        render=_render_all,
+    )
+
+
+def _render_all(
+    cfg: ToolConfig,
+    *,
+    llm_provider: str = "",
+    target: Path | None = None,
 ) -> tuple[str, str]:
     info = cfg.project_info
     base = templates_base_dir()
@@ -227,6 +267,7 @@ def apply_config_detailed(
     dry_run: bool,
     print_diff: bool,
     llm_provider: str = "",
+    llm_options: LLMOptions | None = None,
 ) -> tuple[list[FileResult], LLMEnhancementResult | None]:
     results: list[FileResult] = []
     llm_result: LLMEnhancementResult | None = None
@@ -236,6 +277,7 @@ def apply_config_detailed(
             cfg,
             llm_provider=llm_provider,
             target=target,
+            llm_options=llm_options,
         )
         info = cfg.project_info
         base = templates_base_dir()
@@ -356,7 +398,11 @@ def update_from_config(
 
 
 def update_from_config_detailed(
-    target: Path, dry_run: bool, print_diff: bool, llm_provider: str = ""
+    target: Path,
+    dry_run: bool,
+    print_diff: bool,
+    llm_provider: str = "",
+    llm_options: LLMOptions | None = None,
 ) -> tuple[list[FileResult], LLMEnhancementResult | None]:
     tool_cfg = load_tool_config(target)
     return apply_config_detailed(
@@ -366,4 +412,5 @@ def update_from_config_detailed(
         dry_run=dry_run,
         print_diff=print_diff,
         llm_provider=llm_provider,
+        llm_options=llm_options,
     )
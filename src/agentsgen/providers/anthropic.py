@@ -6,11 +6,13 @@ from ..llm import (
     LLMEnhancementRequest,
     LLMEnhancementResult,
     LLMEnhancer,
-    build_repo_context,
+    request_context,
 )
 
 
 class AnthropicEnhancer(LLMEnhancer):
+    context_tier = "detect"
+
     def enhance(self, request: LLMEnhancementRequest) -> LLMEnhancementResult:
         if not os.getenv("ANTHROPIC_API_KEY"):
             return LLMEnhancementResult(
@@ -19,7 +21,7 @@ class AnthropicEnhancer(LLMEnhancer):
                 sections={},
                 message="ANTHROPIC_API_KEY is not set; falling back to local-only generation",
             )
-        context = build_repo_context(request.target)
+        context = request_context(request, tier=self.context_tier)
         summary = str(context.get("stack", "repo")).strip()
         return LLMEnhancementResult(
             provider="anthropic",
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from ..llm import (
+    LLMEnhancementRequest,
+    LLMEnhancementResult,
+    LLMEnhancer,
+    request_context,
+)
+
+
+class StubEnhancer(LLMEnhancer):
+    """Offline provider: deterministic narrative built from the repo context."""
+
+    context_tier = "knowledge"
+
+    def enhance(self, request: LLMEnhancementRequest) -> LLMEnhancementResult:
+        context = request_context(request, tier=self.context_tier)
+        summary = context.get("summary")
+        files_count = summary.get("files_count", 0) if isinstance(summary, dict) else 0
+        stack = str(context.get("stack", "repo")).strip()
+        return LLMEnhancementResult(
+            provider="stub",
+            applied=True,
+            sections={
+                section: (
+                    "Stub repo context\n\n"
+                    f"- Detected stack: `{stack}`\n"
+                    f"- Files scanned: {files_count}"
+                )
+                for section in request.narrative_sections
+            },
+            message="Applied stub narrative enhancement",
+        )
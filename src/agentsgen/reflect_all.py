@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from .reflect_index import ReflectIndex
+from .reflect_sessions import (
+    SessionSource,
+    SessionSummaryAnalyzer,
+    ShortPromptAnalyzer,
+    SignalsAnalyzer,
+    build_sessions_payload,
+    build_signals_payload,
+    iter_codex_session_transcripts,
+    run_reflect_analyzers,
+    sessions_artifact_results,
+)
+from .reflect_skills import (
+    SkillUsageAnalyzer,
+    build_skill_usage_payload,
+    skills_artifact_results,
+)
+from .result_types import FileResult
+
+
+def apply_reflect_all(
+    target: Path,
+    *,
+    source: SessionSource,
+    output_dir: Path,
+    dry_run: bool,
+    print_diff: bool,
+    index: ReflectIndex | None = None,
+) -> tuple[list[FileResult], dict[str, dict[str, object]]]:
+    """Write every reflect artifact from a single pass over the transcripts."""
+    sessions = SessionSummaryAnalyzer()
+    signals = SignalsAnalyzer()
+    short_prompts = ShortPromptAnalyzer()
+    usage = SkillUsageAnalyzer()
+    run_reflect_analyzers(
+        iter_codex_session_transcripts(target, source, index=index),
+        [sessions, signals, short_prompts, usage],
+    )
+
+    session_payload = build_sessions_payload(target, source, sessions)
+    signals_payload = build_signals_payload(target, source, signals, short_prompts)
+    usage_payload, effectiveness_md = build_skill_usage_payload(target, source, usage)
+    results = sessions_artifact_results(
+        output_dir,
+        session_payload,
+        signals_payload,
+        dry_run=dry_run,
+        print_diff=print_diff,
+    ) + skills_artifact_results(
+        output_dir,
+        usage_payload,
+        effectiveness_md,
+        dry_run=dry_run,
+        print_diff=print_diff,
+    )
+    payloads = {
+        "sessions": session_payload,
+        "signals": signals_payload,
+        "skill_usage": usage_payload,
+    }
+    return results, payloads
@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from .io_utils import write_json_atomic
+
+# Bump whenever the shape or meaning of the stored parse state changes so old
+# indexes are discarded instead of resumed.
+REFLECT_INDEX_VERSION = 2
+# Entries are kept per skill matcher, so alternating `reflect sessions` and
+# `reflect skills --skills-dir ...` resumes both; only the most recently used
+# matchers are retained.
+MAX_INDEX_MATCHERS = 4
+
+
+def default_index_path(target: Path) -> Path:
+    """Per-repo index location under the user cache dir (XDG_CACHE_HOME)."""
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    digest = hashlib.sha256(str(target.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "agentsgen" / "reflect" / f"{digest}.json"
+
+
+@dataclass
+class ReflectIndex:
+    """Stored parse state per session file, keyed by absolute path.
+
+    Each entry records the file identity (inode, size, mtime) seen on the last
+    run together with the parser state up to the last complete line, so
+    append-only session logs resume where they stopped. Parse state depends
+    on the skill matcher, so the file holds one entry set per matcher and
+    ``entries`` is the set for ``matcher``.
+    """
+
+    path: Path | None = None
+    matcher: str = ""
+    entries: dict[str, dict[str, Any]] = field(default_factory=dict)
+    other_matchers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    files_parsed: int = 0
+    files_resumed: int = 0
+    files_skipped: int = 0
+
+    @classmethod
+    def load(cls, path: Path | None, *, matcher: str = "") -> ReflectIndex:
+        """Load the entries ``path`` recorded under the ``matcher`` fingerprint."""
+        empty = cls(path=path, matcher=matcher)
+        if path is None or not path.is_file():
+            return empty
+        try:
+            raw = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return empty
+        if not isinstance(raw, dict) or raw.get("version") != REFLECT_INDEX_VERSION:
+            return empty
+        matchers = raw.get("matchers")
+        if not isinstance(matchers, dict):
+            return empty
+        others = {
+            key: value
+            for key, value in matchers.items()
+            if key != matcher and isinstance(value, dict)
+        }
+        entries = matchers.get(matcher)
+        return cls(
+            path=path,
+            matcher=matcher,
+            entries=entries if isinstance(entries, dict) else {},
+            other_matchers=others,
+        )
+
+    def lookup(self, file_path: Path, stat: os.stat_result) -> dict[str, Any] | None:
+        """Return the stored entry if ``file_path`` is still the same file.
+
+        A changed inode or a file shorter than the stored offset means the log
+        was replaced or truncated, so it has to be parsed from the start.
+        """
+        entry = self.entries.get(os.path.abspath(file_path))
+        if not isinstance(entry, dict):
+            return None
+        state = entry.get("state")
+        if not isinstance(state, dict) or entry.get("inode") != stat.st_ino:
+            return None
+        if stat.st_size < int(state.get("offset", 0) or 0):
+            return None
+        return entry
+
+    @staticmethod
+    def unchanged(entry: dict[str, Any], stat: os.stat_result) -> bool:
+        state = entry.get("state") or {}
+        return (
+            entry.get("size") == stat.st_size
+            and entry.get("mtime_ns") == stat.st_mtime_ns
+            and state.get("offset") == stat.st_size
+        )
+
+    def store(
+        self, file_path: Path, stat: os.stat_result, state: dict[str, Any]
+    ) -> None:
+        self.entries[os.path.abspath(file_path)] = {
+            "inode": stat.st_ino,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "state": state,
+        }
+
+    def prune_missing(self) -> None:
+        for key in [key for key in self.entries if not Path(key).exists()]:
+            del self.entries[key]
+
+    def save(self) -> None:
+        if self.path is None:
+            return
+        # Insertion order is recency: the current matcher goes last and the
+        # oldest ones beyond the cap are dropped.
+        matchers = {**self.other_matchers, self.matcher: self.entries}
+        kept = list(matchers.items())[-MAX_INDEX_MATCHERS:]
+        write_json_atomic(
+            self.path,
+            {"version": REFLECT_INDEX_VERSION, "matchers": dict(kept)},
+        )
+
+    def stats(self) -> dict[str, object]:
+        return {
+            "path": str(self.path) if self.path is not None else "",
+            "files_parsed": self.files_parsed,
+            "files_resumed": self.files_resumed,
+            "files_skipped": self.files_skipped,
+        }
@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from collections import deque
+from collections.abc import Iterable, Iterator, Sequence
+from functools import lru_cache
+from pathlib import Path
+
+
+_NAME = r"[A-Za-z0-9_.-]+(?::[A-Za-z0-9_.-]+)?"
+SKILL_STOPWORDS = {"use", "using", "with", "apply", "run", "try", "skill", "skills"}
+
+# `$name`, `use <name> skill` and the loose `<name> skill` card heuristic as
+# one alternation, so a message is scanned once. The card heuristic is only
+# included when no skill vocabulary is known.
+_EXPLICIT_ALTERNATIVES = (
+    rf"\$(?P<token>{_NAME})",
+    rf"\b(?:use|using|with|apply|run|try)\s+(?P<phrase>{_NAME})\s+skill\b",
+)
+_CARD_ALTERNATIVE = rf"\b(?P<card>{_NAME})\b(?=[`\"']?\s+(?:skill|skills)\b)"
+_EXPLICIT_RE = re.compile("|".join(_EXPLICIT_ALTERNATIVES), re.IGNORECASE)
+_HEURISTIC_RE = re.compile(
+    "|".join((*_EXPLICIT_ALTERNATIVES, _CARD_ALTERNATIVE)), re.IGNORECASE
+)
+_NAME_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789_-:")
+
+# Bump when extraction rules change; stored parse state depends on it.
+MATCHER_VERSION = 1
+
+
+def _normalize_skill_name(raw: str) -> str:
+    return raw.strip().strip("`'\"").lower()
+
+
+class _NameAutomaton:
+    """Aho-Corasick automaton over lowercase skill names."""
+
+    def __init__(self, names: Iterable[str]):
+        self._goto: list[dict[str, int]] = [{}]
+        self._fail: list[int] = [0]
+        self._out: list[tuple[str, ...]] = [()]
+        for name in names:
+            self._insert(name)
+        self._link()
+
+    def _insert(self, name: str) -> None:
+        state = 0
+        for char in name:
+            nxt = self._goto[state].get(char)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append(())
+                self._goto[state][char] = nxt
+            state = nxt
+        self._out[state] = (*self._out[state], name)
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[nxt] = self._goto[fallback].get(char, 0)
+                self._out[nxt] = (*self._out[nxt], *self._out[self._fail[nxt]])
+
+    def iter_matches(self, text: str) -> Iterator[tuple[int, str]]:
+        """Yield ``(start, name)`` for every occurrence, in one pass."""
+        state = 0
+        for index, char in enumerate(text):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for name in self._out[state]:
+                yield index + 1 - len(name), name
+
+
+class SkillMatcher:
+    """Extracts skill mentions from a user message in a single scan.
+
+    Explicit mentions (``$name``, ``use name skill``) always count. With a
+    vocabulary of installed skill names, the loose ``<name> skill`` heuristic
+    is replaced by whole-word matches of known names.
+    """
+
+    def __init__(self, vocabulary: Sequence[str] = ()):
+        self.vocabulary = tuple(
+            sorted({_normalize_skill_name(name) for name in vocabulary} - {""})
+        )
+        self._automaton = _NameAutomaton(self.vocabulary) if self.vocabulary else None
+        self._pattern = _EXPLICIT_RE if self.vocabulary else _HEURISTIC_RE
+        digest = hashlib.sha256("\n".join(self.vocabulary).encode("utf-8"))
+        self.fingerprint = f"v{MATCHER_VERSION}:{digest.hexdigest()[:16]}"
+
+    def extract(self, text: str) -> list[str]:
+        mentions: set[str] = set()
+        for match in self._pattern.finditer(text):
+            explicit = match.group("token") or match.group("phrase")
+            if explicit:
+                mentions.add(_normalize_skill_name(explicit))
+                continue
+            candidate = _normalize_skill_name(match.group("card"))
+            if len(candidate) >= 3 and candidate not in SKILL_STOPWORDS:
+                mentions.add(candidate)
+        if self._automaton is not None:
+            lowered = text.lower()
+            for start, name in self._automaton.iter_matches(lowered):
+                end = start + len(name)
+                if start > 0 and lowered[start - 1] in _NAME_CHARS:
+                    continue
+                if end < len(lowered) and lowered[end] in _NAME_CHARS:
+                    continue
+                mentions.add(name)
+        return sorted(mentions)
+
+
+@lru_cache(maxsize=8)
+def skill_matcher(vocabulary: tuple[str, ...] = ()) -> SkillMatcher:
+    return SkillMatcher(vocabulary)
+
+
+def extract_skill_mentions(text: str) -> list[str]:
+    return skill_matcher().extract(text)
+
+
+def load_skill_vocabulary(skills_dirs: Iterable[Path]) -> tuple[str, ...]:
+    """Names of installed skills: ``<dir>/<skill>/SKILL.md`` and its ``name:``."""
+    names: set[str] = set()
+    for skills_dir in skills_dirs:
+        if not skills_dir.is_dir():
+            continue
+        for skill_md in sorted(skills_dir.glob("*/SKILL.md")):
+            names.add(skill_md.parent.name)
+            try:
+                head = skill_md.read_text(encoding="utf-8")[:2048]
+            except OSError:
+                continue
+            if not head.startswith("---"):
+                continue
+            for line in head.splitlines()[1:]:
+                if line.strip() == "---":
+                    break
+                key, _, value = line.partition(":")
+                if key.strip() == "name" and value.strip():
+                    names.add(value.strip().strip("'\""))
+                    break
+    return tuple(sorted(_normalize_skill_name(name) for name in names))
@@ -1,16 +1,22 @@
 from __future__ import annotations
 
+import copy
 import json
+import os
 import re
 from collections import Counter
-from dataclasses import dataclass
-from datetime import datetime, timezone
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import cast
+from typing import Any, Protocol, cast
 
 from .generated_artifacts import handle_generated_json_artifact
 from .io_utils import read_text
 from .patch_engine import generated_sibling_path, write_or_diff
+from .reflect_index import ReflectIndex
+from .reflect_mentions import SkillMatcher, skill_matcher
 from .result_types import FileResult
 from .validators import (
     validate_reflect_sessions_payload,
@@ -25,6 +31,15 @@ REDIRECT_PATTERN = re.compile(
     r"\b(instead|don't|do not|stop|change|redo|not this|use this|wait)\b",
     re.IGNORECASE,
 )
+# Codex writes every record as {"timestamp": ..., "type": ..., "payload": ...};
+# reading the head lets the parser skip decoding records it does not use.
+RECORD_HEAD_PATTERN = re.compile(
+    r'\s*\{\s*"timestamp"\s*:\s*"([^"\\]*)"\s*,\s*"type"\s*:\s*"([^"\\]*)"'
+)
+_DECODED_RECORD_TYPES = frozenset({"session_meta", "event_msg"})
+RELATIVE_DAYS_PATTERN = re.compile(r"(\d+)d")
+# Codex archives sessions as <root>/YYYY/MM/DD/*.jsonl.
+_PARTITION_WIDTHS = (4, 2, 2)
 
 
 @dataclass(frozen=True)
@@ -46,10 +61,66 @@ class SessionSummary:
     short_prompts: tuple[str, ...]
 
 
+@dataclass(frozen=True)
+class SessionSource:
+    """Codex session roots to read, in order, and how many parse workers to use.
+
+    ``jobs`` follows the fleet convention: 1 parses in-process, 0 uses one
+    worker per CPU. ``since``/``until`` are inclusive day bounds.
+    """
+
+    roots: tuple[Path, ...]
+    jobs: int = 1
+    since: date | None = None
+    until: date | None = None
+    skill_vocabulary: tuple[str, ...] = ()
+
+    @property
+    def matcher(self) -> SkillMatcher:
+        return skill_matcher(self.skill_vocabulary)
+
+    def payload(self) -> dict[str, object]:
+        return {
+            "tool": "codex",
+            "root": str(self.roots[0]) if self.roots else "",
+            "roots": [str(root) for root in self.roots],
+            "since": self.since.isoformat() if self.since else None,
+            "until": self.until.isoformat() if self.until else None,
+        }
+
+
 @dataclass(frozen=True)
 class SessionTranscript:
     summary: SessionSummary
-    user_messages: tuple[str, ...]
+    skills: tuple[str, ...]
+
+
+@dataclass
+class TranscriptState:
+    """Parse state for one session file covering its first ``offset`` bytes.
+
+    Holds aggregates only, so it can be stored in the reflect index and fed
+    further lines when the log grows.
+    """
+
+    offset: int = 0
+    has_meta: bool = False
+    foreign: bool = False
+    session_id: str = ""
+    originator: str = ""
+    source: str = ""
+    cwd: str = ""
+    meta_started_at: str = ""
+    first_message_at: str = ""
+    last_event_at: str = ""
+    last_event_ts: float = 0.0
+    user_messages: int = 0
+    prompt_chars: int = 0
+    prompt_words: int = 0
+    plan_first: bool = False
+    redirects: int = 0
+    short_prompts: list[str] = field(default_factory=list)
+    skills: list[str] = field(default_factory=list)
 
 
 def utc_now_iso() -> str:
@@ -79,10 +150,93 @@ def _is_session_for_target(cwd: str, target: Path) -> bool:
     return cwd_path == target_path or target_path in cwd_path.parents
 
 
-def _iter_session_files(codex_root: Path) -> list[Path]:
-    if not codex_root.exists():
-        return []
-    return sorted(codex_root.rglob("*.jsonl"))
+def parse_day_bound(raw: str, *, today: date | None = None) -> date:
+    """Parse ``YYYY-MM-DD`` or a relative ``<N>d`` (N days before today)."""
+    value = raw.strip()
+    match = RELATIVE_DAYS_PATTERN.fullmatch(value)
+    if match:
+        return (today or date.today()) - timedelta(days=int(match.group(1)))
+    try:
+        return date.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"invalid date {raw!r}: expected YYYY-MM-DD or <N>d") from None
+
+
+def _partition_key(parts: Sequence[str]) -> tuple[int, ...] | None:
+    """``("2026", "06", "13")`` -> ``(2026, 6, 13)``; None if not a date path."""
+    if not parts or len(parts) > len(_PARTITION_WIDTHS):
+        return None
+    if any(
+        len(part) != width or not part.isdigit()
+        for part, width in zip(parts, _PARTITION_WIDTHS)
+    ):
+        return None
+    return tuple(int(part) for part in parts)
+
+
+def _bound_key(value: date | None) -> tuple[int, int, int] | None:
+    return (value.year, value.month, value.day) if value else None
+
+
+def _walk_session_files(root: Path, source: SessionSource) -> list[Path]:
+    """List ``*.jsonl`` under ``root``, pruning year/month/day partitions.
+
+    Directories named like Codex's ``YYYY/MM/DD`` layout are skipped when the
+    whole partition falls outside ``since``/``until``; files outside a full
+    day partition fall back to an mtime check.
+    """
+    since = _bound_key(source.since)
+    until = _bound_key(source.until)
+    filtered = since is not None or until is not None
+    files: list[Path] = []
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel_parts = Path(dirpath).relative_to(root).parts
+        if filtered:
+            kept = []
+            for name in dirnames:
+                key = _partition_key((*rel_parts, name))
+                if key is not None:
+                    if since is not None and key < since[: len(key)]:
+                        continue
+                    if until is not None and key > until[: len(key)]:
+                        continue
+                kept.append(name)
+            dirnames[:] = kept
+        day_partition = _partition_key(rel_parts) is not None and len(rel_parts) == len(
+            _PARTITION_WIDTHS
+        )
+        for name in filenames:
+            if not name.endswith(".jsonl"):
+                continue
+            path = Path(dirpath, name)
+            if filtered and not day_partition and not _mtime_in_range(path, source):
+                continue
+            files.append(path)
+    return sorted(files)
+
+
+def _mtime_in_range(path: Path, source: SessionSource) -> bool:
+    try:
+        day = date.fromtimestamp(path.stat().st_mtime)
+    except OSError:
+        return False
+    if source.since is not None and day < source.since:
+        return False
+    return source.until is None or day <= source.until
+
+
+def _iter_session_files(source: SessionSource) -> list[Path]:
+    files: list[Path] = []
+    seen: set[str] = set()
+    for root in source.roots:
+        if not root.is_dir():
+            continue
+        for path in _walk_session_files(root, source):
+            key = os.path.realpath(path)
+            if key not in seen:
+                seen.add(key)
+                files.append(path)
+    return files
 
 
 def _extract_short_prompt(text: str) -> str | None:
@@ -201,126 +355,367 @@ def _handle_generated_text_artifact(
     )
 
 
-def _parse_session_transcript(path: Path, target: Path) -> SessionTranscript | None:
-    meta: dict[str, object] | None = None
-    user_messages: list[tuple[datetime | None, str]] = []
-    last_event_at: datetime | None = None
+def _record_head(line: str) -> tuple[str, str] | None:
+    match = RECORD_HEAD_PATTERN.match(line)
+    if match is None:
+        return None
+    return match.group(1), match.group(2)
+
 
-    for line in path.read_text(encoding="utf-8").splitlines():
-        if not line.strip():
-            continue
+def _iso(value: datetime) -> str:
+    return value.isoformat().replace("+00:00", "Z")
+
+
+def _feed_line(
+    state: TranscriptState, line: str, target: Path, matcher: SkillMatcher
+) -> None:
+    head = _record_head(line)
+    if head is None:
         payload = json.loads(line)
-        timestamp = _parse_timestamp(str(payload.get("timestamp", "") or ""))
-        if timestamp and (last_event_at is None or timestamp > last_event_at):
-            last_event_at = timestamp
+        raw_timestamp = str(payload.get("timestamp", "") or "")
         record_type = str(payload.get("type", "") or "")
-        body = payload.get("payload", {})
-        if record_type == "session_meta" and isinstance(body, dict):
-            meta = body
-            continue
-        if record_type != "event_msg" or not isinstance(body, dict):
-            continue
-        if body.get("type") != "user_message":
-            continue
-        message = str(body.get("message", "") or "").strip()
-        if not message:
-            continue
-        user_messages.append((timestamp, message))
-
-    if not meta:
-        return None
-    cwd = str(meta.get("cwd", "") or "")
-    if not _is_session_for_target(cwd, target):
+    else:
+        raw_timestamp, record_type = head
+        payload = None
+    timestamp = _parse_timestamp(raw_timestamp)
+    if timestamp is not None:
+        event_ts = timestamp.timestamp()
+        if not state.last_event_at or event_ts > state.last_event_ts:
+            state.last_event_at = _iso(timestamp)
+            state.last_event_ts = event_ts
+    if record_type not in _DECODED_RECORD_TYPES:
+        return
+    if record_type == "event_msg" and '"user_message"' not in line:
+        return
+    if payload is None:
+        payload = json.loads(line)
+    body = payload.get("payload", {})
+    if not isinstance(body, dict):
+        return
+    if record_type == "session_meta":
+        state.has_meta = True
+        state.session_id = str(body.get("id", "") or "")
+        state.originator = str(body.get("originator", "") or "")
+        state.source = str(body.get("source", "") or "")
+        state.cwd = str(body.get("cwd", "") or "")
+        meta_started_at = _parse_timestamp(str(body.get("timestamp", "") or ""))
+        state.meta_started_at = _iso(meta_started_at) if meta_started_at else ""
+        # Most sessions belong to other repos; stop before reading them.
+        state.foreign = not _is_session_for_target(state.cwd, target)
+        return
+    if body.get("type") != "user_message":
+        return
+    message = str(body.get("message", "") or "").strip()
+    if not message:
+        return
+    if state.user_messages == 0:
+        state.plan_first = _plan_first(message)
+        state.first_message_at = _iso(timestamp) if timestamp else ""
+    elif REDIRECT_PATTERN.search(message):
+        state.redirects += 1
+    state.user_messages += 1
+    state.prompt_chars += len(message)
+    state.prompt_words += len(message.split())
+    short_prompt = _extract_short_prompt(message)
+    if short_prompt is not None:
+        state.short_prompts.append(short_prompt)
+    mentions = matcher.extract(message)
+    if mentions:
+        state.skills = sorted(set(state.skills).union(mentions))
+
+
+def _scan_session_file(
+    path: Path, target: Path, state: TranscriptState, matcher: SkillMatcher
+) -> tuple[TranscriptState, TranscriptState]:
+    """Feed the bytes after ``state.offset`` into ``state``.
+
+    Returns the resumable state (complete lines only) and the state to report,
+    which also counts a trailing line that is still being written.
+    """
+    with path.open("rb") as handle:
+        handle.seek(state.offset)
+        for raw in handle:
+            if state.foreign:
+                break
+            if not raw.endswith(b"\n"):
+                pending = copy.deepcopy(state)
+                try:
+                    _feed_line(pending, raw.decode("utf-8"), target, matcher)
+                except ValueError:
+                    return state, state
+                return state, pending
+            state.offset += len(raw)
+            line = raw.decode("utf-8")
+            if line.strip():
+                _feed_line(state, line, target, matcher)
+    return state, state
+
+
+def _transcript_from_state(
+    path: Path, state: TranscriptState
+) -> SessionTranscript | None:
+    if not state.has_meta or state.foreign:
         return None
-
-    started_at = _parse_timestamp(str(meta.get("timestamp", "") or ""))
+    started_at = _parse_timestamp(state.meta_started_at)
     if started_at is None:
-        started_at = user_messages[0][0] if user_messages else last_event_at
+        started_at = _parse_timestamp(
+            state.first_message_at if state.user_messages else state.last_event_at
+        )
     if started_at is None:
         return None
-    if last_event_at is None:
-        last_event_at = started_at
-
-    prompt_chars = sum(len(text) for _, text in user_messages)
-    prompt_words = sum(len(text.split()) for _, text in user_messages)
-    short_prompts = tuple(
-        prompt
-        for _, text in user_messages
-        if (prompt := _extract_short_prompt(text)) is not None
-    )
-    redirects = sum(
-        1
-        for index, (_, text) in enumerate(user_messages)
-        if index > 0 and REDIRECT_PATTERN.search(text)
-    )
+    last_event_at = _parse_timestamp(state.last_event_at) or started_at
     duration_minutes = max(0, int((last_event_at - started_at).total_seconds() // 60))
 
     return SessionTranscript(
         summary=SessionSummary(
-            session_id=str(meta.get("id", "") or path.stem),
+            session_id=state.session_id or path.stem,
             tool="codex",
-            originator=str(meta.get("originator", "") or ""),
-            source=str(meta.get("source", "") or ""),
-            cwd=cwd,
-            started_at=started_at.isoformat().replace("+00:00", "Z"),
-            last_event_at=last_event_at.isoformat().replace("+00:00", "Z"),
+            originator=state.originator,
+            source=state.source,
+            cwd=state.cwd,
+            started_at=_iso(started_at),
+            last_event_at=_iso(last_event_at),
             duration_minutes=duration_minutes,
-            user_messages=len(user_messages),
-            prompt_chars=prompt_chars,
-            prompt_words=prompt_words,
-            plan_first=bool(user_messages and _plan_first(user_messages[0][1])),
-            redirects=redirects,
+            user_messages=state.user_messages,
+            prompt_chars=state.prompt_chars,
+            prompt_words=state.prompt_words,
+            plan_first=state.plan_first,
+            redirects=state.redirects,
             long_session=duration_minutes >= LONG_SESSION_MINUTES,
-            short_prompts=short_prompts,
+            short_prompts=tuple(state.short_prompts),
         ),
-        user_messages=tuple(text for _, text in user_messages),
+        skills=tuple(state.skills),
+    )
+
+
+@dataclass
+class _SessionJob:
+    path: Path
+    stat: os.stat_result | None
+    state: TranscriptState
+    done: bool
+
+
+def _plan_session(path: Path, index: ReflectIndex | None) -> _SessionJob:
+    """Decide whether ``path`` needs reading and from which stored state."""
+    if index is None:
+        return _SessionJob(path=path, stat=None, state=TranscriptState(), done=False)
+    stat = path.stat()
+    entry = index.lookup(path, stat)
+    stored: TranscriptState | None = None
+    if entry is not None:
+        try:
+            stored = TranscriptState(**entry["state"])
+        except TypeError:
+            stored = None
+    if stored is not None and (stored.foreign or index.unchanged(entry or {}, stat)):
+        index.files_skipped += 1
+        return _SessionJob(path=path, stat=stat, state=stored, done=True)
+    if stored is not None:
+        index.files_resumed += 1
+    else:
+        index.files_parsed += 1
+        stored = TranscriptState()
+    return _SessionJob(path=path, stat=stat, state=stored, done=False)
+
+
+def _scan_job(
+    job: tuple[str, str, dict[str, Any], tuple[str, ...]],
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Process-pool entry point; states cross the boundary as plain dicts."""
+    path, target, state, vocabulary = job
+    resumable, report = _scan_session_file(
+        Path(path), Path(target), TranscriptState(**state), skill_matcher(vocabulary)
+    )
+    return asdict(resumable), asdict(report)
+
+
+def _finish_session(
+    job: _SessionJob,
+    resumable: TranscriptState,
+    report: TranscriptState,
+    index: ReflectIndex | None,
+) -> SessionTranscript | None:
+    if index is not None and job.stat is not None:
+        index.store(job.path, job.stat, asdict(resumable))
+    return _transcript_from_state(job.path, report)
+
+
+def _parse_session_transcript(
+    path: Path,
+    target: Path,
+    index: ReflectIndex | None = None,
+    matcher: SkillMatcher | None = None,
+) -> SessionTranscript | None:
+    job = _plan_session(path, index)
+    if job.done:
+        return _transcript_from_state(path, job.state)
+    resumable, report = _scan_session_file(
+        path, target, job.state, matcher or skill_matcher()
     )
+    return _finish_session(job, resumable, report, index)
+
+
+def _pool_size(jobs: int, files_count: int) -> int:
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    return max(1, min(jobs, files_count))
+
+
+def _iter_parallel_transcripts(
+    plans: list[_SessionJob],
+    target: Path,
+    index: ReflectIndex | None,
+    source: SessionSource,
+) -> Iterator[SessionTranscript | None]:
+    pending = [job for job in plans if not job.done]
+    workers = _pool_size(source.jobs, len(pending))
+    if workers <= 1:
+        for job in plans:
+            if job.done:
+                yield _transcript_from_state(job.path, job.state)
+            else:
+                resumable, report = _scan_session_file(
+                    job.path, target, job.state, source.matcher
+                )
+                yield _finish_session(job, resumable, report, index)
+        return
+
+    chunksize = max(1, len(pending) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # map() yields in submission order, so merging with the skipped jobs
+        # below keeps the serial ordering.
+        scanned = pool.map(
+            _scan_job,
+            [
+                (str(job.path), str(target), asdict(job.state), source.skill_vocabulary)
+                for job in pending
+            ],
+            chunksize=chunksize,
+        )
+        for job in plans:
+            if job.done:
+                yield _transcript_from_state(job.path, job.state)
+                continue
+            resumable_state, report_state = next(scanned)
+            yield _finish_session(
+                job,
+                TranscriptState(**resumable_state),
+                TranscriptState(**report_state),
+                index,
+            )
+
+
+def iter_codex_session_transcripts(
+    target: Path, source: SessionSource, *, index: ReflectIndex | None = None
+) -> Iterator[SessionTranscript]:
+    paths = _iter_session_files(source)
+    if source.jobs == 1:
+        items: Iterator[SessionTranscript | None] = (
+            _parse_session_transcript(path, target, index, source.matcher)
+            for path in paths
+        )
+    else:
+        plans = [_plan_session(path, index) for path in paths]
+        items = _iter_parallel_transcripts(plans, target, index, source)
+    for item in items:
+        if item is not None:
+            yield item
+    if index is not None:
+        index.prune_missing()
 
 
 def load_codex_session_transcripts(
-    target: Path, codex_root: Path
+    target: Path, source: SessionSource, *, index: ReflectIndex | None = None
 ) -> list[SessionTranscript]:
-    session_files = _iter_session_files(codex_root)
-    return [
-        item
-        for path in session_files
-        if (item := _parse_session_transcript(path, target))
-    ]
+    return list(iter_codex_session_transcripts(target, source, index=index))
 
 
-def reflect_sessions_payload(
-    target: Path, codex_root: Path
-) -> tuple[dict[str, object], dict[str, object]]:
-    transcripts = load_codex_session_transcripts(target, codex_root)
-    sessions = [item.summary for item in transcripts]
-
-    prompt_count = sum(item.user_messages for item in sessions)
-    prompt_chars_total = sum(item.prompt_chars for item in sessions)
-    plan_first_sessions = sum(1 for item in sessions if item.plan_first)
-    redirects = sum(item.redirects for item in sessions)
-    long_sessions = sum(1 for item in sessions if item.long_session)
-    hour_counts: Counter[int] = Counter()
-    short_prompt_counts: Counter[str] = Counter()
-    for item in sessions:
-        hour = _parse_timestamp(item.started_at)
-        if hour is not None:
-            hour_counts[hour.hour] += 1
-        short_prompt_counts.update(item.short_prompts)
-
-    top_short_prompts = [
-        {"prompt": prompt, "count": count}
-        for prompt, count in short_prompt_counts.most_common(10)
-    ]
-    top_hours = [
-        {"hour": hour, "count": count} for hour, count in hour_counts.most_common(5)
-    ]
+class ReflectAnalyzer(Protocol):
+    def feed(self, transcript: SessionTranscript) -> None: ...
+
+
+def run_reflect_analyzers(
+    transcripts: Iterable[SessionTranscript], analyzers: Sequence[ReflectAnalyzer]
+) -> int:
+    """Feed every transcript to every analyzer in one pass; returns the count."""
+    count = 0
+    for transcript in transcripts:
+        count += 1
+        for analyzer in analyzers:
+            analyzer.feed(transcript)
+    return count
+
+
+class SessionSummaryAnalyzer:
+    """Keeps the per-session rows written to agent-sessions.json."""
+
+    def __init__(self) -> None:
+        self.sessions: list[SessionSummary] = []
+
+    def feed(self, transcript: SessionTranscript) -> None:
+        self.sessions.append(transcript.summary)
+
 
+class SignalsAnalyzer:
+    """Aggregate prompt and steering signals across sessions."""
+
+    def __init__(self) -> None:
+        self.session_count = 0
+        self.prompt_count = 0
+        self.prompt_chars_total = 0
+        self.plan_first_sessions = 0
+        self.redirect_count = 0
+        self.long_sessions = 0
+        self.hour_counts: Counter[int] = Counter()
+
+    def feed(self, transcript: SessionTranscript) -> None:
+        item = transcript.summary
+        self.session_count += 1
+        self.prompt_count += item.user_messages
+        self.prompt_chars_total += item.prompt_chars
+        self.plan_first_sessions += int(item.plan_first)
+        self.redirect_count += item.redirects
+        self.long_sessions += int(item.long_session)
+        started_at = _parse_timestamp(item.started_at)
+        if started_at is not None:
+            self.hour_counts[started_at.hour] += 1
+
+    @property
+    def avg_prompt_chars(self) -> int:
+        if not self.prompt_count:
+            return 0
+        return int(self.prompt_chars_total / self.prompt_count)
+
+
+class ShortPromptAnalyzer:
+    """Counts repeated short prompts across sessions."""
+
+    def __init__(self) -> None:
+        self.counts: Counter[str] = Counter()
+
+    def feed(self, transcript: SessionTranscript) -> None:
+        self.counts.update(transcript.summary.short_prompts)
+
+    def top(self, limit: int = 10) -> list[dict[str, object]]:
+        return [
+            {"prompt": prompt, "count": count}
+            for prompt, count in self.counts.most_common(limit)
+        ]
+
+
+def build_sessions_payload(
+    target: Path, source: SessionSource, sessions: SessionSummaryAnalyzer
+) -> dict[str, object]:
+    items = sessions.sessions
+    prompt_count = sum(item.user_messages for item in items)
+    prompt_chars_total = sum(item.prompt_chars for item in items)
     session_payload: dict[str, object] = {
         "version": 1,
         "generated_by": "agentsgen",
         "generated_at": utc_now_iso(),
         "repo": {"path": str(target.resolve())},
-        "source": {"tool": "codex", "root": str(codex_root)},
+        "source": source.payload(),
         "sessions": [
             {
                 "session_id": item.session_id,
@@ -339,63 +734,88 @@ def reflect_sessions_payload(
                 "long_session": item.long_session,
                 "short_prompts": list(item.short_prompts),
             }
-            for item in sessions
+            for item in items
         ],
         "summary": {
-            "session_count": len(sessions),
+            "session_count": len(items),
             "prompt_count": prompt_count,
             "prompt_chars_total": prompt_chars_total,
             "avg_prompt_chars": int(prompt_chars_total / prompt_count)
             if prompt_count
             else 0,
-            "plan_first_sessions": plan_first_sessions,
-            "redirect_count": redirects,
-            "long_sessions": long_sessions,
+            "plan_first_sessions": sum(1 for item in items if item.plan_first),
+            "redirect_count": sum(item.redirects for item in items),
+            "long_sessions": sum(1 for item in items if item.long_session),
         },
     }
     validate_reflect_sessions_payload(session_payload)
+    return session_payload
 
+
+def build_signals_payload(
+    target: Path,
+    source: SessionSource,
+    signals: SignalsAnalyzer,
+    short_prompts: ShortPromptAnalyzer,
+) -> dict[str, object]:
     signals_payload: dict[str, object] = {
         "version": 1,
         "generated_by": "agentsgen",
         "generated_at": utc_now_iso(),
         "repo": {"path": str(target.resolve())},
-        "source": {"tool": "codex", "root": str(codex_root)},
+        "source": source.payload(),
         "summary": {
-            "session_count": len(sessions),
-            "prompt_count": prompt_count,
-            "avg_prompt_chars": int(prompt_chars_total / prompt_count)
-            if prompt_count
+            "session_count": signals.session_count,
+            "prompt_count": signals.prompt_count,
+            "avg_prompt_chars": signals.avg_prompt_chars,
+            "plan_first_ratio": int(
+                (signals.plan_first_sessions * 100) / signals.session_count
+            )
+            if signals.session_count
             else 0,
-            "plan_first_ratio": int((plan_first_sessions * 100) / len(sessions))
-            if sessions
-            else 0,
-            "redirect_count": redirects,
-            "long_sessions": long_sessions,
-            "top_hours": top_hours,
+            "redirect_count": signals.redirect_count,
+            "long_sessions": signals.long_sessions,
+            "top_hours": [
+                {"hour": hour, "count": count}
+                for hour, count in signals.hour_counts.most_common(5)
+            ],
         },
-        "top_short_prompts": top_short_prompts,
+        "top_short_prompts": short_prompts.top(),
     }
     validate_reflect_signals_payload(signals_payload)
-    return session_payload, signals_payload
+    return signals_payload
 
 
-def apply_reflect_sessions(
-    target: Path,
-    *,
-    codex_root: Path,
+def reflect_sessions_payload(
+    target: Path, source: SessionSource, *, index: ReflectIndex | None = None
+) -> tuple[dict[str, object], dict[str, object]]:
+    sessions = SessionSummaryAnalyzer()
+    signals = SignalsAnalyzer()
+    short_prompts = ShortPromptAnalyzer()
+    run_reflect_analyzers(
+        iter_codex_session_transcripts(target, source, index=index),
+        [sessions, signals, short_prompts],
+    )
+    return (
+        build_sessions_payload(target, source, sessions),
+        build_signals_payload(target, source, signals, short_prompts),
+    )
+
+
+def sessions_artifact_results(
     output_dir: Path,
+    session_payload: dict[str, object],
+    signals_payload: dict[str, object],
+    *,
     dry_run: bool,
     print_diff: bool,
-) -> tuple[list[FileResult], dict[str, object], dict[str, object]]:
-    session_payload, signals_payload = reflect_sessions_payload(target, codex_root)
+) -> list[FileResult]:
     summary = cast(dict[str, object], signals_payload["summary"])
     top_short_prompts = cast(
         list[dict[str, object]], signals_payload["top_short_prompts"]
     )
     patterns_md = _render_patterns(summary, top_short_prompts)
-
-    results = [
+    return [
         handle_generated_json_artifact(
             output_dir / "agent-sessions.json",
             json.dumps(session_payload, indent=2) + "\n",
@@ -415,4 +835,25 @@ def apply_reflect_sessions(
             print_diff=print_diff,
         ),
     ]
+
+
+def apply_reflect_sessions(
+    target: Path,
+    *,
+    source: SessionSource,
+    output_dir: Path,
+    dry_run: bool,
+    print_diff: bool,
+    index: ReflectIndex | None = None,
+) -> tuple[list[FileResult], dict[str, object], dict[str, object]]:
+    session_payload, signals_payload = reflect_sessions_payload(
+        target, source, index=index
+    )
+    results = sessions_artifact_results(
+        output_dir,
+        session_payload,
+        signals_payload,
+        dry_run=dry_run,
+        print_diff=print_diff,
+    )
     return results, session_payload, signals_payload
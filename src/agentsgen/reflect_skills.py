@@ -1,15 +1,18 @@
 from __future__ import annotations
 
 import json
-import re
 from collections import defaultdict
 from pathlib import Path
 from typing import cast
 
 from .generated_artifacts import handle_generated_json_artifact
+from .reflect_index import ReflectIndex
 from .reflect_sessions import (
+    SessionSource,
+    SessionTranscript,
     _handle_generated_text_artifact,
-    load_codex_session_transcripts,
+    iter_codex_session_transcripts,
+    run_reflect_analyzers,
     utc_now_iso,
 )
 from .result_types import FileResult
@@ -18,39 +21,6 @@ from .validators import (
 )
 
 
-SKILL_TOKEN_RE = re.compile(r"\$([A-Za-z0-9_.-]+(?::[A-Za-z0-9_.-]+)?)")
-SKILL_PHRASE_RE = re.compile(
-    r"\b(?:use|using|with|apply|run|try)\s+([A-Za-z0-9_.-]+(?::[A-Za-z0-9_.-]+)?)\s+skill\b",
-    re.IGNORECASE,
-)
-SKILL_CARD_RE = re.compile(
-    r"\b([A-Za-z0-9_.-]+(?::[A-Za-z0-9_.-]+)?)\b(?=[`\"']?\s+(?:skill|skills)\b)",
-    re.IGNORECASE,
-)
-SKILL_STOPWORDS = {"use", "using", "with", "apply", "run", "try", "skill", "skills"}
-
-
-def _normalize_skill_name(raw: str) -> str:
-    return raw.strip().strip("`'\"").lower()
-
-
-def _extract_skill_mentions(text: str) -> list[str]:
-    mentions: list[str] = []
-    for match in SKILL_TOKEN_RE.finditer(text):
-        mentions.append(_normalize_skill_name(match.group(1)))
-    for match in SKILL_PHRASE_RE.finditer(text):
-        mentions.append(_normalize_skill_name(match.group(1)))
-    for match in SKILL_CARD_RE.finditer(text):
-        candidate = _normalize_skill_name(match.group(1))
-        if (
-            len(candidate) >= 3
-            and candidate not in SKILL_STOPWORDS
-            and candidate not in mentions
-        ):
-            mentions.append(candidate)
-    return sorted(set(mentions))
-
-
 def _bucket_for(
     *,
     activations: int,
@@ -120,24 +90,24 @@ def _render_effectiveness(
     return "\n".join(lines)
 
 
-def reflect_skills_payload(
-    target: Path, codex_root: Path
-) -> tuple[dict[str, object], str]:
-    transcripts = load_codex_session_transcripts(target, codex_root)
-    skill_rows: dict[str, dict[str, object]] = {}
-    total_activations = 0
-    sessions_with_skills = 0
-
-    for transcript in transcripts:
-        mentioned: set[str] = set()
-        for message in transcript.user_messages:
-            mentioned.update(_extract_skill_mentions(message))
+class SkillUsageAnalyzer:
+    """Per-skill activation rows built from session skill mentions."""
+
+    def __init__(self) -> None:
+        self.rows: dict[str, dict[str, object]] = {}
+        self.session_count = 0
+        self.sessions_with_skills = 0
+        self.total_activations = 0
+
+    def feed(self, transcript: SessionTranscript) -> None:
+        self.session_count += 1
+        mentioned = transcript.skills
         if not mentioned:
-            continue
-        sessions_with_skills += 1
-        total_activations += len(mentioned)
-        for skill in sorted(mentioned):
-            row = skill_rows.setdefault(
+            return
+        self.sessions_with_skills += 1
+        self.total_activations += len(mentioned)
+        for skill in mentioned:
+            row = self.rows.setdefault(
                 skill,
                 {
                     "skill": skill,
@@ -162,8 +132,12 @@ def reflect_skills_payload(
             )
             cast(list[str], row["session_ids"]).append(transcript.summary.session_id)
 
+
+def build_skill_usage_payload(
+    target: Path, source: SessionSource, usage: SkillUsageAnalyzer
+) -> tuple[dict[str, object], str]:
     skills: list[dict[str, object]] = []
-    for skill, row in sorted(skill_rows.items()):
+    for skill, row in sorted(usage.rows.items()):
         sessions = cast(int, row["sessions"])
         activations = cast(int, row["activations"])
         plan_first_sessions = cast(int, row["plan_first_sessions"])
@@ -198,11 +172,11 @@ def reflect_skills_payload(
         "generated_by": "agentsgen",
         "generated_at": utc_now_iso(),
         "repo": {"path": str(target.resolve())},
-        "source": {"tool": "codex", "root": str(codex_root)},
+        "source": source.payload(),
         "summary": {
-            "session_count": len(transcripts),
-            "sessions_with_skills": sessions_with_skills,
-            "skill_activation_count": total_activations,
+            "session_count": usage.session_count,
+            "sessions_with_skills": usage.sessions_with_skills,
+            "skill_activation_count": usage.total_activations,
             "unique_skills": len(skills),
         },
         "skills": skills,
@@ -216,16 +190,25 @@ def reflect_skills_payload(
     return usage_payload, effectiveness_md
 
 
-def apply_reflect_skills(
-    target: Path,
-    *,
-    codex_root: Path,
+def reflect_skills_payload(
+    target: Path, source: SessionSource, *, index: ReflectIndex | None = None
+) -> tuple[dict[str, object], str]:
+    usage = SkillUsageAnalyzer()
+    run_reflect_analyzers(
+        iter_codex_session_transcripts(target, source, index=index), [usage]
+    )
+    return build_skill_usage_payload(target, source, usage)
+
+
+def skills_artifact_results(
     output_dir: Path,
+    usage_payload: dict[str, object],
+    effectiveness_md: str,
+    *,
     dry_run: bool,
     print_diff: bool,
-) -> tuple[list[FileResult], dict[str, object]]:
-    usage_payload, effectiveness_md = reflect_skills_payload(target, codex_root)
-    results = [
+) -> list[FileResult]:
+    return [
         handle_generated_json_artifact(
             output_dir / "skill-usage.json",
             json.dumps(usage_payload, indent=2) + "\n",
@@ -239,4 +222,25 @@ def apply_reflect_skills(
             print_diff=print_diff,
         ),
     ]
+
+
+def apply_reflect_skills(
+    target: Path,
+    *,
+    source: SessionSource,
+    output_dir: Path,
+    dry_run: bool,
+    print_diff: bool,
+    index: ReflectIndex | None = None,
+) -> tuple[list[FileResult], dict[str, object]]:
+    usage_payload, effectiveness_md = reflect_skills_payload(
+        target, source, index=index
+    )
+    results = skills_artifact_results(
+        output_dir,
+        usage_payload,
+        effectiveness_md,
+        dry_run=dry_run,
+        print_diff=print_diff,
+    )
     return results, usage_payload
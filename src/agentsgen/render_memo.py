@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import dataclasses
+import hashlib
+import json
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .config import ToolConfig
+
+T = TypeVar("T")
+
+# Project names are swapped for these tokens before rendering so repos that
+# only differ by name share one cached render; the real names are put back
+# with a plain string replace afterwards.
+_NAME_TOKENS = ("\x00agentsgen:project.name\x00", "\x00agentsgen:info.name\x00")
+
+
+@dataclass
+class RenderMemo:
+    entries: dict[str, Any] = field(default_factory=dict)
+    template_digests: dict[str, str] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+
+    def template_digest(self, path: Path) -> str:
+        key = str(path)
+        digest = self.template_digests.get(key)
+        if digest is None:
+            digest = hashlib.sha256(path.read_bytes()).hexdigest()
+            self.template_digests[key] = digest
+        return digest
+
+    def stats(self) -> dict[str, int]:
+        return {"entries": len(self.entries), "hits": self.hits, "misses": self.misses}
+
+
+_ACTIVE: RenderMemo | None = None
+
+
+@contextmanager
+def render_memo() -> Iterator[RenderMemo]:
+    """Share render results across every repo processed inside the block."""
+    global _ACTIVE
+    previous = _ACTIVE
+    memo = previous or RenderMemo()
+    _ACTIVE = memo
+    try:
+        yield memo
+    finally:
+        _ACTIVE = previous
+
+
+def active_render_memo() -> RenderMemo | None:
+    return _ACTIVE
+
+
+def _portable_name(value: object) -> bool:
+    if not isinstance(value, str) or not value:
+        return False
+    if value != value.strip() or "\n" in value or "\r" in value:
+        return False
+    return "\x00" not in value
+
+
+def _with_name_tokens(cfg: ToolConfig) -> tuple[ToolConfig, tuple[str, str]] | None:
+    project_name = (cfg.project or {}).get("name")
+    info_name = cfg.project_info.project_name
+    if not (_portable_name(project_name) and _portable_name(info_name)):
+        return None
+    tokenized = dataclasses.replace(
+        cfg,
+        project={**cfg.project, "name": _NAME_TOKENS[0]},
+        project_info=dataclasses.replace(
+            cfg.project_info, project_name=_NAME_TOKENS[1]
+        ),
+    )
+    return tokenized, (str(project_name), info_name)
+
+
+def _restore_names(value: Any, names: tuple[str, str]) -> Any:
+    def restore(text: str) -> str:
+        for token, name in zip(_NAME_TOKENS, names):
+            text = text.replace(token, name)
+        return text
+
+    if isinstance(value, tuple):
+        return tuple(restore(item) for item in value)
+    return restore(value)
+
+
+def memoized_render(
+    kind: str,
+    cfg: ToolConfig,
+    *,
+    depends: Callable[[ToolConfig], object],
+    templates: list[Path],
+    render: Callable[[ToolConfig], T],
+) -> T:
+    """Render through the active memo, keyed by the config fields it reads.
+
+    ``depends`` must return every config value ``render`` reads; it becomes
+    the fingerprint together with the digests of ``templates``. Without an
+    active memo this simply calls ``render``.
+    """
+    memo = _ACTIVE
+    if memo is None:
+        return render(cfg)
+
+    swapped = _with_name_tokens(cfg)
+    keyed_cfg = swapped[0] if swapped else cfg
+    fingerprint = json.dumps(
+        [
+            kind,
+            depends(keyed_cfg),
+            [memo.template_digest(path) for path in templates],
+        ],
+        sort_keys=True,
+        default=str,
+    )
+    key = hashlib.sha256(fingerprint.encode("utf-8")).hexdigest()
+    if key in memo.entries:
+        memo.hits += 1
+        rendered = memo.entries[key]
+    else:
+        memo.misses += 1
+        rendered = render(keyed_cfg)
+        memo.entries[key] = rendered
+    return _restore_names(rendered, swapped[1]) if swapped else rendered
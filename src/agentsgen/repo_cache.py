@@ -0,0 +1,179 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, TypeVar
+
+from .cancellation import check_cancelled
+from .understand_ast import _EXCLUDED_DIRS
+
+T = TypeVar("T")
+
+# git state changes (commit, stage, checkout) alter `--changed` slices and
+# drift checks without touching working-tree files.
+_GIT_STATE_FILES = ("HEAD", "index")
+
+
+def repo_fingerprint(root: Path) -> str:
+    """Digest of (path, mtime_ns, size) for every repo input file.
+
+    Only stats are read, never file contents, so this stays far cheaper than
+    the detection and import scans it guards.
+    """
+    root = root.resolve()
+    digest = hashlib.sha256()
+    stack = [root]
+    while stack:
+        check_cancelled()
+        current = stack.pop()
+        try:
+            entries = sorted(os.scandir(current), key=lambda entry: entry.name)
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in _EXCLUDED_DIRS:
+                        stack.append(Path(entry.path))
+                    continue
+                stat = entry.stat()
+            except OSError:
+                continue
+            rel_path = os.path.relpath(entry.path, root)
+            digest.update(f"{rel_path}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    for name in _GIT_STATE_FILES:
+        try:
+            stat = (root / ".git" / name).stat()
+        except OSError:
+            continue
+        digest.update(f".git/{name}\0{stat.st_mtime_ns}\0{stat.st_size}\n".encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class _RepoEntry:
+    fingerprint: str
+    values: dict[str, Any] = field(default_factory=dict)
+
+
+class RepoView:
+    """Cache access for one repo, bound to the fingerprint taken on creation."""
+
+    def __init__(self, cache: RepoCache, root: Path, entry: _RepoEntry):
+        self._cache = cache
+        self.root = root
+        self._entry = entry
+
+    @property
+    def fingerprint(self) -> str:
+        return self._entry.fingerprint
+
+    def get(self, key: str, compute: Callable[[], Any]) -> Any:
+        with self._cache._lock:
+            if key in self._entry.values:
+                self._cache.hits += 1
+                return self._entry.values[key]
+        value = compute()
+        with self._cache._lock:
+            self._cache.misses += 1
+            self._entry.values[key] = value
+        return value
+
+
+class RepoCache:
+    """Per-path state for long-lived processes, invalidated by repo fingerprint."""
+
+    def __init__(self, max_repos: int = 16):
+        self.max_repos = max_repos
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._repos: OrderedDict[str, _RepoEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def view(self, root: Path) -> RepoView:
+        resolved = root.resolve()
+        fingerprint = repo_fingerprint(resolved)
+        key = str(resolved)
+        with self._lock:
+            entry = self._repos.get(key)
+            if entry is None or entry.fingerprint != fingerprint:
+                if entry is not None:
+                    self.invalidations += 1
+                entry = _RepoEntry(fingerprint=fingerprint)
+                self._repos[key] = entry
+            self._repos.move_to_end(key)
+            while len(self._repos) > self.max_repos:
+                self._repos.popitem(last=False)
+        return RepoView(self, resolved, entry)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._repos.clear()
+
+    def stats(self) -> dict[str, object]:
+        with self._lock:
+            return {
+                "repos_count": len(self._repos),
+                "max_repos": self.max_repos,
+                "hits": self.hits,
+                "misses": self.misses,
+                "invalidations": self.invalidations,
+                "repos": [
+                    {"path": path, "keys": sorted(entry.values)}
+                    for path, entry in self._repos.items()
+                ],
+            }
+
+
+@dataclass
+class _CacheScope:
+    cache: RepoCache
+    views: dict[Path, RepoView] = field(default_factory=dict)
+
+
+_ACTIVE_SCOPE: ContextVar[_CacheScope | None] = ContextVar(
+    "agentsgen_repo_cache_scope", default=None
+)
+
+
+@contextmanager
+def repo_cache_scope(cache: RepoCache) -> Iterator[RepoCache]:
+    """Let ``cached_for_repo`` calls inside the block share ``cache``.
+
+    Each repo is fingerprinted once per scope, on first use, so one scope
+    should cover one command run: later file changes are only noticed by
+    the next scope.
+    """
+    token = _ACTIVE_SCOPE.set(_CacheScope(cache))
+    try:
+        yield cache
+    finally:
+        _ACTIVE_SCOPE.reset(token)
+
+
+def cached_for_repo(
+    root: Path, key: str, compute: Callable[[], T], *, copy_value: bool = False
+) -> T:
+    """``compute()``, memoized per repo while a ``repo_cache_scope`` is active.
+
+    ``copy_value`` hands out a deep copy for values callers may mutate.
+    """
+    scope = _ACTIVE_SCOPE.get()
+    if scope is None:
+        return compute()
+    resolved = root.resolve()
+    view = scope.views.get(resolved)
+    if view is None:
+        view = scope.cache.view(resolved)
+        scope.views[resolved] = view
+    value = view.get(key, compute)
+    return copy.deepcopy(value) if copy_value else value
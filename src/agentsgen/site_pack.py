@@ -1,18 +1,25 @@
 from __future__ import annotations
 
-from collections import defaultdict
-import re
-from typing import Iterable
+import bisect
+from collections import defaultdict, deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+import gzip
+import hashlib
+import io
+from typing import Iterable, Iterator
 from urllib.parse import urljoin, urlparse
-from urllib.request import Request, urlopen
 import xml.etree.ElementTree as ET
+import zlib
 
-_TITLE_RE = re.compile(r"<title[^>]*>(.*?)</title>", re.IGNORECASE | re.DOTALL)
-_META_DESCRIPTION_RE = re.compile(
-    r'<meta[^>]+name=["\']description["\'][^>]+content=["\'](.*?)["\']',
-    re.IGNORECASE | re.DOTALL,
-)
-_WHITESPACE_RE = re.compile(r"\s+")
+from .html_evidence import extract_html_evidence
+from .http_fetch import default_fetcher
+
+# Child sitemaps fetched ahead of the parser, and the most sitemap files
+# (indexes included) followed for one site.
+SITEMAP_FETCH_WINDOW = 6
+MAX_SITEMAP_FILES = 2000
+REPRESENTATIVE_URLS = 12
 
 
 def _normalize_url(url: str) -> str:
@@ -28,31 +35,8 @@ def _normalize_url(url: str) -> str:
     return raw
 
 
-def _fetch_url(url: str, *, timeout: float = 10.0) -> str:
-    request = Request(
-        url,
-        headers={
-            "User-Agent": "agentsgen/0.1 (+https://github.com/markoblogo/AGENTS.md_generator)"
-        },
-    )
-    with urlopen(request, timeout=timeout) as response:
-        body = response.read()
-        charset = response.headers.get_content_charset() or "utf-8"
-        return body.decode(charset, errors="replace")
-
-
-def _extract_title(html: str) -> str:
-    match = _TITLE_RE.search(html)
-    if not match:
-        return ""
-    return _WHITESPACE_RE.sub(" ", match.group(1)).strip()
-
-
-def _extract_meta_description(html: str) -> str:
-    match = _META_DESCRIPTION_RE.search(html)
-    if not match:
-        return ""
-    return _WHITESPACE_RE.sub(" ", match.group(1)).strip()
+def _fetch_url(url: str) -> str:
+    return default_fetcher().fetch(url).text()
 
 
 def _site_base_url(url: str) -> str:
@@ -60,27 +44,99 @@ def _site_base_url(url: str) -> str:
     return f"{parsed.scheme}://{parsed.netloc}"
 
 
-def _fetch_optional_text(url: str) -> str:
+def _fetch_optional_bytes(url: str) -> bytes:
     try:
-        return _fetch_url(url)
+        return default_fetcher().fetch(url).body
     except Exception:
-        return ""
+        return b""
 
 
-def _parse_sitemap_urls(xml_text: str) -> list[str]:
-    if not xml_text.strip():
-        return []
-    try:
-        root = ET.fromstring(xml_text)
-    except ET.ParseError:
-        return []
+def _sitemap_stream(body: bytes) -> io.BufferedIOBase:
+    if body[:2] == b"\x1f\x8b":
+        return gzip.GzipFile(fileobj=io.BytesIO(body))
+    return io.BytesIO(body)
+
+
+def _iter_sitemap_entries(body: bytes) -> Iterator[tuple[str, str]]:
+    """Yield ``(kind, loc)`` pairs, kind being the root tag (``urlset`` or
+    ``sitemapindex``).
 
-    urls: list[str] = []
-    for loc in root.findall(".//{*}loc"):
-        value = (loc.text or "").strip()
-        if value:
-            urls.append(value)
-    return sorted(dict.fromkeys(urls))
+    Parsed with ``iterparse`` and pruned per entry, so no tree is kept. A
+    malformed or truncated document yields whatever parsed before the error.
+    """
+    if not body.strip():
+        return
+    kind = ""
+    root: ET.Element | None = None
+    try:
+        for event, elem in ET.iterparse(_sitemap_stream(body), events=("start", "end")):
+            tag = elem.tag.rsplit("}", 1)[-1]
+            if event == "start":
+                if root is None:
+                    root, kind = elem, tag
+                continue
+            if tag == "loc":
+                value = (elem.text or "").strip()
+                if value:
+                    yield kind, value
+            elif tag in {"url", "sitemap"} and root is not None:
+                root.clear()
+    except (ET.ParseError, OSError, EOFError, zlib.error):
+        return
+
+
+def _iter_sitemap_urls(
+    sitemap_url: str,
+    *,
+    window: int = SITEMAP_FETCH_WINDOW,
+    max_files: int = MAX_SITEMAP_FILES,
+) -> Iterator[str]:
+    """Page URLs from a sitemap, following sitemap indexes breadth-first.
+
+    Child sitemaps are fetched concurrently, at most ``window`` ahead of the
+    parser, and parsed in discovery order so the output is deterministic.
+    """
+    executor = default_fetcher().executor()
+    queued: deque[str] = deque([sitemap_url])
+    seen = {sitemap_url}
+    inflight: deque[Future[bytes]] = deque()
+    while queued or inflight:
+        while queued and len(inflight) < max(1, window):
+            inflight.append(executor.submit(_fetch_optional_bytes, queued.popleft()))
+        body = inflight.popleft().result()
+        for kind, loc in _iter_sitemap_entries(body):
+            if kind != "sitemapindex":
+                yield loc
+            elif loc not in seen and len(seen) < max_files:
+                seen.add(loc)
+                queued.append(loc)
+
+
+@dataclass
+class SitemapDigest:
+    """Running total and representative sample of unique sitemap URLs.
+
+    Uniqueness is tracked with 8-byte fingerprints rather than the URLs, and
+    only the ``sample_size`` lexically smallest URLs are kept.
+    """
+
+    sample_size: int = REPRESENTATIVE_URLS
+    total: int = 0
+    sample: list[str] = field(default_factory=list)
+    _seen: set[bytes] = field(default_factory=set, repr=False)
+
+    def observe(self, urls: Iterable[str]) -> Iterator[str]:
+        """Record each new URL and pass it through; duplicates are dropped."""
+        for url in urls:
+            key = hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest()
+            if key in self._seen:
+                continue
+            self._seen.add(key)
+            self.total += 1
+            if len(self.sample) < self.sample_size or url < self.sample[-1]:
+                bisect.insort(self.sample, url)
+                del self.sample[self.sample_size :]
+            yield url
 
 
 def _path_label(url: str, base_url: str) -> str:
@@ -109,27 +165,29 @@ def _group_paths(urls: Iterable[str], base_url: str) -> list[tuple[str, int]]:
 
 def build_site_llms_manifest(site_url: str) -> str:
     normalized_url = _normalize_url(site_url)
-    homepage_html = _fetch_url(normalized_url)
     base_url = _site_base_url(normalized_url)
     sitemap_url = urljoin(base_url.rstrip("/") + "/", "sitemap.xml")
-    sitemap_text = _fetch_optional_text(sitemap_url)
-    sitemap_urls = _parse_sitemap_urls(sitemap_text)
-
-    title = _extract_title(homepage_html) or base_url
-    description = _extract_meta_description(homepage_html) or (
+    homepage_future = default_fetcher().executor().submit(_fetch_url, normalized_url)
+    digest = SitemapDigest()
+    grouped = _group_paths(digest.observe(_iter_sitemap_urls(sitemap_url)), base_url)
+    homepage_html = homepage_future.result()
+    has_sitemap = digest.total > 0
+    if not has_sitemap:
+        grouped = _group_paths([normalized_url], base_url)
+
+    homepage = extract_html_evidence(homepage_html, text_chars=0)
+    title = homepage.title or base_url
+    description = homepage.meta_description or (
         "Website manifest generated from the homepage and sitemap."
     )
-    representative_urls = sitemap_urls[:12] if sitemap_urls else [normalized_url]
-    grouped = _group_paths(
-        representative_urls if sitemap_urls else [normalized_url], base_url
-    )
+    representative_urls = digest.sample if has_sitemap else [normalized_url]
 
     lines = [
         f"# {title}",
         "",
         f"Source: {base_url}",
         "Type: Website llms.txt manifest",
-        f"Total URLs: {len(sitemap_urls) if sitemap_urls else 1}",
+        f"Total URLs: {digest.total if has_sitemap else 1}",
         "",
         "## About",
         description,
@@ -145,7 +203,7 @@ def build_site_llms_manifest(site_url: str) -> str:
         lines.append(f"- {_path_label(url, base_url)}")
 
     lines.extend(["", "## Notes"])
-    if sitemap_urls:
+    if has_sitemap:
         lines.append("- Derived from the public sitemap plus the homepage.")
     else:
         lines.append("- Derived from the homepage only; no sitemap.xml was found.")
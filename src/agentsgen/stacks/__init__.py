@@ -1,6 +1,10 @@
 from __future__ import annotations
 
-from .base import StackAdapter
+from pathlib import Path
+
+from ..detect import DetectResult, detect_repo
+from ..model import ProjectInfo
+from .base import StackAdapter, project_name_from_dir
 from .node import NodeAdapter
 from .python import PythonAdapter
 from .static import StaticAdapter
@@ -16,3 +20,18 @@ def adapter_for(stack: str) -> StackAdapter:
         return StaticAdapter(name="static")
 
     raise ValueError(f"Unsupported stack: {stack}")
+
+
+def suggested_stack(det: DetectResult) -> str:
+    """The stack ``init`` suggests for a detection; mixed repos get ``static``."""
+    suggested = str(det.project.get("primary_stack", "static"))
+    return "static" if suggested == "mixed" else suggested
+
+
+def default_project_info(
+    target: Path, stack: str | None = None, name: str | None = None
+) -> ProjectInfo:
+    """What ``init --defaults`` records for ``target``, without prompting."""
+    stack = (stack or suggested_stack(detect_repo(target))).strip().lower()
+    project_name = (name or project_name_from_dir(target)).strip()
+    return adapter_for(stack).default_info(target, project_name)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+import signal
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .io_utils import read_json
+from .result_types import FileResult
+from .task_loop import _load_task_json, apply_task_evidence, normalize_task_id, task_dir
+
+DEFAULT_CHECK_IDS = ("test", "lint", "typecheck", "build")
+DEFAULT_CHECK_TIMEOUT_SECONDS = 600
+_ENTRYPOINTS_FILENAMES = (
+    "agents.entrypoints.json",
+    "agents.entrypoints.generated.json",
+)
+_UNSAFE_LOG_CHARS = re.compile(r"[^A-Za-z0-9._-]+")
+
+
+@dataclass(frozen=True)
+class CheckCommand:
+    id: str
+    command: str
+    cwd: str = "."
+
+
+@dataclass(frozen=True)
+class CheckRun:
+    check: CheckCommand
+    status: str
+    exit_code: int | None
+    duration_ms: int
+    timed_out: bool
+    log_path: Path
+
+    def evidence_row(self, root: Path) -> dict[str, object]:
+        return {
+            "name": self.check.id,
+            "status": self.status,
+            "required": True,
+            "kind": "command",
+            "command": self.check.command,
+            "exit_code": self.exit_code,
+            "duration_ms": self.duration_ms,
+            "timed_out": self.timed_out,
+            "log": _relpath(self.log_path, root),
+        }
+
+
+def _relpath(path: Path, root: Path) -> str:
+    try:
+        return str(path.relative_to(root)).replace("\\", "/")
+    except ValueError:
+        return str(path)
+
+
+def check_log_name(check_id: str) -> str:
+    """A log filename for ``check_id`` that cannot leave the log directory.
+
+    Ids that are not already plain names get a short digest suffix so two
+    ids that sanitise alike do not share a log.
+    """
+    safe = _UNSAFE_LOG_CHARS.sub("_", check_id).strip("._") or "check"
+    if safe != check_id:
+        digest = hashlib.sha256(check_id.encode("utf-8")).hexdigest()[:8]
+        safe = f"{safe}-{digest}"
+    return f"{safe}.log"
+
+
+def _checked_cwd(root: Path, check: CheckCommand) -> CheckCommand:
+    cwd = Path(check.cwd)
+    resolved_root = root.resolve()
+    resolved = (resolved_root / cwd).resolve()
+    if cwd.is_absolute() or not resolved.is_relative_to(resolved_root):
+        raise ValueError(f"Check {check.id!r} has a cwd outside the repo: {check.cwd}")
+    return check
+
+
+def _as_list(value: object) -> list[object]:
+    return list(value) if isinstance(value, list) else []
+
+
+def load_check_commands(root: Path, ids: list[str]) -> list[CheckCommand]:
+    """Commands from ``agents.entrypoints.json`` for the requested check ids.
+
+    With no ids, every default check the manifest defines is selected.
+    """
+    manifest: dict[str, object] | None = None
+    for name in _ENTRYPOINTS_FILENAMES:
+        path = root / name
+        if path.is_file():
+            try:
+                manifest = read_json(path)
+            except Exception as exc:
+                raise ValueError(f"Could not read {name}: {exc}") from exc
+            break
+    if manifest is None:
+        raise ValueError(
+            "agents.entrypoints.json not found; run `agentsgen pack` first."
+        )
+    rows = manifest.get("commands")
+    available: dict[str, CheckCommand] = {}
+    for row in rows if isinstance(rows, list) else []:
+        if not isinstance(row, dict):
+            continue
+        command_id = str(row.get("id", "")).strip()
+        command = str(row.get("command", "")).strip()
+        if command_id and command:
+            available[command_id] = CheckCommand(
+                id=command_id,
+                command=command,
+                cwd=str(row.get("cwd", "") or "."),
+            )
+    if not ids:
+        selected = [item for item in DEFAULT_CHECK_IDS if item in available]
+    else:
+        missing = [item for item in ids if item not in available]
+        if missing:
+            raise ValueError(
+                "No entrypoint command for check(s): " + ", ".join(sorted(missing))
+            )
+        selected = list(dict.fromkeys(ids))
+    return [_checked_cwd(root, available[item]) for item in selected]
+
+
+def _kill_tree(proc: subprocess.Popen[bytes]) -> None:
+    if hasattr(os, "killpg"):
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+            return
+        except OSError:
+            pass
+    proc.kill()
+
+
+def run_check(
+    root: Path, check: CheckCommand, *, timeout_seconds: float, log_path: Path
+) -> CheckRun:
+    """Run one shell command, capturing stdout and stderr into ``log_path``.
+
+    The command runs in its own process group so a timeout also stops the
+    tools it spawned, not just the shell.
+    """
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+    started = time.monotonic()
+    timed_out = False
+    exit_code: int | None
+    with log_path.open("wb") as log:
+        log.write(f"$ {check.command}\n".encode("utf-8"))
+        log.flush()
+        try:
+            proc = subprocess.Popen(
+                check.command,
+                shell=True,
+                cwd=root / check.cwd,
+                stdin=subprocess.DEVNULL,
+                stdout=log,
+                stderr=subprocess.STDOUT,
+                start_new_session=True,
+            )
+        except OSError as exc:
+            log.write(f"failed to start: {exc}\n".encode("utf-8"))
+            exit_code = None
+        else:
+            try:
+                exit_code = proc.wait(timeout=timeout_seconds)
+            except subprocess.TimeoutExpired:
+                _kill_tree(proc)
+                proc.wait()
+                timed_out = True
+                exit_code = None
+                log.write(f"\ntimed out after {timeout_seconds:g}s\n".encode("utf-8"))
+    duration_ms = int((time.monotonic() - started) * 1000)
+    return CheckRun(
+        check=check,
+        status="passed" if exit_code == 0 else "failed",
+        exit_code=exit_code,
+        duration_ms=duration_ms,
+        timed_out=timed_out,
+        log_path=log_path,
+    )
+
+
+def run_checks(
+    root: Path,
+    checks: list[CheckCommand],
+    *,
+    log_dir: Path,
+    jobs: int = 4,
+    timeout_seconds: float = DEFAULT_CHECK_TIMEOUT_SECONDS,
+) -> list[CheckRun]:
+    """Run checks concurrently (at most ``jobs`` at once), in input order."""
+    if not checks:
+        return []
+    with ThreadPoolExecutor(max_workers=max(1, min(jobs, len(checks)))) as pool:
+        return list(
+            pool.map(
+                lambda check: run_check(
+                    root,
+                    check,
+                    timeout_seconds=timeout_seconds,
+                    log_path=log_dir / check_log_name(check.id),
+                ),
+                checks,
+            )
+        )
+
+
+def apply_task_run_checks(
+    root: Path,
+    *,
+    task_id: str,
+    check_ids: list[str],
+    output_path: Path,
+    jobs: int = 4,
+    timeout_seconds: float = DEFAULT_CHECK_TIMEOUT_SECONDS,
+    dry_run: bool = False,
+) -> tuple[list[FileResult], dict[str, object], list[CheckRun]]:
+    """Run entrypoint checks and merge their outcomes into the task evidence.
+
+    Checks recorded earlier under other names, artifacts and notes are kept;
+    re-run checks replace their previous rows. A dry run writes nothing and
+    records the selected checks as pending.
+    """
+    normalized_task_id = normalize_task_id(task_id)
+    checks = load_check_commands(root, check_ids)
+    log_dir = task_dir(root, normalized_task_id) / "checks"
+    if dry_run:
+        runs: list[CheckRun] = []
+        rows: list[dict[str, object]] = [
+            {
+                "name": check.id,
+                "status": "pending",
+                "required": True,
+                "kind": "command",
+                "command": check.command,
+            }
+            for check in checks
+        ]
+    else:
+        runs = run_checks(
+            root, checks, log_dir=log_dir, jobs=jobs, timeout_seconds=timeout_seconds
+        )
+        rows = [run.evidence_row(root) for run in runs]
+
+    existing = _load_task_json(output_path) or {}
+    rerun = {check.id for check in checks}
+    kept_rows = [
+        row
+        for row in _as_list(existing.get("checks"))
+        if isinstance(row, dict) and row.get("name") not in rerun
+    ]
+    artifacts = [
+        str(item) for item in _as_list(existing.get("artifacts")) if str(item).strip()
+    ]
+    if not dry_run:
+        artifacts.extend(_relpath(run.log_path, root) for run in runs)
+    notes = [str(item) for item in _as_list(existing.get("notes")) if str(item)]
+    results, payload = apply_task_evidence(
+        root,
+        task_id=normalized_task_id,
+        checks=[],
+        artifacts=artifacts,
+        notes=notes,
+        output_path=output_path,
+        dry_run=dry_run,
+        check_rows=kept_rows + rows,
+    )
+    return results, payload, runs
@@ -0,0 +1,232 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .io_utils import write_json_atomic
+from .validators import validate_task_index_payload
+
+try:  # POSIX only; elsewhere concurrent writers fall back to last-one-wins.
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None  # type: ignore[assignment]
+
+TASK_INDEX_FILENAME = "index.json"
+TASK_STATUSES = ("open", "pass", "fail", "needs-review")
+_TITLE_RE = re.compile(r"^# Task Contract: (?P<title>.+)$", re.MULTILINE)
+
+
+def tasks_root(root: Path) -> Path:
+    return root / "docs" / "ai" / "tasks"
+
+
+def task_index_path(root: Path) -> Path:
+    return tasks_root(root) / TASK_INDEX_FILENAME
+
+
+def _empty_entry(task_id: str) -> dict[str, object]:
+    return {
+        "task_id": task_id,
+        "title": "",
+        "status": "open",
+        "decision": "",
+        "evidence_status": "unknown",
+        "check_summary": {},
+        "contract_at": "",
+        "evidence_at": "",
+        "verdict_at": "",
+        "updated_at": "",
+    }
+
+
+def _apply_event(
+    entry: dict[str, object], kind: str, payload: dict[str, object]
+) -> None:
+    at = str(payload.get("generated_at", "") or "")
+    if kind == "contract":
+        entry["title"] = str(payload.get("title", "") or entry["title"])
+    elif kind == "evidence":
+        entry["evidence_status"] = str(payload.get("evidence_status", "unknown"))
+        summary = payload.get("check_summary")
+        entry["check_summary"] = dict(summary) if isinstance(summary, dict) else {}
+    elif kind == "verdict":
+        entry["status"] = str(payload.get("status", "open") or "open")
+        entry["decision"] = str(payload.get("decision", "") or "")
+    else:
+        raise ValueError(f"Unknown task index event: {kind}")
+    entry[f"{kind}_at"] = at
+    entry["updated_at"] = max(str(entry["updated_at"]), at)
+
+
+def _build_index(entries: dict[str, dict[str, object]]) -> dict[str, object]:
+    payload = {
+        "version": 1,
+        "generated_by": "agentsgen",
+        "tasks": [entries[task_id] for task_id in sorted(entries)],
+    }
+    validate_task_index_payload(payload)
+    return payload
+
+
+def _read_index(path: Path) -> dict[str, dict[str, object]] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+        validate_task_index_payload(payload)
+    except (OSError, ValueError):
+        return None
+    return {str(row["task_id"]): dict(row) for row in payload["tasks"]}
+
+
+def _load_json(path: Path) -> dict[str, object] | None:
+    try:
+        payload = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None
+
+
+def _iso_mtime(path: Path) -> str:
+    stamp = datetime.fromtimestamp(path.stat().st_mtime, timezone.utc)
+    return stamp.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+
+
+def _scan_task(directory: Path) -> dict[str, object]:
+    entry = _empty_entry(directory.name)
+    contract = directory / "contract.md"
+    if contract.is_file():
+        match = _TITLE_RE.search(contract.read_text(encoding="utf-8"))
+        _apply_event(
+            entry,
+            "contract",
+            {
+                "title": match.group("title").strip() if match else "",
+                "generated_at": _iso_mtime(contract),
+            },
+        )
+    for kind in ("evidence", "verdict"):
+        payload = _load_json(directory / f"{kind}.json") or _load_json(
+            directory / f"{kind}.generated.json"
+        )
+        if payload is not None:
+            _apply_event(entry, kind, payload)
+    return entry
+
+
+def scan_task_entries(root: Path) -> dict[str, dict[str, object]]:
+    """Index entries rebuilt from every task directory (the slow path)."""
+    base = tasks_root(root)
+    if not base.is_dir():
+        return {}
+    return {
+        directory.name: _scan_task(directory)
+        for directory in sorted(base.iterdir())
+        if directory.is_dir()
+    }
+
+
+def task_index_lock_path(root: Path) -> Path:
+    """Where index writers take their lock: never inside the tracked tree.
+
+    Inside ``.git/`` for a plain checkout, else under the user cache dir
+    keyed by the repo path.
+    """
+    git_dir = root / ".git"
+    if git_dir.is_dir():
+        return git_dir / "agentsgen-task-index.lock"
+    cache_home = os.environ.get("XDG_CACHE_HOME") or str(Path.home() / ".cache")
+    digest = hashlib.sha256(str(root.resolve()).encode("utf-8")).hexdigest()[:16]
+    return Path(cache_home) / "agentsgen" / "locks" / f"tasks-{digest}.lock"
+
+
+@contextmanager
+def _locked(root: Path) -> Iterator[None]:
+    if fcntl is None:
+        yield
+        return
+    lock_path = task_index_lock_path(root)
+    try:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(str(lock_path), os.O_RDWR | os.O_CREAT)
+    except OSError:
+        # No writable lock location: same last-one-wins as without fcntl.
+        yield
+        return
+    try:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        yield
+    finally:
+        os.close(fd)
+
+
+def record_task_event(
+    root: Path, *, task_id: str, kind: str, payload: dict[str, object]
+) -> dict[str, object]:
+    """Fold one ``contract``/``evidence``/``verdict`` write into the index.
+
+    The read-modify-write runs under an exclusive lock and the index is
+    replaced atomically, so concurrent task commands never lose an update.
+    A missing or unreadable index is rebuilt from the task directories first.
+    """
+    path = task_index_path(root)
+    with _locked(root):
+        entries = _read_index(path)
+        if entries is None:
+            entries = scan_task_entries(root)
+        entry = entries.setdefault(task_id, _empty_entry(task_id))
+        _apply_event(entry, kind, payload)
+        index = _build_index(entries)
+        write_json_atomic(path, index)
+    return index
+
+
+def load_task_entries(root: Path, *, rebuild: bool = False) -> list[dict[str, object]]:
+    """Indexed tasks sorted by id.
+
+    A missing or unreadable index is answered from a scan without writing
+    anything; only ``rebuild`` stores the rescanned index.
+    """
+    path = task_index_path(root)
+    if rebuild:
+        with _locked(root):
+            entries = scan_task_entries(root)
+            if entries or path.exists():
+                write_json_atomic(path, _build_index(entries))
+    else:
+        entries = _read_index(path) or scan_task_entries(root)
+    return [entries[task_id] for task_id in sorted(entries)]
+
+
+def summarize_tasks(tasks: list[dict[str, object]]) -> dict[str, int]:
+    summary = {"total": len(tasks), **{status: 0 for status in TASK_STATUSES}}
+    for row in tasks:
+        status = str(row.get("status", "open"))
+        summary[status] = summary.get(status, 0) + 1
+    return summary
+
+
+def list_tasks(
+    root: Path, *, statuses: list[str] | None = None, rebuild: bool = False
+) -> dict[str, object]:
+    wanted = {item.strip().lower() for item in statuses or [] if item.strip()}
+    unknown = sorted(wanted - set(TASK_STATUSES))
+    if unknown:
+        raise ValueError(
+            "status must be one of: "
+            + ", ".join(TASK_STATUSES)
+            + f" (got {', '.join(unknown)})"
+        )
+    entries = load_task_entries(root, rebuild=rebuild)
+    return {
+        "tasks": [
+            row
+            for row in entries
+            if not wanted or str(row.get("status", "open")) in wanted
+        ],
+        "summary": summarize_tasks(entries),
+    }
@@ -9,6 +9,7 @@ from pathlib import Path
 from .generated_artifacts import handle_generated_json_artifact
 from .patch_engine import handle_file
 from .result_types import FileResult
+from .task_index import record_task_event
 from .validators import (
     validate_task_contract_payload,
     validate_task_evidence_payload,
@@ -140,6 +141,10 @@ def apply_task_init(
         dry_run=dry_run,
         print_diff=False,
     )
+    if not dry_run and result.action != "error":
+        record_task_event(
+            root, task_id=normalized_task_id, kind="contract", payload=payload
+        )
     return [result], payload
 
 
@@ -356,9 +361,15 @@ def apply_task_evidence(
     notes: list[str],
     output_path: Path,
     dry_run: bool = False,
+    check_rows: list[dict[str, object]] | None = None,
 ) -> tuple[list[FileResult], dict[str, object]]:
+    """Record task evidence.
+
+    ``checks`` are ``name=status`` strings; ``check_rows`` are ready-made rows
+    (for example from ``task run-checks``) appended after them.
+    """
     normalized_task_id = normalize_task_id(task_id)
-    check_rows = _parse_check_rows(checks)
+    check_rows = _parse_check_rows(checks) + list(check_rows or [])
     artifact_rows = sorted({item.strip() for item in artifacts if item.strip()})
     artifact_details = _artifact_details(root, artifact_rows)
     check_summary = _summarize_checks(check_rows)
@@ -394,6 +405,10 @@ def apply_task_evidence(
         dry_run=dry_run,
         print_diff=False,
     )
+    if not dry_run and result.action != "error":
+        record_task_event(
+            root, task_id=normalized_task_id, kind="evidence", payload=payload
+        )
     return [result], payload
 
 
@@ -484,4 +499,8 @@ def apply_task_verdict(
         dry_run=dry_run,
         print_diff=False,
     )
+    if not dry_run and result.action != "error":
+        record_task_event(
+            root, task_id=normalized_task_id, kind="verdict", payload=payload
+        )
     return [result], payload
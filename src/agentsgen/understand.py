@@ -5,8 +5,11 @@ from . import understand_context as _context
 
 RepoFileInfo = _ast.RepoFileInfo
 ImportEdge = _ast.ImportEdge
+ImportGraph = _ast.ImportGraph
+PathTable = _ast.PathTable
 RepoEntrypoint = _context.RepoEntrypoint
 RelevanceItem = _context.RelevanceItem
+RepoScan = _context.RepoScan
 
 _build_python_module_map = _ast.build_python_module_map
 _count_symbols = _ast.count_symbols
@@ -16,6 +19,7 @@ _rel = _ast.rel
 _repo_files = _ast.repo_files
 _resolve_js_import = _ast.resolve_js_import
 _resolve_python_import = _ast.resolve_python_import
+_scan_import_graph = _ast.scan_import_graph
 _scan_imports = _ast.scan_imports
 _should_skip = _ast.should_skip
 _source_roots = _ast.source_roots
@@ -47,5 +51,6 @@ _top_level_structure = _context.top_level_structure
 _utc_now_iso = _context.utc_now_iso
 _write_or_diff_raw = _context.write_or_diff_raw
 
+scan_repository = _context.scan_repository
 build_understanding_payload = _context.build_understanding_payload
 apply_understanding = _context.apply_understanding
@@ -2,9 +2,12 @@ from __future__ import annotations
 
 import ast
 import re
+from array import array
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
+from .cancellation import check_cancelled
 from .io_utils import read_text
 
 _EXCLUDED_DIRS = {
@@ -75,7 +78,12 @@ _JS_SYMBOL_RE = re.compile(
 )
 
 
-@dataclass(frozen=True)
+_LANGUAGES = tuple(sorted({*_LANGUAGE_BY_SUFFIX.values(), "unknown"}))
+_LANGUAGE_IDS = {name: index for index, name in enumerate(_LANGUAGES)}
+IMPORT_EDGE_KIND = "import"
+
+
+@dataclass(frozen=True, slots=True)
 class RepoFileInfo:
     path: str
     size: int
@@ -83,11 +91,108 @@ class RepoFileInfo:
     symbols_count: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ImportEdge:
     from_path: str
     to_path: str
-    kind: str = "import"
+    kind: str = IMPORT_EDGE_KIND
+
+
+class PathTable:
+    """Interned relative paths; each distinct path is stored once under an id."""
+
+    __slots__ = ("_ids", "paths")
+
+    def __init__(self, paths: Iterable[str] = ()):
+        self.paths: list[str] = []
+        self._ids: dict[str, int] = {}
+        for path in paths:
+            self.intern(path)
+
+    def intern(self, path: str) -> int:
+        path_id = self._ids.get(path)
+        if path_id is None:
+            path_id = len(self.paths)
+            self._ids[path] = path_id
+            self.paths.append(path)
+        return path_id
+
+    def id_of(self, path: str) -> int | None:
+        return self._ids.get(path)
+
+    def __getitem__(self, path_id: int) -> str:
+        return self.paths[path_id]
+
+    def __len__(self) -> int:
+        return len(self.paths)
+
+
+class ImportGraph:
+    """Columnar scan result: file rows and import edges over a ``PathTable``.
+
+    File ``i`` is path id ``i`` (files are interned first, in path order) and
+    its size, language and symbol count sit in parallel arrays. Edges are
+    parallel arrays of path ids, sorted by path and free of duplicates; JS
+    imports may point at ids past the file rows. ``RepoFileInfo`` and
+    ``ImportEdge`` records are only built when a caller asks for them.
+    """
+
+    __slots__ = (
+        "paths",
+        "file_count",
+        "sizes",
+        "languages",
+        "symbols",
+        "edge_from",
+        "edge_to",
+    )
+
+    def __init__(self, paths: PathTable, file_count: int):
+        self.paths = paths
+        self.file_count = file_count
+        self.sizes = array("q")
+        self.languages = array("B")
+        self.symbols = array("I")
+        self.edge_from = array("I")
+        self.edge_to = array("I")
+
+    def file_infos(self) -> list[RepoFileInfo]:
+        paths = self.paths.paths
+        return [
+            RepoFileInfo(
+                path=paths[index],
+                size=self.sizes[index],
+                language=_LANGUAGES[self.languages[index]],
+                symbols_count=self.symbols[index],
+            )
+            for index in range(self.file_count)
+        ]
+
+    def edges(self) -> list[ImportEdge]:
+        paths = self.paths.paths
+        return [
+            ImportEdge(paths[from_id], paths[to_id])
+            for from_id, to_id in zip(self.edge_from, self.edge_to)
+        ]
+
+    def knowledge_files(self) -> list[dict[str, object]]:
+        paths = self.paths.paths
+        return [
+            {
+                "path": paths[index],
+                "size": self.sizes[index],
+                "language": _LANGUAGES[self.languages[index]],
+                "symbols_count": self.symbols[index],
+            }
+            for index in range(self.file_count)
+        ]
+
+    def knowledge_edges(self) -> list[dict[str, object]]:
+        paths = self.paths.paths
+        return [
+            {"from": paths[from_id], "to": paths[to_id], "kind": IMPORT_EDGE_KIND}
+            for from_id, to_id in zip(self.edge_from, self.edge_to)
+        ]
 
 
 def rel(path: Path, root: Path) -> str:
@@ -175,13 +280,17 @@ def python_module_candidates(
 
 
 def build_python_module_map(
-    files: list[Path], root: Path, source_roots: list[Path]
+    files: list[Path],
+    root: Path,
+    source_roots: list[Path],
+    *,
+    rel_paths: list[str] | None = None,
 ) -> dict[str, str]:
     module_map: dict[str, str] = {}
-    for path in files:
+    for index, path in enumerate(files):
         if path.suffix != ".py":
             continue
-        file_path = rel(path, root)
+        file_path = rel_paths[index] if rel_paths is not None else rel(path, root)
         for candidate in python_module_candidates(path, root, source_roots):
             module_map[candidate] = file_path
     return module_map
@@ -194,8 +303,11 @@ def resolve_python_import(
     source_roots: list[Path],
     module: str | None,
     level: int,
+    *,
+    current_candidates: list[str] | None = None,
 ) -> str | None:
-    current_candidates = python_module_candidates(current_path, root, source_roots)
+    if current_candidates is None:
+        current_candidates = python_module_candidates(current_path, root, source_roots)
     current_module = current_candidates[0] if current_candidates else ""
     current_parts = current_module.split(".") if current_module else []
     package_parts = (
@@ -237,82 +349,114 @@ def resolve_js_import(current_path: Path, target_spec: str, root: Path) -> str |
     return None
 
 
-def scan_imports(
+def _python_import_targets(
+    path: Path,
+    text: str,
+    *,
+    module_map: dict[str, str],
+    root: Path,
+    source_roots: list[Path],
+) -> Iterable[str]:
+    try:
+        tree = ast.parse(text)
+    except SyntaxError:
+        return
+    current_candidates = python_module_candidates(path, root, source_roots)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            requests = [(alias.name, 0) for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            requests = [(node.module, node.level)]
+        else:
+            continue
+        for module, level in requests:
+            target_rel = resolve_python_import(
+                path,
+                module_map,
+                root,
+                source_roots,
+                module,
+                level,
+                current_candidates=current_candidates,
+            )
+            if target_rel:
+                yield target_rel
+
+
+def _js_import_targets(path: Path, text: str, *, root: Path) -> Iterable[str]:
+    for match in _JS_IMPORT_RE.finditer(text):
+        spec = next((value for value in match.groups() if value), "")
+        target_rel = resolve_js_import(path, spec, root)
+        if target_rel:
+            yield target_rel
+
+
+def scan_import_graph(
     files: list[Path],
     *,
     root: Path,
     source_roots: list[Path],
-) -> tuple[list[RepoFileInfo], list[ImportEdge]]:
-    file_infos: list[RepoFileInfo] = []
-    edges: list[ImportEdge] = []
-    python_module_map = build_python_module_map(files, root, source_roots)
+) -> ImportGraph:
+    """Scan files for size, language, symbols and resolved imports.
+
+    Each relative path is computed once and interned; rows and edges are
+    stored as integer arrays in an ``ImportGraph``.
+    """
+    rows = sorted((rel(path, root), path) for path in files)
+    paths = PathTable(rel_path for rel_path, _path in rows)
+    graph = ImportGraph(paths, len(rows))
+    ordered_files = [path for _rel_path, path in rows]
+    python_module_map = build_python_module_map(
+        ordered_files,
+        root,
+        source_roots,
+        rel_paths=paths.paths[: len(rows)],
+    )
+    del rows
 
-    for path in sorted(files, key=lambda item: rel(item, root)):
+    for file_id, path in enumerate(ordered_files):
+        check_cancelled()
         text = read_text(path)
-        rel_path = rel(path, root)
-        file_infos.append(
-            RepoFileInfo(
-                path=rel_path,
-                size=path.stat().st_size,
-                language=language_for_path(path),
-                symbols_count=count_symbols(path, text),
-            )
-        )
+        suffix = path.suffix.lower()
+        graph.sizes.append(path.stat().st_size)
+        graph.languages.append(_LANGUAGE_IDS[language_for_path(path)])
+        graph.symbols.append(count_symbols(path, text))
 
         if path.suffix == ".py":
-            try:
-                tree = ast.parse(text)
-            except SyntaxError:
-                continue
-            seen_targets: set[str] = set()
-            for node in ast.walk(tree):
-                target_rel: str | None = None
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        target_rel = resolve_python_import(
-                            path,
-                            python_module_map,
-                            root,
-                            source_roots,
-                            alias.name,
-                            0,
-                        )
-                        if target_rel and target_rel not in seen_targets:
-                            seen_targets.add(target_rel)
-                            edges.append(ImportEdge(rel_path, target_rel))
-                elif isinstance(node, ast.ImportFrom):
-                    target_rel = resolve_python_import(
-                        path,
-                        python_module_map,
-                        root,
-                        source_roots,
-                        node.module,
-                        node.level,
-                    )
-                    if target_rel and target_rel not in seen_targets:
-                        seen_targets.add(target_rel)
-                        edges.append(ImportEdge(rel_path, target_rel))
+            targets = _python_import_targets(
+                path,
+                text,
+                module_map=python_module_map,
+                root=root,
+                source_roots=source_roots,
+            )
+        elif suffix in {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}:
+            targets = _js_import_targets(path, text, root=root)
+        else:
             continue
+        # Files are visited in path order, so sorting each file's own targets
+        # by path yields edges sorted by (from, to) without a global pass.
+        target_ids = {paths.intern(target) for target in targets}
+        for to_id in sorted(target_ids, key=paths.__getitem__):
+            graph.edge_from.append(file_id)
+            graph.edge_to.append(to_id)
+    return graph
 
-        if path.suffix.lower() in {".js", ".jsx", ".ts", ".tsx", ".mjs", ".cjs"}:
-            seen_targets: set[str] = set()
-            for match in _JS_IMPORT_RE.finditer(text):
-                spec = next((value for value in match.groups() if value), "")
-                target_rel = resolve_js_import(path, spec, root)
-                if target_rel and target_rel not in seen_targets:
-                    seen_targets.add(target_rel)
-                    edges.append(ImportEdge(rel_path, target_rel))
-
-    deduped = sorted(
-        {(edge.from_path, edge.to_path, edge.kind) for edge in edges},
-        key=lambda item: (item[0], item[1], item[2]),
-    )
-    return file_infos, [ImportEdge(*edge) for edge in deduped]
+
+def scan_imports(
+    files: list[Path],
+    *,
+    root: Path,
+    source_roots: list[Path],
+) -> tuple[list[RepoFileInfo], list[ImportEdge]]:
+    graph = scan_import_graph(files, root=root, source_roots=source_roots)
+    return graph.file_infos(), graph.edges()
 
 
 def repo_files(root: Path, output_dir: Path) -> list[Path]:
     files: list[Path] = []
     for path in root.rglob("*"):
+        check_cancelled()
         if not path.is_file():
             continue
         if should_skip(path, root, output_dir):
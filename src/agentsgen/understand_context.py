@@ -8,20 +8,23 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 
-from .detect import detect_repo
+from .cancellation import check_cancelled
+from .detect import DetectResult, detect_repo
 from .io_utils import read_text, write_text_atomic
 from .markers import validate_markers
 from .normalize import normalize_markdown
 from .patch_engine import generated_sibling_path, handle_file, unified_diff
+from .repo_cache import cached_for_repo
 from .result_types import FileResult
 from .understand_ast import (
     ImportEdge,
+    ImportGraph,
     RepoFileInfo,
     _EXCLUDED_DIRS,
     _VISIBLE_HIDDEN_NAMES,
     rel,
     repo_files,
-    scan_imports,
+    scan_import_graph,
     source_roots,
 )
 from .validators import validate_knowledge_payload
@@ -44,6 +47,20 @@ class RepoEntrypoint:
     source: str
 
 
+@dataclass(frozen=True)
+class RepoScan:
+    stack: str
+    graph: ImportGraph
+
+    @property
+    def file_infos(self) -> list[RepoFileInfo]:
+        return self.graph.file_infos()
+
+    @property
+    def edges(self) -> list[ImportEdge]:
+        return self.graph.edges()
+
+
 @dataclass(frozen=True)
 class RelevanceItem:
     path: str
@@ -374,6 +391,7 @@ def focus_matches(
         return set()
     matches: set[str] = set()
     for item in file_infos:
+        check_cancelled()
         if needle in item.path.lower():
             matches.add(item.path)
             continue
@@ -763,22 +781,46 @@ def handle_knowledge_json_file(
     )
 
 
-def build_understanding_payload(
+def scan_repository(
     root: Path,
     *,
     output_dir: Path,
-    compact_budget_tokens: int = 4000,
-    focus: str | None = None,
-    changed_only: bool = False,
-) -> dict[str, object]:
-    det = detect_repo(root)
+    det: DetectResult | None = None,
+) -> RepoScan:
+    if det is None:
+        return cached_for_repo(
+            root,
+            f"scan:{output_dir.resolve()}",
+            lambda: _scan_repository(
+                root, output_dir=output_dir, det=detect_repo(root)
+            ),
+        )
+    return _scan_repository(root, output_dir=output_dir, det=det)
+
+
+def _scan_repository(root: Path, *, output_dir: Path, det: DetectResult) -> RepoScan:
     stack = (
         str(det.project.get("primary_stack", "") or "unknown").strip().lower()
         or "unknown"
     )
     files = repo_files(root, output_dir)
     roots = source_roots(root, det.paths)
-    file_infos, edges = scan_imports(files, root=root, source_roots=roots)
+    graph = scan_import_graph(files, root=root, source_roots=roots)
+    return RepoScan(stack=stack, graph=graph)
+
+
+def build_understanding_payload(
+    root: Path,
+    *,
+    output_dir: Path,
+    compact_budget_tokens: int = 4000,
+    focus: str | None = None,
+    changed_only: bool = False,
+    scan: RepoScan | None = None,
+) -> dict[str, object]:
+    scan = scan or scan_repository(root, output_dir=output_dir)
+    stack = scan.stack
+    file_infos, edges = scan.file_infos, scan.edges
     top_level = top_level_structure(root)
     entrypoints = detect_entrypoints(root)
     key_module_rows = key_modules(file_infos, edges)
@@ -821,19 +863,8 @@ def build_understanding_payload(
         "version": 1,
         "repo_path": ".",
         "generated_at": "",
-        "files": [
-            {
-                "path": item.path,
-                "size": item.size,
-                "language": item.language,
-                "symbols_count": item.symbols_count,
-            }
-            for item in file_infos
-        ],
-        "edges": [
-            {"from": edge.from_path, "to": edge.to_path, "kind": edge.kind}
-            for edge in edges
-        ],
+        "files": scan.graph.knowledge_files(),
+        "edges": scan.graph.knowledge_edges(),
         "entrypoints": [
             {"label": item.label, "command": item.command, "source": item.source}
             for item in entrypoints
@@ -68,6 +68,10 @@ def validate_fleet_scan_report_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("fleet_scan_report", payload)
 
 
+def validate_fleet_understand_report_payload(payload: dict[str, Any]) -> None:
+    validate_contract_payload("fleet_understand_report", payload)
+
+
 def validate_entrypoints_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("entrypoints", payload)
 
@@ -88,6 +92,10 @@ def validate_task_evidence_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("task_evidence", payload)
 
 
+def validate_task_index_payload(payload: dict[str, Any]) -> None:
+    validate_contract_payload("task_index", payload)
+
+
 def validate_task_verdict_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("task_verdict", payload)
 
@@ -120,6 +128,10 @@ def validate_cli_meta_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("cli_meta_response", payload)
 
 
+def validate_cli_batch_response_payload(payload: dict[str, Any]) -> None:
+    validate_contract_payload("cli_batch_response", payload)
+
+
 def validate_cli_task_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("cli_task_response", payload)
 
@@ -128,6 +140,10 @@ def validate_cli_pack_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("cli_pack_response", payload)
 
 
+def validate_cli_reflect_all_response_payload(payload: dict[str, Any]) -> None:
+    validate_contract_payload("cli_reflect_all_response", payload)
+
+
 def validate_cli_reflect_sessions_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("cli_reflect_sessions_response", payload)
 
@@ -168,6 +184,10 @@ def validate_mcp_understand_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("mcp_understand_response", payload)
 
 
+def validate_mcp_cache_stats_response_payload(payload: dict[str, Any]) -> None:
+    validate_contract_payload("mcp_cache_stats_response", payload)
+
+
 def validate_mcp_init_response_payload(payload: dict[str, Any]) -> None:
     validate_contract_payload("mcp_init_response", payload)
 
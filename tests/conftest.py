@@ -0,0 +1,11 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _isolated_user_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> None:
+    # Commands that keep indexes under the user cache dir must not touch $HOME.
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / ".user-cache"))
@@ -7,6 +7,7 @@ from typer.testing import CliRunner
 
 from agentsgen import analyze as analyze_module
 from agentsgen.cli import app
+from agentsgen.html_evidence import HtmlEvidence, extract_html_evidence
 
 
 runner = CliRunner()
@@ -101,3 +102,51 @@ def test_analyze_preserves_user_json_and_writes_generated_sibling(
     assert generated_path.is_file()
     generated = json.loads(generated_path.read_text(encoding="utf-8"))
     assert generated["generated_by"] == "agentsgen"
+
+
+def test_analyze_batch_streams_ndjson_in_input_order(
+    monkeypatch, tmp_path: Path
+) -> None:
+    monkeypatch.setattr(analyze_module, "_fetch_url", _mock_fetch)
+    monkeypatch.setattr(analyze_module, "_probe_url", lambda url, timeout=10.0: True)
+    urls = [f"https://example.com/page-{index}" for index in range(12)]
+
+    res = runner.invoke(
+        app,
+        ["analyze", "--batch", "-", "--jobs", "3"],
+        input="# landing pages\n" + "\n".join([*urls[:5], "", "ftp://bad", *urls[5:]]),
+    )
+    assert res.exit_code == 1
+    assert "ftp://bad" in res.stderr
+
+    lines = [json.loads(line) for line in res.stdout.splitlines()]
+    assert [line["url"] for line in lines] == urls
+    assert all(line["generated_by"] == "agentsgen" for line in lines)
+    assert not (tmp_path / "docs").exists()
+
+
+def test_analyze_requires_url_or_batch() -> None:
+    res = runner.invoke(app, ["analyze"])
+    assert res.exit_code == 2
+    assert "exactly one of URL or --batch" in res.stderr
+
+
+def test_html_evidence_matches_when_fed_in_chunks() -> None:
+    html = _mock_fetch("https://example.com").text.replace(
+        "<h1>", '<nav></nav><script>var h = "<h2>";</script><h1>'
+    )
+    whole = extract_html_evidence(html, text_chars=40)
+    chunked = HtmlEvidence(text_chars=40)
+    for start in range(0, len(html), 7):
+        chunked.feed(html[start : start + 7])
+    chunked.close()
+
+    for page in (whole, chunked):
+        assert page.title == "Example site"
+        assert page.meta_description == "AI-friendly site."
+        assert page.json_ld_present is True
+        assert page.headings_count == 3
+        assert page.semantic_tags_count == 4
+        assert page.word_count == 325
+        assert page.text_sample.startswith("Example site Example Docs Guide word")
+        assert len(page.text_sample) <= 40
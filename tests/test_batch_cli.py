@@ -0,0 +1,119 @@
+from __future__ import annotations
+
+import json
+import shutil
+from pathlib import Path
+
+import pytest
+from rich.console import Console
+from typer.testing import CliRunner
+
+from agentsgen import cli_support
+from agentsgen.batch import run_batch
+from agentsgen.cli import app
+from agentsgen.repo_cache import RepoCache
+from agentsgen.validators import validate_cli_batch_response_payload
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+runner = CliRunner()
+
+
+def test_batch_streams_one_response_per_command(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    requests = [
+        {
+            "id": "detect",
+            "command": "detect",
+            "args": [str(target), "--format", "json"],
+        },
+        {"command": "status", "args": [str(target), "--format", "json"]},
+        "",
+        "not json",
+        {"command": "init", "args": [str(target)]},
+        {"command": "task list", "args": [str(target), "--format", "json"]},
+    ]
+    stdin = "\n".join(
+        item if isinstance(item, str) else json.dumps(item) for item in requests
+    )
+
+    res = runner.invoke(app, ["batch"], input=stdin + "\n")
+    assert res.exit_code == 1
+    responses = [json.loads(line) for line in res.stdout.splitlines()]
+    for response in responses:
+        validate_cli_batch_response_payload(response)
+    assert [row["index"] for row in responses] == [0, 1, 2, 3, 4]
+
+    detect, status, malformed, refused, task_list = responses
+    assert detect["id"] == "detect"
+    assert detect["exit_code"] == 0
+    assert detect["output"]["project"]["primary_stack"] == "python"
+    assert detect["stdout"] == ""
+    in_process = runner.invoke(app, ["detect", str(target), "--format", "json"])
+    assert detect["output"] == json.loads(in_process.stdout)
+
+    assert status["command"] == "status"
+    assert status["exit_code"] == 1
+    assert status["output"]["status"] == "drift"
+
+    assert malformed["exit_code"] == 2
+    assert malformed["error"]
+    assert refused["exit_code"] == 2
+    assert "not allowed" in refused["error"]
+
+    assert task_list["command"] == "task list"
+    assert task_list["exit_code"] == 0
+    assert task_list["output"]["command"] == "task list"
+
+
+def test_batch_reads_file_and_fails_fast(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    batch_file = tmp_path / "commands.jsonl"
+    batch_file.write_text(
+        "\n".join(
+            json.dumps(row)
+            for row in [
+                {"command": "status", "args": [str(target)]},
+                {"command": "detect", "args": [str(target)]},
+            ]
+        )
+        + "\n",
+        encoding="utf-8",
+    )
+
+    res = runner.invoke(app, ["batch", str(batch_file), "--fail-fast"])
+    assert res.exit_code == 1
+    responses = [json.loads(line) for line in res.stdout.splitlines()]
+    assert len(responses) == 1
+    assert responses[0]["output"] is None
+    assert "Summary: DRIFT" in responses[0]["stdout"]
+
+    missing = runner.invoke(app, ["batch", str(tmp_path / "missing.jsonl")])
+    assert missing.exit_code == 1
+
+
+def test_batch_reuses_repo_cache_and_renders_plain_text(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    # As if `agentsgen batch` itself were started from a colour terminal.
+    monkeypatch.setattr(cli_support.console, "_default", Console(force_terminal=True))
+    lines = [
+        json.dumps({"command": "detect", "args": [str(target), "--format", "json"]}),
+        json.dumps({"command": "status", "args": [str(target)]}),
+        json.dumps({"command": "detect", "args": [str(target), "--format", "json"]}),
+    ]
+    cache = RepoCache()
+
+    detect, status, again = run_batch(lines, cache=cache)
+    assert detect["output"] == again["output"]
+    assert "Summary: DRIFT" in str(status["stdout"])
+    assert "\x1b[" not in str(status["stdout"])
+    # The repo is detected once; the second `detect` is served from cache.
+    stats = cache.stats()
+    assert stats["misses"] == 1
+    assert stats["hits"] >= 1
+    assert stats["invalidations"] == 0
@@ -740,9 +740,11 @@ def test_schema_snapshots_catalog_contains_target_contracts() -> None:
         "aggregated_check",
         "analysis_payload",
         "cli_analyze_response",
+        "cli_batch_response",
         "cli_meta_response",
         "cli_pack_plan_response",
         "cli_pack_response",
+        "cli_reflect_all_response",
         "cli_reflect_sessions_response",
         "cli_reflect_skills_response",
         "cli_task_response",
@@ -751,10 +753,12 @@ def test_schema_snapshots_catalog_contains_target_contracts() -> None:
         "entrypoints",
         "file_result",
         "fleet_scan_report",
+        "fleet_understand_report",
         "id_context",
         "knowledge",
         "llm_enhancement_result",
         "llm_options",
+        "mcp_cache_stats_response",
         "mcp_check_response",
         "mcp_detect_response",
         "mcp_init_response",
@@ -769,6 +773,7 @@ def test_schema_snapshots_catalog_contains_target_contracts() -> None:
         "repo_status",
         "task_contract",
         "task_evidence",
+        "task_index",
         "task_verdict",
         "understand_payload",
         "write_policy",
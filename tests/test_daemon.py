@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import shutil
+import socket
+import sys
+import threading
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from typer.testing import CliRunner
+
+from agentsgen import cli as cli_module
+from agentsgen import daemon as daemon_module
+from agentsgen.cli import app
+from agentsgen.daemon import (
+    AgentsgenDaemon,
+    daemon_request,
+    forward_command,
+    is_forwarded,
+)
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+runner = CliRunner()
+
+
+def _start(
+    socket_path: Path, idle_timeout: float = 30
+) -> tuple[AgentsgenDaemon, threading.Thread]:
+    daemon = AgentsgenDaemon(socket_path, idle_timeout_seconds=idle_timeout)
+    thread = threading.Thread(target=daemon.serve_forever, daemon=True)
+    thread.start()
+    for _ in range(200):
+        if daemon_request({"op": "ping"}, socket_path=socket_path):
+            break
+        thread.join(0.01)
+    return daemon, thread
+
+
+def test_daemon_serves_forwarded_commands_with_warm_cache(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    socket_path = tmp_path / "d.sock"
+    daemon, thread = _start(socket_path)
+    try:
+        argv = ["detect", str(target), "--format", "json"]
+        assert forward_command(argv, socket_path=socket_path) == 0
+        forwarded = json.loads(capsys.readouterr().out)
+
+        in_process = runner.invoke(app, argv)
+        assert in_process.exit_code == 0
+        assert forwarded == json.loads(in_process.stdout)
+
+        assert forward_command(argv, socket_path=socket_path) == 0
+        capsys.readouterr()
+        stats = daemon_request({"op": "ping"}, socket_path=socket_path)
+        assert stats is not None
+        assert stats["requests"] == 2
+        assert stats["cache"]["hits"] >= 1
+
+        (target / "pyproject.toml").write_text(
+            (target / "pyproject.toml").read_text(encoding="utf-8") + "\n",
+            encoding="utf-8",
+        )
+        assert forward_command(argv, socket_path=socket_path) == 0
+        capsys.readouterr()
+        stats = daemon_request({"op": "ping"}, socket_path=socket_path)
+        assert stats is not None
+        assert stats["cache"]["invalidations"] == 1
+
+        # Interactive, networked or long-running commands always run
+        # in-process.
+        assert forward_command(["init", str(target)], socket_path=socket_path) is None
+        assert (
+            forward_command(
+                ["task", "run-checks", str(target)], socket_path=socket_path
+            )
+            is None
+        )
+        assert is_forwarded(["task", "list", str(target)])
+    finally:
+        daemon_request({"op": "shutdown"}, socket_path=socket_path)
+        thread.join(5)
+    assert not thread.is_alive()
+    assert not socket_path.exists()
+
+
+def test_forward_falls_back_without_daemon(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    socket_path = tmp_path / "missing.sock"
+    assert forward_command(["status", "."], socket_path=socket_path) is None
+
+    daemon, thread = _start(socket_path)
+    try:
+        monkeypatch.setenv("AGENTSGEN_NO_DAEMON", "1")
+        assert forward_command(["status", "."], socket_path=socket_path) is None
+        rejected = daemon_request(
+            {"op": "ping", "agentsgen_version": "0.0.0"}, socket_path=socket_path
+        )
+        assert rejected == {"status": "rejected", "reason": "version mismatch"}
+    finally:
+        daemon_request({"op": "shutdown"}, socket_path=socket_path)
+        thread.join(5)
+
+
+def test_daemon_exits_after_idle_timeout(tmp_path: Path) -> None:
+    socket_path = tmp_path / "idle.sock"
+    daemon = AgentsgenDaemon(socket_path, idle_timeout_seconds=0.2)
+    daemon.serve_forever()
+    assert daemon.requests == 0
+    assert not socket_path.exists()
+
+
+def _run_frames(
+    socket_path: Path, argv: list[str], env: dict[str, str], terminal: dict[str, object]
+) -> tuple[dict[str, object] | None, list[tuple[str, str]]]:
+    frames: list[tuple[str, str]] = []
+
+    def collect(stream: str, text: str) -> None:
+        if frames and frames[-1][0] == stream:
+            frames[-1] = (stream, frames[-1][1] + text)
+        else:
+            frames.append((stream, text))
+
+    response = daemon_request(
+        {
+            "op": "run",
+            "argv": argv,
+            "cwd": os.getcwd(),
+            "env": env,
+            "terminal": terminal,
+        },
+        socket_path=socket_path,
+        on_output=collect,
+    )
+    return response, frames
+
+
+def test_daemon_renders_output_for_the_client_terminal(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    socket_path = tmp_path / "tty.sock"
+    env = {key: value for key, value in os.environ.items() if key not in {"NO_COLOR"}}
+    env["TERM"] = "xterm-256color"
+    argv = ["status", str(target)]
+    daemon, thread = _start(socket_path)
+    try:
+        tty = {"stdout": True, "stderr": True, "columns": 50}
+        response, frames = _run_frames(socket_path, argv, env, tty)
+        assert response == {"status": "ok", "exit_code": 1}
+        [(stream, text)] = frames
+        assert stream == "stdout"
+        assert "\x1b[35m" in text
+        assert "sections: \x1b[1;36m0\x1b[0m, \ngenerated sibling" in text
+
+        _response, frames = _run_frames(
+            socket_path, argv, {**env, "NO_COLOR": "1"}, tty
+        )
+        assert "\x1b[35m" not in frames[0][1]
+
+        piped = {"stdout": False, "stderr": False, "columns": None}
+        _response, frames = _run_frames(socket_path, argv, env, piped)
+        assert "\x1b[" not in frames[0][1]
+        assert "Summary: DRIFT" in frames[0][1]
+
+        def interleaved(args: list[str], prog_name: str) -> None:
+            print("one")
+            print("two", file=sys.stderr)
+            print("three")
+            raise SystemExit(3)
+
+        monkeypatch.setattr(cli_module, "app", interleaved)
+        response, frames = _run_frames(socket_path, ["detect"], env, piped)
+        assert response == {"status": "ok", "exit_code": 3}
+        assert frames == [
+            ("stdout", "one\n"),
+            ("stderr", "two\n"),
+            ("stdout", "three\n"),
+        ]
+    finally:
+        daemon_request({"op": "shutdown"}, socket_path=socket_path)
+        thread.join(5)
+
+
+def test_busy_daemon_falls_back_to_in_process(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    socket_path = tmp_path / "busy.sock"
+    monkeypatch.setattr(daemon_module, "_READY_TIMEOUT_SECONDS", 0.2)
+    argv = ["detect", str(target), "--format", "json"]
+    daemon, thread = _start(socket_path)
+    try:
+        # Another client holds the daemon without finishing its request.
+        holder = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        holder.connect(str(socket_path))
+        assert holder.makefile("rb").readline() == b'{"status": "ready"}\n'
+        assert forward_command(argv, socket_path=socket_path) is None
+        holder.close()
+
+        assert forward_command(argv, socket_path=socket_path) == 0
+        assert json.loads(capsys.readouterr().out)["project"]
+        # The abandoned request was never run by the daemon.
+        assert daemon.requests == 1
+    finally:
+        daemon_request({"op": "shutdown"}, socket_path=socket_path)
+        thread.join(5)
+
+
+def test_daemon_opens_a_render_memo_per_run(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    capsys: pytest.CaptureFixture[str],
+) -> None:
+    from agentsgen import render_memo as render_memo_module
+
+    target = tmp_path / "repo"
+    shutil.copytree(FIXTURES / "python_uv", target)
+    memos: list[render_memo_module.RenderMemo] = []
+    original = render_memo_module.render_memo
+
+    @contextlib.contextmanager
+    def tracking() -> Iterator[render_memo_module.RenderMemo]:
+        with original() as memo:
+            memos.append(memo)
+            yield memo
+
+    monkeypatch.setattr(render_memo_module, "render_memo", tracking)
+    socket_path = tmp_path / "memo.sock"
+    daemon, thread = _start(socket_path)
+    try:
+        argv = ["pack", str(target), "--check", "--format", "json"]
+        forward_command(argv, socket_path=socket_path)
+        forward_command(argv, socket_path=socket_path)
+        capsys.readouterr()
+    finally:
+        daemon_request({"op": "shutdown"}, socket_path=socket_path)
+        thread.join(5)
+    assert len(memos) == 2
+    assert memos[0] is not memos[1]
+    assert render_memo_module.active_render_memo() is None
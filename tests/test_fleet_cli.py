@@ -7,7 +7,10 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from agentsgen.cli import app
-from agentsgen.validators import validate_fleet_scan_report_payload
+from agentsgen.validators import (
+    validate_fleet_scan_report_payload,
+    validate_fleet_understand_report_payload,
+)
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -91,3 +94,61 @@ def test_fleet_scan_writes_markdown_and_json_outputs(tmp_path: Path) -> None:
     validate_fleet_scan_report_payload(payload)
     assert str(md_out) in res.stdout
     assert str(json_out) in res.stdout
+
+
+def test_fleet_understand_writes_per_repo_artifacts_in_pool(tmp_path: Path) -> None:
+    root = tmp_path / "fleet"
+    first = root / "first"
+    second = root / "second"
+    _copy_fixture(FIXTURES / "python_uv", first)
+    _copy_fixture(FIXTURES / "node_pnpm", second)
+    _make_git_repo(first)
+    _make_git_repo(second)
+    json_out = tmp_path / "understand.json"
+
+    res = runner.invoke(
+        app,
+        [
+            "fleet",
+            "understand",
+            str(root),
+            "--jobs",
+            "2",
+            "--format",
+            "json",
+            "--json-out",
+            str(json_out),
+        ],
+    )
+
+    assert res.exit_code == 0, res.stdout
+    payload = json.loads(res.stdout)
+    validate_fleet_understand_report_payload(payload)
+    assert payload["command"] == "fleet understand"
+    assert payload["meta"]["jobs"] == 2
+    assert payload["summary"]["repos_count"] == 2
+    assert payload["summary"]["failed_count"] == 0
+    repos = {Path(row["repo"]).name: row for row in payload["repos"]}
+    assert repos["first"]["stack"] == "python"
+    assert repos["first"]["files_count"] > 0
+    assert repos["first"]["top_modules"]
+    for repo in (first, second):
+        assert (repo / "agents.knowledge.json").is_file()
+        assert (repo / "docs" / "ai" / "repomap.md").is_file()
+    assert json.loads(json_out.read_text(encoding="utf-8")) == payload
+
+
+def test_fleet_understand_dry_run_does_not_write(tmp_path: Path) -> None:
+    root = tmp_path / "fleet"
+    repo = root / "repo"
+    _copy_fixture(FIXTURES / "python_uv", repo)
+    _make_git_repo(repo)
+
+    res = runner.invoke(
+        app, ["fleet", "understand", str(root), "--jobs", "1", "--dry-run"]
+    )
+
+    assert res.exit_code == 0, res.stdout
+    assert "agentsgen fleet understand" in res.stdout
+    assert not (repo / "agents.knowledge.json").exists()
+    assert not (repo / "docs" / "ai" / "repomap.md").exists()
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from pathlib import Path
 
 from typer.testing import CliRunner
@@ -13,6 +15,7 @@ from agentsgen.llm import (
     LLMEnhancer,
     enhance_sections,
 )
+from agentsgen.llm_cache import LLMResponseCache, cache_key
 
 
 runner = CliRunner()
@@ -193,3 +196,145 @@ def test_update_with_llm_timeout_keeps_local_generation(
     assert update_result.exit_code == 0
     agents = (tmp_path / "AGENTS.md").read_text(encoding="utf-8")
     assert "Injected LLM repo context" not in agents
+
+
+def test_update_with_unchanged_repo_reuses_cached_enhancement(
+    monkeypatch, tmp_path: Path
+) -> None:
+    from agentsgen.providers.stub import StubEnhancer
+
+    calls: list[LLMEnhancementRequest] = []
+    enhance = StubEnhancer.enhance
+
+    def spy(self: StubEnhancer, request: LLMEnhancementRequest) -> LLMEnhancementResult:
+        calls.append(request)
+        return enhance(self, request)
+
+    monkeypatch.setattr(StubEnhancer, "enhance", spy)
+    args = ["--llm-enhance", "--llm-provider", "stub"]
+    init_result = runner.invoke(
+        app,
+        ["init", str(tmp_path), "--defaults", "--stack", "static", "--name", "demo"],
+    )
+    assert init_result.exit_code == 0
+    assert runner.invoke(app, ["update", str(tmp_path), *args]).exit_code == 0
+    agents = (tmp_path / "AGENTS.md").read_text(encoding="utf-8")
+    assert "Stub repo context" in agents
+
+    assert calls
+    calls_before = len(calls)
+    assert runner.invoke(app, ["update", str(tmp_path), *args]).exit_code == 0
+    assert len(calls) == calls_before
+    assert (tmp_path / "AGENTS.md").read_text(encoding="utf-8") == agents
+
+    monkeypatch.setenv("AGENTSGEN_NO_LLM_CACHE", "1")
+    assert runner.invoke(app, ["update", str(tmp_path), *args]).exit_code == 0
+    assert len(calls) > calls_before
+
+
+def test_llm_response_cache_expires_and_evicts_least_recent(tmp_path: Path) -> None:
+    now = [1000.0]
+    cache = LLMResponseCache(
+        tmp_path / "llm", ttl_seconds=60, max_bytes=400, clock=lambda: now[0]
+    )
+    keys = [
+        cache_key(provider="stub", model="", template_version=1, context=index)
+        for index in range(3)
+    ]
+    cache.put(keys[0], {"content": "a" * 40})
+    now[0] += 1
+    cache.put(keys[1], {"content": "b" * 40})
+    now[0] += 1
+    assert cache.get(keys[0]) == {"content": "a" * 40}
+    now[0] += 1
+    cache.put(keys[2], {"content": "c" * 40})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) is not None
+    now[0] += 120
+    assert cache.get(keys[2]) is None
+
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+    unwritable = LLMResponseCache(blocker / "llm")
+    unwritable.put(keys[0], {"content": "paid for"})
+    assert unwritable.get(keys[0]) is None
+
+
+def test_repo_context_reuses_fresh_knowledge_and_rescans_when_stale(
+    monkeypatch, tmp_path: Path
+) -> None:
+    import agentsgen.llm_context as context_module
+
+    (tmp_path / "app.py").write_text("import os\n", encoding="utf-8")
+    assert runner.invoke(app, ["understand", str(tmp_path)]).exit_code == 0
+    (tmp_path / "AGENTS.md").write_text("# rewritten by enhancement\n", "utf-8")
+
+    scans = {"count": 0}
+    full_scan = context_module.build_understanding_payload
+
+    def _counting_scan(*args, **kwargs):
+        scans["count"] += 1
+        return full_scan(*args, **kwargs)
+
+    monkeypatch.setattr(context_module, "build_understanding_payload", _counting_scan)
+
+    assert llm_module.build_repo_context(tmp_path, "detect")["tier"] == "detect"
+    reused = llm_module.build_repo_context(tmp_path, "knowledge")
+    assert reused["tier"] == "knowledge"
+    assert reused["summary"]["files_count"] >= 1
+    assert scans["count"] == 0
+
+    (tmp_path / "app.py").write_text("import os\nimport sys\n", encoding="utf-8")
+    assert llm_module.build_repo_context(tmp_path, "knowledge")["tier"] == "understand"
+    assert scans["count"] == 1
+
+
+class _SlowSectionEnhancer(LLMEnhancer):
+    context_tier = "detect"
+
+    def __init__(self, release: threading.Event):
+        self._release = release
+
+    def enhance(self, request: LLMEnhancementRequest) -> LLMEnhancementResult:
+        (section,) = request.narrative_sections
+        if section == "slow":
+            self._release.wait(10)
+        return LLMEnhancementResult(
+            provider="stub",
+            applied=True,
+            sections={section: f"{section} narrative"},
+            message="ok",
+        )
+
+
+def test_sections_run_concurrently_and_late_ones_fall_back(
+    monkeypatch, tmp_path: Path
+) -> None:
+    release = threading.Event()
+    monkeypatch.setitem(
+        llm_module.PROVIDER_FACTORIES, "stub", lambda: _SlowSectionEnhancer(release)
+    )
+    started = time.monotonic()
+    try:
+        result = enhance_sections(
+            LLMEnhancementRequest(
+                target=tmp_path,
+                provider="stub",
+                timeout_seconds=1,
+                narrative_sections=("repo_context", "slow", "workflow"),
+                use_cache=False,
+            )
+        )
+    finally:
+        release.set()
+
+    assert time.monotonic() - started < 5
+    assert result.applied is True
+    assert result.sections == {
+        "repo_context": "repo_context narrative",
+        "workflow": "workflow narrative",
+    }
+    assert set(result.section_latency_ms) == {"repo_context", "workflow"}
+    assert "local text kept for: slow" in result.message
+    assert result.to_json()["section_latency_ms"] == result.section_latency_ms
@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import asyncio
+import threading
 import shutil
 import sys
 import types
 from pathlib import Path
 
+import pytest
+
 import agentsgen.llm as llm_module
 from agentsgen.llm import LLMEnhancementResult, LLMEnhancer, LLMEnhancementRequest
 from agentsgen.mcp_server import (
+    build_mcp_cache_stats_response,
     build_mcp_check_response,
     build_mcp_detect_response,
     build_mcp_init_response,
@@ -16,7 +21,11 @@ from agentsgen.mcp_server import (
     build_mcp_understand_response,
     build_mcp_update_response,
 )
+from agentsgen.cancellation import OperationCancelled, check_cancelled
+from agentsgen.mcp_runner import ToolRunner
+from agentsgen.repo_cache import RepoCache
 from agentsgen.validators import (
+    validate_mcp_cache_stats_response_payload,
     validate_mcp_check_response_payload,
     validate_mcp_detect_response_payload,
     validate_mcp_init_response_payload,
@@ -181,12 +190,196 @@ def test_mcp_serve_stdio_registers_protocol_tools(monkeypatch, tmp_path: Path) -
         "init",
         "update",
         "pack",
+        "cache_stats",
     }
 
-    status_payload = server.tools["status"](path=str(target))
+    status_payload = asyncio.run(server.tools["status"](path=str(target)))
     validate_mcp_status_response_payload(status_payload)
     assert status_payload["tool"] == "status"
 
-    pack_payload = server.tools["pack"](path=str(target), check=True)
+    pack_payload = asyncio.run(server.tools["pack"](path=str(target), check=True))
     validate_mcp_pack_response_payload(pack_payload)
     assert pack_payload["write_policy"]["mode"] == "check"
+
+
+def test_mcp_cache_reuses_repo_state_until_inputs_change(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    _copy_fixture(FIXTURES / "python_uv", target)
+    cache = RepoCache()
+
+    first = build_mcp_understand_response(str(target), cache=cache)
+    detect_payload = build_mcp_detect_response(str(target), cache=cache)
+    again = build_mcp_understand_response(str(target), cache=cache)
+    assert again == first
+    assert detect_payload == build_mcp_detect_response(str(target))
+
+    stats = build_mcp_cache_stats_response(cache)
+    validate_mcp_cache_stats_response_payload(stats)
+    assert stats["tool"] == "cache_stats"
+    assert stats["result"]["repos_count"] == 1
+    assert stats["result"]["hits"] >= 2
+    assert stats["result"]["invalidations"] == 0
+    keys = stats["result"]["repos"][0]["keys"]
+    assert "detect" in keys
+    assert any(key.startswith("scan:") for key in keys)
+
+    (target / "src" / "app" / "extra.py").write_text(
+        "def extra():\n    return 1\n", encoding="utf-8"
+    )
+    changed = build_mcp_understand_response(str(target), cache=cache)
+    assert (
+        changed["result"]["summary"]["files_count"]
+        == first["result"]["summary"]["files_count"] + 1
+    )
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_mcp_understand_pages_files_and_selects_fields(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    _copy_fixture(FIXTURES / "python_uv", target)
+    for index in range(5):
+        (target / "src" / "app" / f"mod_{index}.py").write_text(
+            "from . import helper\n", encoding="utf-8"
+        )
+    (target / "src" / "app" / "helper.py").write_text("X = 1\n", encoding="utf-8")
+    full = build_mcp_understand_response(str(target))
+    all_files = [row["path"] for row in full["result"]["knowledge"]["files"]]
+
+    seen: list[str] = []
+    cursor = ""
+    while True:
+        page = build_mcp_understand_response(
+            str(target),
+            fields=["compact_repomap", "files"],
+            cursor=cursor,
+            page_size=3,
+        )
+        validate_mcp_understand_response_payload(page)
+        assert "repomap" not in page["result"]
+        assert "graph" not in page["result"]
+        assert page["result"]["compact_repomap"]
+        assert page["result"]["knowledge"]["edges"] == []
+        assert page["page"]["files_total"] == len(all_files)
+        assert page["page"]["edges_total"] == len(full["result"]["knowledge"]["edges"])
+        assert page["page"]["edges_total"] > 0
+        assert len(page["result"]["knowledge"]["files"]) <= 3
+        seen.extend(row["path"] for row in page["result"]["knowledge"]["files"])
+        cursor = page["page"]["next_cursor"]
+        if cursor is None:
+            break
+    assert seen == all_files
+
+    focused = build_mcp_understand_response(
+        str(target), focus="helper", fields=["compact_repomap"]
+    )
+    assert focused["result"]["summary"]["focus"] == "helper"
+    assert focused["result"]["knowledge"]["files"] == []
+
+    with pytest.raises(ValueError, match="bogus"):
+        build_mcp_understand_response(str(target), fields=["bogus"])
+
+
+def test_tool_runner_request_key_resolves_path_and_ignores_cache(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    relative = ToolRunner.request_key("detect", path=".", cache=RepoCache())
+    absolute = ToolRunner.request_key("detect", path=str(tmp_path), cache=RepoCache())
+    assert relative == absolute
+    assert "cache" not in relative
+    assert relative != ToolRunner.request_key("status", path=".")
+
+
+def test_tool_runner_coalesces_identical_reads_and_cancels_scans() -> None:
+    calls: list[str] = []
+    release = threading.Event()
+    cancelled = threading.Event()
+
+    def slow_scan(path: str) -> dict[str, object]:
+        calls.append(path)
+        try:
+            while not release.wait(0.01):
+                check_cancelled()
+        except OperationCancelled:
+            cancelled.set()
+            raise
+        return {"path": path}
+
+    async def scenario() -> None:
+        runner = ToolRunner(max_workers=2)
+        try:
+            first = asyncio.create_task(runner.run_read("scan", slow_scan, path="a"))
+            second = asyncio.create_task(runner.run_read("scan", slow_scan, path="a"))
+            await asyncio.sleep(0.05)
+            release.set()
+            assert await first == await second == {"path": "a"}
+            assert calls == ["a"]
+
+            release.clear()
+            orphan = asyncio.create_task(runner.run_read("scan", slow_scan, path="b"))
+            await asyncio.sleep(0.05)
+            orphan.cancel()
+            try:
+                await orphan
+            except asyncio.CancelledError:
+                pass
+            assert await asyncio.to_thread(cancelled.wait, 2)
+        finally:
+            runner.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_tool_runner_orders_writes_and_reads_per_path() -> None:
+    events: list[str] = []
+    release = threading.Event()
+
+    def slow_write(path: str, name: str) -> str:
+        events.append(f"{name}:start")
+        release.wait(2)
+        events.append(f"{name}:end")
+        return name
+
+    def quick_write(path: str, name: str) -> str:
+        events.append(f"{name}:start")
+        return name
+
+    def slow_read(path: str) -> int:
+        calls = sum(1 for event in events if event == "read")
+        events.append("read")
+        release.wait(2)
+        return calls
+
+    async def scenario() -> None:
+        runner = ToolRunner(max_workers=3)
+        try:
+            # A cancelled write keeps its repo locked until it really ends.
+            first = asyncio.create_task(
+                runner.run_write("update", slow_write, path="a", name="first")
+            )
+            await asyncio.sleep(0.05)
+            first.cancel()
+            second = asyncio.create_task(
+                runner.run_write("update", quick_write, path="a", name="second")
+            )
+            await asyncio.sleep(0.05)
+            assert events == ["first:start"]
+            release.set()
+            assert await second == "second"
+            assert events == ["first:start", "first:end", "second:start"]
+
+            # A read sent after a write finished never joins an older read.
+            release.clear()
+            events.clear()
+            stale = asyncio.create_task(runner.run_read("status", slow_read, path="b"))
+            await asyncio.sleep(0.05)
+            await runner.run_write("update", quick_write, path="b", name="write")
+            fresh = asyncio.create_task(runner.run_read("status", slow_read, path="b"))
+            await asyncio.sleep(0.05)
+            release.set()
+            assert (await stale, await fresh) == (0, 1)
+            assert events == ["read", "write:start", "read"]
+        finally:
+            runner.shutdown()
+
+    asyncio.run(scenario())
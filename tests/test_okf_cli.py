@@ -1,11 +1,16 @@
 from __future__ import annotations
 
 import json
+import os
 import shutil
+import tarfile
+import zipfile
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
+from agentsgen import okf_export
 from agentsgen.cli import app
 
 
@@ -92,3 +97,103 @@ def test_okf_export_dry_run_does_not_write_files(tmp_path: Path) -> None:
     assert payload["dry_run"] is True
     assert payload["status"] == "ok"
     assert not (target / "docs" / "ai" / "okf").exists()
+
+
+def test_okf_export_archive_is_deterministic_and_skips_bundle_dir(
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "repo"
+    _prepare_repo_with_pack(target)
+
+    for archive_name in ("okf.tar.gz", "okf.zip"):
+        res = runner.invoke(
+            app, ["okf", "export", str(target), "--archive", f"dist/{archive_name}"]
+        )
+        assert res.exit_code == 0
+        archive_path = target / "dist" / archive_name
+        first = archive_path.read_bytes()
+        os.utime(target / "docs" / "ai" / "architecture.md", (0, 0))
+        again = runner.invoke(
+            app,
+            [
+                "okf",
+                "export",
+                str(target),
+                "--archive",
+                f"dist/{archive_name}",
+                "--check",
+            ],
+        )
+        assert again.exit_code == 0
+        assert archive_path.read_bytes() == first
+
+    assert not (target / "docs" / "ai" / "okf").exists()
+    with tarfile.open(target / "dist" / "okf.tar.gz") as archive:
+        names = archive.getnames()
+        assert names == sorted(names)
+        assert "repo/architecture.md" in names
+        assert {info.mtime for info in archive.getmembers()} == {315532800}
+    with zipfile.ZipFile(target / "dist" / "okf.zip") as archive:
+        assert archive.namelist() == names
+        text = archive.read("repo/architecture.md").decode("utf-8")
+        assert 'canonical: "docs/ai/architecture.md"' in text
+
+    bad = runner.invoke(app, ["okf", "export", str(target), "--archive", "okf.rar"])
+    assert bad.exit_code == 1
+
+
+def test_okf_export_incremental_only_rerenders_changed_sources(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "repo"
+    _prepare_repo_with_pack(target)
+    args = ["okf", "export", str(target), "--incremental", "--format", "json"]
+
+    first = runner.invoke(app, args)
+    assert first.exit_code == 0
+    assert (target / "docs" / "ai" / "okf.digests.json").is_file()
+
+    source = target / "docs" / "ai" / "how-to-run.md"
+    source.write_text(source.read_text(encoding="utf-8") + "\nExtra.\n")
+    built: list[str] = []
+    read_text = okf_export.read_text
+    monkeypatch.setattr(
+        okf_export,
+        "read_text",
+        lambda path: built.append(Path(path).name) or read_text(path),
+    )
+    monkeypatch.setattr(
+        okf_export, "_entrypoints_body", lambda _target: built.append("entrypoints")
+    )
+    second = runner.invoke(app, args)
+    assert second.exit_code == 0
+    # Unchanged concepts are recognised from their source bytes alone.
+    assert built == ["how-to-run.md"]
+    monkeypatch.undo()
+    rows = {
+        Path(row["path"]).relative_to(target / "docs" / "ai" / "okf").as_posix(): row
+        for row in json.loads(second.stdout)["results"]
+    }
+    assert rows["repo/runbook.md"]["action"] == "updated"
+    assert rows["repo/architecture.md"]["message"] == "source unchanged"
+    assert (
+        "Extra." in (target / "docs" / "ai" / "okf" / "repo" / "runbook.md").read_text()
+    )
+
+    archive_args = [
+        "okf",
+        "export",
+        str(target),
+        "--archive",
+        "okf.zip",
+        "--incremental",
+    ]
+    assert runner.invoke(app, archive_args).exit_code == 0
+    full = (target / "okf.zip").read_bytes()
+    unchanged = runner.invoke(app, archive_args)
+    assert "source unchanged" in unchanged.stdout
+    source.write_text(source.read_text(encoding="utf-8") + "\nMore.\n")
+    assert runner.invoke(app, archive_args).exit_code == 0
+    with zipfile.ZipFile(target / "okf.zip") as archive:
+        assert "More." in archive.read("repo/runbook.md").decode("utf-8")
+    assert (target / "okf.zip").read_bytes() != full
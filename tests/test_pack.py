@@ -4,9 +4,10 @@ import json
 import shutil
 from pathlib import Path
 
-from agentsgen.actions import apply_pack, load_tool_config
+from agentsgen.actions import apply_pack, load_tool_config, render_all
 from agentsgen.config import ToolConfig
 from agentsgen.detect import detect_repo
+from agentsgen.render_memo import render_memo
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -138,3 +139,74 @@ def test_pack_entrypoints_prefers_config_and_uses_generated_sibling(
         r.path.resolve() == generated.resolve() and r.action == "generated"
         for r in results
     )
+
+
+def test_render_memo_reuses_renders_across_project_names(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    _copy_fixture(FIXTURES / "python_uv", target)
+    base = ToolConfig.from_detect(detect_repo(target))
+
+    def named(name: str) -> ToolConfig:
+        cfg = ToolConfig.from_json(base.to_json())
+        cfg.project["name"] = name
+        cfg.project_info.project_name = name
+        return cfg
+
+    expected = {
+        name: (
+            render_all(named(name)),
+            apply_pack(
+                target, named(name), autodetect=True, dry_run=True, print_diff=True
+            ),
+        )
+        for name in ("alpha", "beta")
+    }
+
+    with render_memo() as memo:
+        for name in ("alpha", "beta"):
+            agents_md, runbook_md = render_all(named(name))
+            assert (agents_md, runbook_md) == expected[name][0]
+            assert f"how to not break {name}" in agents_md
+            pack_results = apply_pack(
+                target, named(name), autodetect=True, dry_run=True, print_diff=True
+            )
+            assert [row.diff for row in pack_results if row.path.suffix != ".json"] == [
+                row.diff for row in expected[name][1] if row.path.suffix != ".json"
+            ]
+
+    assert memo.misses > 0
+    assert memo.hits == memo.misses
+
+
+def test_pack_scope_limits_check_to_outputs_changes_can_affect(tmp_path: Path) -> None:
+    from agentsgen.actions import pack_check_config, run_pack_check
+    from agentsgen.pack_scope import affected_pack_outputs, parse_changed_paths
+
+    target = tmp_path / "repo"
+    _copy_fixture(FIXTURES / "python_uv", target)
+    cfg = pack_check_config(target)
+    apply_pack(target, cfg, autodetect=True, dry_run=False, print_diff=False)
+    all_outputs = affected_pack_outputs(cfg, parse_changed_paths(["pyproject.toml"]))
+    assert "docs/ai/how-to-run.md" in all_outputs
+    assert "agents.entrypoints.json" in all_outputs
+
+    assert affected_pack_outputs(cfg, parse_changed_paths(["src/app/main.py"])) == []
+    assert affected_pack_outputs(cfg, parse_changed_paths(["A\tsrc/app/new.py"]))
+    assert affected_pack_outputs(
+        cfg,
+        parse_changed_paths(["src/agentsgen/templates/x.tpl"]),
+        extra_inputs=["./src/agentsgen/templates/"],
+    )
+
+    runbook = target / "docs" / "ai" / "how-to-run.md"
+    runbook.write_text(runbook.read_text(encoding="utf-8").replace("##", "#", 1))
+    only = affected_pack_outputs(
+        cfg, parse_changed_paths(["M\tdocs/ai/how-to-run.md", "src/app/main.py"])
+    )
+    assert only == ["docs/ai/how-to-run.md"]
+    report = run_pack_check(target, cfg=cfg, only=only)
+    assert report["status"] == "drift"
+    assert [Path(row["path"]).name for row in report["raw"]["results"]] == [
+        "how-to-run.md"
+    ]
+    assert run_pack_check(target, cfg=cfg, only=[])["raw"]["results"] == []
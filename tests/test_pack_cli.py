@@ -1,10 +1,12 @@
 from __future__ import annotations
 
+import importlib.util
 import json
 import re
 import shutil
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from agentsgen import actions as actions_module
@@ -12,6 +14,9 @@ from agentsgen.cli import app
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
+GUARD_SCRIPT = (
+    Path(__file__).parents[1] / ".github" / "actions" / "agentsgen-guard" / "guard.py"
+)
 runner = CliRunner()
 
 
@@ -225,3 +230,65 @@ def test_pack_site_check_reports_drift_when_manifest_missing(
     payload = json.loads(res.stdout)
     assert payload["status"] == "drift"
     assert any(str(r.get("path", "")).endswith("llms.txt") for r in payload["results"])
+
+
+def _load_guard():
+    spec = importlib.util.spec_from_file_location("agentsgen_guard", GUARD_SCRIPT)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def test_guard_pack_check_matches_cli_without_autodetect(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    target = tmp_path / "repo"
+    _copy_fixture(FIXTURES / "python_uv", target)
+    assert not (target / ".agentsgen.json").exists()
+
+    res = runner.invoke(app, ["pack", str(target), "--no-autodetect"])
+    assert res.exit_code == 0, res.stdout
+    cfg = actions_module.pack_check_config(target, autodetect=False)
+    assert cfg.project_info.stack == "python"
+    report = actions_module.run_pack_check(target, cfg=cfg, autodetect=False)
+    assert report["status"] == "ok", report["raw"]
+
+    guard = _load_guard()
+    options = {
+        "pack_autodetect": False,
+        "pack_llms_format": "",
+        "pack_output_dir": "",
+        "pack_files": [],
+        "pack_inputs": [],
+    }
+    monkeypatch.setenv("INPUT_CHANGED_FILES", "src/app/main.py")
+    changed = guard._changed_paths(target, {})
+    assert [row.path for row in changed] == ["src/app/main.py"]
+    assert guard._run_pack_check(target, "json", changed=changed, **options) == (
+        0,
+        "",
+        [],
+        0,
+        "skipped (no pack inputs changed)",
+    )
+
+    monkeypatch.setenv("INPUT_CHANGED_FILES", "pyproject.toml\nREADME.md")
+    changed = guard._changed_paths(target, {})
+    code, out, top_paths, drift_count, scope = guard._run_pack_check(
+        target, "json", changed=changed, **options
+    )
+    assert (code, top_paths, drift_count) == (0, [], 0)
+    assert json.loads(out)["status"] == "ok"
+    assert scope.endswith("file(s) affected by changes")
+
+    runbook = target / "docs" / "ai" / "how-to-run.md"
+    runbook.write_text(runbook.read_text(encoding="utf-8").replace("##", "#", 1))
+    monkeypatch.setenv("INPUT_CHANGED_FILES", "docs/ai/how-to-run.md")
+    changed = guard._changed_paths(target, {})
+    code, _out, top_paths, drift_count, scope = guard._run_pack_check(
+        target, "text", changed=changed, **options
+    )
+    assert (code, drift_count) == (1, 1)
+    assert [Path(path).name for path in top_paths] == ["how-to-run.md"]
+    assert scope == "1 file(s) affected by changes"
@@ -1,12 +1,17 @@
 from __future__ import annotations
 
 import json
+import os
+from datetime import date, datetime
 from pathlib import Path
 
 from typer.testing import CliRunner
 
 from agentsgen.cli import app
+from agentsgen.reflect_mentions import SkillMatcher
+from agentsgen.reflect_sessions import parse_day_bound
 from agentsgen.validators import (
+    validate_cli_reflect_all_response_payload,
     validate_cli_reflect_sessions_response_payload,
     validate_cli_reflect_skills_response_payload,
     validate_reflect_skill_usage_payload,
@@ -51,6 +56,13 @@ def _write_session(
     path.write_text("\n".join(json.dumps(row) for row in rows) + "\n", encoding="utf-8")
 
 
+def _skill_rows(target: Path) -> list[dict[str, object]]:
+    usage = json.loads(
+        (target / "docs" / "ai" / "skill-usage.json").read_text(encoding="utf-8")
+    )
+    return usage["skills"]
+
+
 def test_reflect_sessions_writes_artifacts_and_matches_contracts(
     tmp_path: Path,
 ) -> None:
@@ -173,3 +185,403 @@ def test_reflect_skills_writes_artifacts_and_matches_contracts(tmp_path: Path) -
     assert usage_payload["summary"]["sessions_with_skills"] == 2
     assert usage_payload["skills"][0]["skill"] == "session-retrospective"
     assert "Skill Effectiveness Audit" in effectiveness_md.read_text(encoding="utf-8")
+
+
+def test_reflect_sessions_stops_reading_foreign_sessions(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    _write_session(
+        codex_root / "2026/06/14/mine.jsonl",
+        session_id="mine",
+        cwd=target,
+        started_at="2026-06-14T10:00:00Z",
+        events=[("2026-06-14T10:01:00Z", "fix tests")],
+    )
+    mine = codex_root / "2026/06/14/mine.jsonl"
+    with mine.open("a", encoding="utf-8") as handle:
+        handle.write(
+            json.dumps(
+                {
+                    "timestamp": "2026-06-14T10:45:00Z",
+                    "type": "response_item",
+                    "payload": {"type": "message", "content": "done"},
+                }
+            )
+            + "\n"
+        )
+    foreign = codex_root / "2026/06/14/foreign.jsonl"
+    _write_session(
+        foreign,
+        session_id="foreign",
+        cwd=tmp_path / "other",
+        started_at="2026-06-14T09:00:00Z",
+        events=[],
+    )
+    with foreign.open("a", encoding="utf-8") as handle:
+        handle.write("{not json\n")
+
+    result = runner.invoke(
+        app,
+        [
+            "reflect",
+            "sessions",
+            str(target),
+            "--codex-root",
+            str(codex_root),
+            "--dry-run",
+            "--format",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    assert payload["summary"]["session_count"] == 1
+    assert payload["summary"]["long_sessions"] == 1
+
+
+def test_reflect_sessions_index_resumes_appended_sessions(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    index_path = tmp_path / "reflect-index.json"
+    session = codex_root / "2026/06/15/one.jsonl"
+    _write_session(
+        session,
+        session_id="s1",
+        cwd=target,
+        started_at="2026-06-15T10:00:00Z",
+        events=[("2026-06-15T10:01:00Z", "plan the $session-retrospective run")],
+    )
+    _write_session(
+        codex_root / "2026/06/15/other.jsonl",
+        session_id="s2",
+        cwd=tmp_path / "other",
+        started_at="2026-06-15T11:00:00Z",
+        events=[("2026-06-15T11:01:00Z", "ignore this repo")],
+    )
+
+    def run(command: str) -> dict[str, object]:
+        result = runner.invoke(
+            app,
+            [
+                "reflect",
+                command,
+                str(target),
+                "--codex-root",
+                str(codex_root),
+                "--index-path",
+                str(index_path),
+                "--format",
+                "json",
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        return json.loads(result.stdout)
+
+    first = run("sessions")
+    assert first["index"]["files_parsed"] == 2
+    assert index_path.is_file()
+
+    with session.open("a", encoding="utf-8") as handle:
+        handle.write(
+            json.dumps(
+                {
+                    "timestamp": "2026-06-15T10:40:00Z",
+                    "type": "event_msg",
+                    "payload": {
+                        "type": "user_message",
+                        "message": "use skill-effectiveness-audit skill instead",
+                    },
+                }
+            )
+            + "\n"
+        )
+
+    second = run("sessions")
+    validate_cli_reflect_sessions_response_payload(second)
+    assert second["index"] == {
+        "path": str(index_path),
+        "files_parsed": 0,
+        "files_resumed": 1,
+        "files_skipped": 1,
+    }
+    assert second["summary"]["prompt_count"] == 2
+    assert second["summary"]["redirect_count"] == 1
+    assert second["summary"]["long_sessions"] == 1
+
+    skills = run("skills")
+    validate_cli_reflect_skills_response_payload(skills)
+    assert skills["index"]["files_skipped"] == 2
+    assert skills["summary"]["unique_skills"] == 2
+
+
+def test_reflect_all_writes_every_artifact_from_one_pass(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    _write_session(
+        codex_root / "2026/06/16/one.jsonl",
+        session_id="s1",
+        cwd=target,
+        started_at="2026-06-16T10:00:00Z",
+        events=[
+            ("2026-06-16T10:01:00Z", "plan with $session-retrospective"),
+            ("2026-06-16T10:05:00Z", "redo this instead"),
+        ],
+    )
+    _write_session(
+        codex_root / "2026/06/16/two.jsonl",
+        session_id="s2",
+        cwd=target,
+        started_at="2026-06-16T12:00:00Z",
+        events=[("2026-06-16T12:01:00Z", "fix tests")],
+    )
+
+    result = runner.invoke(
+        app,
+        [
+            "reflect",
+            "all",
+            str(target),
+            "--codex-root",
+            str(codex_root),
+            "--format",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    validate_cli_reflect_all_response_payload(payload)
+    assert payload["index"]["files_parsed"] == 2
+    assert payload["summary"]["sessions"]["session_count"] == 2
+    assert payload["summary"]["sessions"]["redirect_count"] == 1
+    assert payload["summary"]["skills"]["unique_skills"] == 1
+    for output in payload["outputs"].values():
+        assert Path(output).is_file()
+
+    sessions = json.loads(
+        (target / "docs" / "ai" / "agent-sessions.json").read_text(encoding="utf-8")
+    )
+    usage = json.loads(
+        (target / "docs" / "ai" / "skill-usage.json").read_text(encoding="utf-8")
+    )
+    validate_reflect_sessions_payload(sessions)
+    validate_reflect_skill_usage_payload(usage)
+    assert [item["session_id"] for item in sessions["sessions"]] == ["s1", "s2"]
+    assert usage["skills"][0]["session_ids"] == ["s1"]
+
+
+def test_reflect_sessions_parallel_merges_multiple_roots_in_order(
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    roots = [tmp_path / "alice", tmp_path / "bob"]
+    for owner, root in enumerate(roots):
+        for day in range(3):
+            _write_session(
+                root / f"2026/06/1{day}/session.jsonl",
+                session_id=f"{root.name}-{day}",
+                cwd=target,
+                started_at=f"2026-06-1{day}T1{owner}:00:00Z",
+                events=[(f"2026-06-1{day}T1{owner}:01:00Z", "fix tests")],
+            )
+
+    def run(*extra: str) -> dict[str, object]:
+        args = ["reflect", "sessions", str(target), "--format", "json"]
+        for root in roots:
+            args.extend(["--codex-root", str(root)])
+        result = runner.invoke(app, [*args, *extra])
+        assert result.exit_code == 0, result.output
+        return json.loads(result.stdout)
+
+    serial = run("--no-index", "--dry-run")
+    parallel = run("--jobs", "2")
+    validate_cli_reflect_sessions_response_payload(parallel)
+    assert parallel["source"]["roots"] == [str(root) for root in roots]
+    assert parallel["summary"] == serial["summary"]
+    assert parallel["index"]["files_parsed"] == 6
+
+    sessions_payload = json.loads(
+        (target / "docs" / "ai" / "agent-sessions.json").read_text(encoding="utf-8")
+    )
+    assert [item["session_id"] for item in sessions_payload["sessions"]] == [
+        "alice-0",
+        "alice-1",
+        "alice-2",
+        "bob-0",
+        "bob-1",
+        "bob-2",
+    ]
+    assert run("--jobs", "2")["index"]["files_skipped"] == 6
+
+
+def test_reflect_sessions_since_until_prunes_partitions_and_flat_files(
+    tmp_path: Path,
+) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    for day in range(10, 15):
+        _write_session(
+            codex_root / f"2026/06/{day}/session.jsonl",
+            session_id=f"day-{day}",
+            cwd=target,
+            started_at=f"2026-06-{day}T10:00:00Z",
+            events=[(f"2026-06-{day}T10:01:00Z", "fix tests")],
+        )
+    _write_session(
+        codex_root / "2025/12/31/session.jsonl",
+        session_id="last-year",
+        cwd=target,
+        started_at="2025-12-31T10:00:00Z",
+        events=[],
+    )
+    flat_root = tmp_path / "flat"
+    for name, stamp in (("recent", "2026-06-12T12:00:00"), ("old", "2026-01-01")):
+        path = flat_root / f"{name}.jsonl"
+        _write_session(
+            path,
+            session_id=f"flat-{name}",
+            cwd=target,
+            started_at="2026-06-12T10:00:00Z",
+            events=[],
+        )
+        mtime = datetime.fromisoformat(stamp).timestamp()
+        os.utime(path, (mtime, mtime))
+
+    result = runner.invoke(
+        app,
+        [
+            "reflect",
+            "sessions",
+            str(target),
+            "--codex-root",
+            str(codex_root),
+            "--codex-root",
+            str(flat_root),
+            "--since",
+            "2026-06-12",
+            "--until",
+            "2026-06-13",
+            "--dry-run",
+            "--format",
+            "json",
+        ],
+    )
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    validate_cli_reflect_sessions_response_payload(payload)
+    assert payload["source"]["since"] == "2026-06-12"
+    assert payload["source"]["until"] == "2026-06-13"
+    assert payload["index"]["files_parsed"] == 3
+    assert payload["summary"]["session_count"] == 3
+
+    bad = runner.invoke(
+        app, ["reflect", "sessions", str(target), "--since", "last week"]
+    )
+    assert bad.exit_code != 0
+
+
+def test_parse_day_bound_accepts_relative_days() -> None:
+    today = date(2026, 6, 15)
+    assert parse_day_bound("7d", today=today) == date(2026, 6, 8)
+    assert parse_day_bound("2026-06-01", today=today) == date(2026, 6, 1)
+
+
+def test_skill_matcher_vocabulary_replaces_card_heuristic() -> None:
+    heuristic = SkillMatcher()
+    assert heuristic.extract("use $session-retrospective then the lint skill") == [
+        "lint",
+        "session-retrospective",
+    ]
+
+    known = SkillMatcher(["session-retrospective", "ns:audit", "pdf"])
+    assert known.extract(
+        "the lint skill; session-retrospective and ns:audit. pdfs, $fmt"
+    ) == ["fmt", "ns:audit", "session-retrospective"]
+    assert known.fingerprint != heuristic.fingerprint
+
+
+def test_reflect_skills_uses_installed_skill_vocabulary(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    skills_dir = tmp_path / "skills"
+    (skills_dir / "session-retrospective").mkdir(parents=True)
+    (skills_dir / "session-retrospective" / "SKILL.md").write_text(
+        "---\nname: session-retrospective\n---\n", encoding="utf-8"
+    )
+    _write_session(
+        codex_root / "2026/06/17/one.jsonl",
+        session_id="s1",
+        cwd=target,
+        started_at="2026-06-17T10:00:00Z",
+        events=[
+            ("2026-06-17T10:01:00Z", "run session-retrospective on this"),
+            ("2026-06-17T10:02:00Z", "the flaky skill is annoying"),
+        ],
+    )
+    args = [
+        "reflect",
+        "skills",
+        str(target),
+        "--codex-root",
+        str(codex_root),
+        "--format",
+        "json",
+    ]
+
+    loose = json.loads(runner.invoke(app, args).stdout)
+    assert [row["skill"] for row in _skill_rows(target)] == ["flaky"]
+    assert loose["index"]["files_parsed"] == 1
+
+    result = runner.invoke(app, [*args, "--skills-dir", str(skills_dir)])
+    assert result.exit_code == 0, result.output
+    payload = json.loads(result.stdout)
+    # A different vocabulary invalidates the stored per-session mentions.
+    assert payload["index"]["files_parsed"] == 1
+    assert [row["skill"] for row in _skill_rows(target)] == ["session-retrospective"]
+
+    # Each vocabulary keeps its own entries, so alternating runs both resume.
+    again = json.loads(runner.invoke(app, args).stdout)
+    assert again["index"]["files_skipped"] == 1
+    assert [row["skill"] for row in _skill_rows(target)] == ["flaky"]
+    known = json.loads(
+        runner.invoke(app, [*args, "--skills-dir", str(skills_dir)]).stdout
+    )
+    assert known["index"]["files_skipped"] == 1
+    assert [row["skill"] for row in _skill_rows(target)] == ["session-retrospective"]
+
+
+def test_reflect_warns_when_index_cannot_be_saved(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    codex_root = tmp_path / "codex"
+    _write_session(
+        codex_root / "2026/06/15/one.jsonl",
+        session_id="s1",
+        cwd=target,
+        started_at="2026-06-15T10:00:00Z",
+        events=[("2026-06-15T10:01:00Z", "plan the $session-retrospective run")],
+    )
+    blocker = tmp_path / "not-a-dir"
+    blocker.write_text("", encoding="utf-8")
+
+    for command in ("sessions", "skills", "all"):
+        result = runner.invoke(
+            app,
+            [
+                "reflect",
+                command,
+                str(target),
+                "--codex-root",
+                str(codex_root),
+                "--index-path",
+                str(blocker / "index.json"),
+            ],
+        )
+        assert result.exit_code == 0, result.output
+        assert "could not save reflect index" in result.output
+    assert (target / "docs" / "ai" / "agent-sessions.json").is_file()
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import gzip
+import threading
+from collections.abc import Iterator
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agentsgen.site_pack import SitemapDigest, build_site_llms_manifest
+
+
+def _urlset(urls: list[str]) -> bytes:
+    entries = "".join(f"<url><loc>{url}</loc></url>" for url in urls)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"{entries}</urlset>"
+    ).encode("utf-8")
+
+
+def _index(urls: list[str]) -> bytes:
+    entries = "".join(f"<sitemap><loc>{url}</loc></sitemap>" for url in urls)
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+        f"{entries}</sitemapindex>"
+    ).encode("utf-8")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    pages: dict[str, bytes] = {}
+
+    def do_GET(self) -> None:  # noqa: N802 - http.server naming
+        body = type(self).pages.get(self.path)
+        self.send_response(200 if body is not None else 404)
+        body = body if body is not None else b"missing"
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: object) -> None:
+        del format, args
+
+
+@pytest.fixture
+def site() -> Iterator[str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    docs = [f"{base}/docs/page-{index:03d}" for index in range(150)]
+    _Handler.pages = {
+        "/": b"<html><head><title>Docs portal</title></head></html>",
+        "/sitemap.xml": _index(
+            [f"{base}/sitemap-docs.xml.gz", f"{base}/nested.xml", f"{base}/gone.xml"]
+        ),
+        "/sitemap-docs.xml.gz": gzip.compress(_urlset(docs)),
+        "/nested.xml": _index([f"{base}/sitemap-blog.xml", f"{base}/sitemap.xml"]),
+        "/sitemap-blog.xml": _urlset(
+            [f"{base}/blog/a", f"{base}/blog/b", f"{base}/docs/page-000"]
+        )[:-20],
+    }
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield base
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_site_manifest_follows_gzip_and_nested_sitemap_indexes(site: str) -> None:
+    manifest = build_site_llms_manifest(f"{site}/")
+
+    assert "# Docs portal" in manifest
+    assert "Total URLs: 152" in manifest
+    assert "- /docs: 150 pages" in manifest
+    assert "- /blog: 2 pages" in manifest
+    assert "- /blog/a" in manifest
+    assert "- /docs/page-009" in manifest
+    assert "- /docs/page-010" not in manifest
+
+
+def test_sitemap_digest_keeps_a_bounded_sorted_sample() -> None:
+    digest = SitemapDigest(sample_size=3)
+    urls = ["https://x/d", "https://x/a", "https://x/c", "https://x/a", "https://x/b"]
+
+    assert list(digest.observe(urls)) == [
+        "https://x/d",
+        "https://x/a",
+        "https://x/c",
+        "https://x/b",
+    ]
+    assert digest.total == 4
+    assert digest.sample == ["https://x/a", "https://x/b", "https://x/c"]
@@ -2,11 +2,14 @@ from __future__ import annotations
 
 import json
 import subprocess
+import sys
 from pathlib import Path
 
+import pytest
 from typer.testing import CliRunner
 
 from agentsgen.cli import app
+from agentsgen.task_index import task_index_lock_path
 
 
 runner = CliRunner()
@@ -215,3 +218,185 @@ def test_task_verdict_parses_blocking_details(tmp_path: Path) -> None:
     assert payload["decision"] == "blocked"
     assert payload["blocking_details"][0]["severity"] == "high"
     assert payload["blocking_details"][0]["message"] == "repomap artifact is missing"
+
+
+def test_task_run_checks_records_timings_logs_and_timeouts(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    python = json.dumps(sys.executable)
+    commands = [
+        {"id": "test", "command": f"{python} -c \"print('ok')\""},
+        {"id": "lint", "command": f'{python} -c "import sys; sys.exit(3)"'},
+        {"id": "build", "command": f'{python} -c "import time; time.sleep(30)"'},
+        {"id": "deploy", "command": "false"},
+    ]
+    (target / "agents.entrypoints.json").write_text(
+        json.dumps({"version": 1, "commands": commands}), encoding="utf-8"
+    )
+    evidence_path = target / "docs" / "ai" / "tasks" / "checks-v0" / "evidence.json"
+    evidence_path.parent.mkdir(parents=True)
+    evidence_path.write_text(
+        json.dumps(
+            {
+                "version": 1,
+                "generated_by": "agentsgen",
+                "task_id": "checks-v0",
+                "checks": [
+                    {
+                        "name": "manual",
+                        "status": "passed",
+                        "required": True,
+                        "kind": "check",
+                    }
+                ],
+                "artifacts": [],
+                "notes": ["kept"],
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    res = runner.invoke(
+        app,
+        [
+            "task",
+            "run-checks",
+            "checks-v0",
+            str(target),
+            "--timeout",
+            "1",
+            "--format",
+            "json",
+        ],
+    )
+    assert res.exit_code == 1
+    payload = json.loads(res.stdout)
+    assert payload["command"] == "task run-checks"
+    written = json.loads(evidence_path.read_text(encoding="utf-8"))
+    rows = {row["name"]: row for row in written["checks"]}
+    assert list(rows) == ["manual", "test", "lint", "build"]
+    assert rows["test"]["status"] == "passed"
+    assert rows["test"]["exit_code"] == 0
+    assert rows["lint"]["status"] == "failed"
+    assert rows["lint"]["exit_code"] == 3
+    assert rows["build"]["timed_out"] is True
+    assert rows["build"]["exit_code"] is None
+    assert rows["build"]["duration_ms"] < 10_000
+    assert all(rows[name]["duration_ms"] >= 0 for name in ("test", "lint", "build"))
+    assert "ok" in (target / rows["test"]["log"]).read_text(encoding="utf-8")
+    assert rows["test"]["log"] in written["artifacts"]
+    assert written["notes"] == ["kept"]
+    assert written["evidence_status"] == "failed"
+
+
+def test_task_index_tracks_commands_and_filters_list(tmp_path: Path) -> None:
+    target = tmp_path / "repo"
+    target.mkdir()
+    for task_id in ("alpha", "beta"):
+        res = runner.invoke(app, ["task", "init", task_id, str(target)])
+        assert res.exit_code == 0
+    res = runner.invoke(
+        app, ["task", "evidence", "alpha", str(target), "--check", "pytest=passed"]
+    )
+    assert res.exit_code == 0
+    res = runner.invoke(
+        app, ["task", "verdict", "alpha", str(target), "--status", "pass"]
+    )
+    assert res.exit_code == 0
+
+    index_path = target / "docs" / "ai" / "tasks" / "index.json"
+    index = json.loads(index_path.read_text(encoding="utf-8"))
+    rows = {row["task_id"]: row for row in index["tasks"]}
+    assert rows["alpha"]["title"] == "Alpha"
+    assert rows["alpha"]["status"] == "pass"
+    assert rows["alpha"]["decision"] == "approved"
+    assert rows["alpha"]["check_summary"]["passed"] == 1
+    assert rows["alpha"]["verdict_at"]
+    assert rows["beta"]["status"] == "open"
+    assert rows["beta"]["evidence_at"] == ""
+
+    res = runner.invoke(
+        app, ["task", "list", str(target), "--status", "pass", "--format", "json"]
+    )
+    assert res.exit_code == 0
+    payload = json.loads(res.stdout)
+    assert payload["command"] == "task list"
+    assert [row["task_id"] for row in payload["result"]["tasks"]] == ["alpha"]
+    assert payload["result"]["summary"] == {
+        "total": 2,
+        "open": 1,
+        "pass": 1,
+        "fail": 0,
+        "needs-review": 0,
+    }
+
+    # Writers never leave a lock file next to the committed index.
+    assert sorted(path.name for path in index_path.parent.iterdir()) == [
+        "alpha",
+        "beta",
+        "index.json",
+    ]
+    assert task_index_lock_path(target).is_file()
+    assert not task_index_lock_path(target).is_relative_to(target)
+    (target / ".git").mkdir()
+    assert task_index_lock_path(target) == (
+        target / ".git" / "agentsgen-task-index.lock"
+    )
+
+    index_path.unlink()
+    res = runner.invoke(app, ["task", "list", str(target), "--status", "open"])
+    assert res.exit_code == 0
+    assert "- beta: open" in res.stdout
+    assert "alpha" not in res.stdout
+    # A plain list answers from a scan and leaves the repo untouched.
+    assert not index_path.exists()
+    res = runner.invoke(app, ["task", "list", str(target), "--rebuild"])
+    assert res.exit_code == 0
+    rebuilt = json.loads(index_path.read_text(encoding="utf-8"))
+    assert {row["task_id"]: row["status"] for row in rebuilt["tasks"]} == {
+        "alpha": "pass",
+        "beta": "open",
+    }
+
+    res = runner.invoke(app, ["task", "list", str(target), "--status", "done"])
+    assert res.exit_code == 1
+
+
+def test_task_run_checks_keeps_logs_and_cwd_inside_the_repo(tmp_path: Path) -> None:
+    from agentsgen.task_checks import check_log_name, load_check_commands
+
+    target = tmp_path / "repo"
+    (target / "sub").mkdir(parents=True)
+    manifest = target / "agents.entrypoints.json"
+
+    def write(commands: list[dict[str, str]]) -> None:
+        manifest.write_text(
+            json.dumps({"version": 1, "commands": commands}), encoding="utf-8"
+        )
+
+    write(
+        [
+            {"id": "test", "command": "true", "cwd": "sub"},
+            {"id": "../../escape", "command": "true"},
+            {"id": "lint", "command": "true", "cwd": "../outside"},
+            {"id": "build", "command": "true", "cwd": str(tmp_path)},
+        ]
+    )
+    assert [check.cwd for check in load_check_commands(target, ["test"])] == ["sub"]
+    for check_id in ("lint", "build"):
+        with pytest.raises(ValueError, match="cwd outside the repo"):
+            load_check_commands(target, [check_id])
+
+    name = check_log_name("../../escape")
+    assert "/" not in name and not name.startswith(".")
+    assert name != check_log_name("escape")
+    assert check_log_name("test") == "test.log"
+
+    res = runner.invoke(
+        app,
+        ["task", "run-checks", "escape-v0", str(target), "--check", "../../escape"],
+    )
+    assert res.exit_code == 0, res.output
+    logs = list((target / "docs" / "ai" / "tasks" / "escape-v0").rglob("*.log"))
+    assert [path.name for path in logs] == [name]
+    assert not list(tmp_path.glob("*.log"))
@@ -8,6 +8,12 @@ from pathlib import Path
 from typer.testing import CliRunner
 
 from agentsgen.cli import app
+from agentsgen.understand_ast import (
+    ImportEdge,
+    repo_files,
+    scan_import_graph,
+    scan_imports,
+)
 
 
 FIXTURES = Path(__file__).parent / "fixtures"
@@ -338,3 +344,41 @@ def test_understand_updates_existing_compact_repomap_without_duplicate_end_marke
     assert compact.count("<!-- AGENTSGEN:START section=repomap_compact -->") == 1
     assert compact.count("<!-- AGENTSGEN:END section=repomap_compact -->") == 1
     assert "Focus: `helper`" in compact
+
+
+def test_scan_import_graph_interns_paths_and_sorts_edges(tmp_path: Path) -> None:
+    (tmp_path / "src" / "b").mkdir(parents=True)
+    (tmp_path / ".hidden").mkdir()
+    (tmp_path / ".hidden" / "zz.js").write_text("export const z = 1\n")
+    (tmp_path / "src" / "z.js").write_text(
+        'import a from "./b/c"\n'
+        'import again from "./b/c"\n'
+        'import q from "../.hidden/zz.js"\n'
+        'const r = require("./a")\n'
+    )
+    (tmp_path / "src" / "b" / "c.ts").write_text('import x from "../z"\n')
+    (tmp_path / "src" / "a.js").write_text('import y from "./b/c"\n')
+
+    files = repo_files(tmp_path, tmp_path / "docs" / "ai")
+    graph = scan_import_graph(files, root=tmp_path, source_roots=[tmp_path])
+
+    assert graph.file_count == 3
+    assert graph.paths.paths[:3] == ["src/a.js", "src/b/c.ts", "src/z.js"]
+    # Imports outside the scanned files are interned after the file rows.
+    assert graph.paths.id_of(".hidden/zz.js") == 3
+    assert graph.edges() == [
+        ImportEdge("src/a.js", "src/b/c.ts"),
+        ImportEdge("src/b/c.ts", "src/z.js"),
+        ImportEdge("src/z.js", ".hidden/zz.js"),
+        ImportEdge("src/z.js", "src/a.js"),
+        ImportEdge("src/z.js", "src/b/c.ts"),
+    ]
+    assert graph.edges()[2].to_path is graph.paths[3]
+    assert graph.knowledge_edges()[0] == {
+        "from": "src/a.js",
+        "to": "src/b/c.ts",
+        "kind": "import",
+    }
+    assert (graph.file_infos(), graph.edges()) == scan_imports(
+        files, root=tmp_path, source_roots=[tmp_path]
+    )